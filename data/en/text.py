@@ -29,6 +29,15 @@ STR_FAST = "Fast"
 STR_SLOW = "Slow"
 STR_WINDOW = "Window"
 STR_FULL = "Full"
+STR_AI_PLANNING_ = "AI thinking :"
+STR_IN_BACKGROUND = "In background"
+STR_EACH_FRAME = "Each frame"
+STR_DANGER_ZONE_ = "Danger zone :"
+STR_HIDDEN = "Hidden"
+STR_SHOWN = "Shown"
+STR_RENDERING_ = "Rendering :"
+STR_WHOLE_SCREEN = "Whole screen"
+STR_CHANGES_ONLY = "Changes only"
 
 # Save game menu
 STR_SAVE_GAME_MENU = "Save Game"
@@ -199,6 +208,10 @@ def f_LEVEL_NUMBER_SIDEBAR(level_id):
     return f"LEVEL {level_id}"
 
 
+def f_AI_PLANNING_SIDEBAR(percentage):
+    return f"AI THINKING... {percentage}%"
+
+
 # Chest menu
 STR_CHEST = "Chest"
 
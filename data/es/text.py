@@ -29,6 +29,15 @@ STR_FAST = "Rápido"
 STR_SLOW = "Lento"
 STR_WINDOW = "Ventana"
 STR_FULL = "Pantalla completa"
+STR_AI_PLANNING_ = "Reflexión de la IA :"
+STR_IN_BACKGROUND = "En segundo plano"
+STR_EACH_FRAME = "En cada fotograma"
+STR_DANGER_ZONE_ = "Zona de peligro :"
+STR_HIDDEN = "Oculta"
+STR_SHOWN = "Visible"
+STR_RENDERING_ = "Renderizado :"
+STR_WHOLE_SCREEN = "Pantalla entera"
+STR_CHANGES_ONLY = "Solo los cambios"
 
 # Save game menu
 STR_SAVE_GAME_MENU = "Guardar juego"
@@ -199,6 +208,10 @@ def f_LEVEL_NUMBER_SIDEBAR(level_id):
     return f"NIVEL {level_id}"
 
 
+def f_AI_PLANNING_SIDEBAR(percentage):
+    return f"LA IA PIENSA... {percentage}%"
+
+
 # Chest menu
 STR_CHEST = "Cofre"
 
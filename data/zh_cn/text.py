@@ -33,6 +33,15 @@ STR_FAST = "快速"
 STR_SLOW = "慢速"
 STR_WINDOW = "窗口化"
 STR_FULL = "全屏"
+STR_AI_PLANNING_ = "AI 思考："  # "AI thinking :"
+STR_IN_BACKGROUND = "后台"  # "In background"
+STR_EACH_FRAME = "每帧"  # "Each frame"
+STR_DANGER_ZONE_ = "危险区域："  # "Danger zone :"
+STR_HIDDEN = "隐藏"  # "Hidden"
+STR_SHOWN = "显示"  # "Shown"
+STR_RENDERING_ = "渲染："  # "Rendering :"
+STR_WHOLE_SCREEN = "整个屏幕"  # "Whole screen"
+STR_CHANGES_ONLY = "仅变化部分"  # "Changes only"
 
 # Save game menu
 STR_SAVE_GAME_MENU = "保存游戏"
@@ -200,6 +209,10 @@ def f_LEVEL_NUMBER_SIDEBAR(level_id):
     return f"第 {level_id} 关"  # f"LEVEL {level_id}"
 
 
+def f_AI_PLANNING_SIDEBAR(percentage):
+    return f"AI 思考中... {percentage}%"  # f"AI THINKING... {percentage}%"
+
+
 # Chest menu
 STR_CHEST = "箱子"  # "Chest"
 
@@ -31,11 +31,23 @@ def main_loop(
     whether quit or restart
     """
     action: QuitActionKind = QuitActionKind.CONTINUE
+    fps_area = pygame.Rect(0, 0, 0, 0)
     while action == QuitActionKind.CONTINUE:
-        screen.fill(BLACK)
-        action = game_controller.process_game_iteration()
-        show_fps(screen, clock, fonts.fonts["FPS_FONT"])
-        pygame.display.update()
+        if int(options_manager.get_option("dirty_rendering")):
+            # Only the areas that changed are drawn and sent to the window
+            action = game_controller.process_game_iteration([fps_area])
+            updated_areas = game_controller.updated_areas
+            new_fps_area = show_fps(screen, clock, "FPS_FONT")
+            if updated_areas is None:
+                pygame.display.update()
+            else:
+                pygame.display.update(updated_areas + [fps_area, new_fps_area])
+            fps_area = new_fps_area
+        else:
+            screen.fill(BLACK)
+            action = game_controller.process_game_iteration()
+            show_fps(screen, clock, "FPS_FONT")
+            pygame.display.update()
         clock.tick(FRAME_RATE)
     return action
 
@@ -50,8 +62,9 @@ if __name__ == "__main__":
                                MAIN_WIN_WIDTH)
     from src.game_entities.character import Character
     from src.game_entities.movable import Movable
-    from src.gui import constant_sprites, fonts
+    from src.gui import constant_sprites, fonts, texture_atlas
     from src.services import load_from_xml_manager as loader
+    from src.services import options_manager
     from src.services.language import *
     from src.services.language import STR_GAME_TITLE
 
@@ -83,6 +96,7 @@ if __name__ == "__main__":
         except AttributeError:
             pass
 
+    texture_atlas.init_texture_atlas()
     Movable.init_constant_sprites()
     constant_sprites.init_constant_sprites()
 
@@ -69,6 +69,8 @@ BUTTON_SIZE = (200, 60)
 
 # Options default values
 ANIMATION_SPEED = 4
+# Milliseconds the AI can spend planning at each frame, half of the time of a frame
+AI_PLANNING_BUDGET = 1000 // FRAME_RATE // 2
 SCREEN_SIZE = 2
 
 # Value for kind of action on close button
@@ -4,7 +4,6 @@ Defines Building class, an entity that can be visited by the player
 
 from __future__ import annotations
 
-import os
 from typing import Optional
 
 import pygame
@@ -16,6 +15,7 @@ from src.game_entities.entity import Entity
 from src.gui.fonts import fonts
 from src.gui.position import Position
 from src.services.language import *
+from src.services.sound_bank import get_sound
 
 
 class Building(Entity):
@@ -57,18 +57,10 @@ class Building(Entity):
         super().__init__(name, position, sprite if sprite else sprite_link)
         self.sprite_link: str = sprite_link
         self.interaction: dict[str, any] = interaction
-        self.door_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "door.ogg")
-        )
-        self.talk_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "talking.ogg")
-        )
-        self.gold_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "trade.ogg")
-        )
-        self.inventory_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "inventory.ogg")
-        )
+        self.door_sfx: pygame.mixer.Sound = get_sound("door.ogg")
+        self.talk_sfx: pygame.mixer.Sound = get_sound("talking.ogg")
+        self.gold_sfx: pygame.mixer.Sound = get_sound("trade.ogg")
+        self.inventory_sfx: pygame.mixer.Sound = get_sound("inventory.ogg")
 
     def interact(self, actor: Character) -> list[list[BoxElement]]:
         """
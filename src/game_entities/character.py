@@ -62,6 +62,8 @@ class Character(Movable):
     join_team -- whether the character can join the team or not
     reach_ -- the range of reach of the entity
     constitution -- the global constitution of the character used to know its capacity to bear items
+    composite_sprites -- the sprites of the character with its equipment drawn on top, by id of the sprite
+    they were composed from as it changes when a player ends its turn, emptied when the equipment changes
     """
 
     races_data: dict[str, dict[str, any]] = {}
@@ -130,6 +132,7 @@ class Character(Movable):
             Character.races_data[race]["constitution"]
             + Character.classes_data[classes[0]]["constitution"]
         )
+        self.composite_sprites: dict[int, pygame.Surface] = {}
 
     def talk(self, actor: Entity) -> list[list[BoxElement]]:
         """
@@ -151,15 +154,29 @@ class Character(Movable):
 
     def display(self, screen: pygame.Surface) -> None:
         """
-        Display the character on the given screen.
-        Also display on top of it its equipment.
+        Display the character on the given screen, with its equipment on top of it.
 
         Keyword arguments:
         screen -- the screen on which the movable entity should be drawn
         """
-        Movable.display(self, screen)
-        for equipment in self.equipments:
-            equipment.display(screen, self.position, True)
+        screen.blit(self.composite_sprite, self.position)
+        self.display_activity_indicator(screen)
+
+    @property
+    def composite_sprite(self) -> pygame.Surface:
+        """
+        Return the sprite of the character with its equipment drawn on top,
+        composed only the first time it is needed after a change of equipment.
+        """
+        if not self.equipments:
+            return self.sprite
+        composite_sprite = self.composite_sprites.get(id(self.sprite))
+        if composite_sprite is None:
+            composite_sprite = self.sprite.copy()
+            for equipment in self.equipments:
+                equipment.display(composite_sprite, (0, 0), True)
+            self.composite_sprites[id(self.sprite)] = composite_sprite
+        return composite_sprite
 
     def lvl_up(self) -> None:
         """
@@ -365,6 +382,7 @@ class Character(Movable):
                     self.set_item(equip)
                     replacement = 1
             self.equipments.append(equipment)
+            self.composite_sprites.clear()
             return replacement
         return -1
 
@@ -388,6 +406,7 @@ class Character(Movable):
         """
         for index, equip in enumerate(self.equipments):
             if equip.identifier == equipment.identifier:
+                self.composite_sprites.clear()
                 return self.equipments.pop(index)
         return None
 
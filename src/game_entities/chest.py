@@ -5,7 +5,6 @@ or items.
 
 from __future__ import annotations
 
-import os
 import random
 from collections.abc import Sequence
 from typing import Optional
@@ -13,10 +12,11 @@ from typing import Optional
 import pygame
 from lxml import etree
 
-from src.constants import TILE_SIZE
 from src.game_entities.entity import Entity
 from src.game_entities.item import Item
 from src.gui.position import Position
+from src.gui.sprite_registry import get_sprite
+from src.services.sound_bank import get_sound
 
 random.seed()
 
@@ -58,15 +58,11 @@ class Chest(Entity):
         super().__init__("Chest", position, sprite if sprite else sprite_close)
         self.sprite_close_link: str = sprite_close
         self.sprite_open_link: str = sprite_open
-        self.sprite_open: pygame.Surface = pygame.transform.scale(
-            pygame.image.load(sprite_open).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-        )
+        self.sprite_open: pygame.Surface = get_sprite(sprite_open)
         self.item: Item = Chest.determine_item(potential_items)
         self.opened: bool = False
         self.pick_lock_initiated: bool = False
-        self.chest_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "chest.ogg")
-        )
+        self.chest_sfx: pygame.mixer.Sound = get_sound("chest.ogg")
 
     @staticmethod
     def determine_item(potential_items: Sequence[tuple[Item, float]]) -> Item:
@@ -4,13 +4,13 @@ Defines Consumable class, an item that can be consumed by an entity and that mig
 
 from __future__ import annotations
 
-import os
 from collections.abc import Sequence
 
 import pygame
 
 from src.game_entities.effect import Effect
 from src.game_entities.item import Item
+from src.services.sound_bank import get_sound
 
 
 class Consumable(Item):
@@ -40,9 +40,7 @@ class Consumable(Item):
     ) -> None:
         super().__init__(name, sprite, description, price)
         self.effects: Sequence[Effect] = effects
-        self.drink_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "potion.ogg")
-        )
+        self.drink_sfx: pygame.mixer.Sound = get_sound("potion.ogg")
 
     def use(self, entity: Movable) -> tuple[bool, Sequence[str]]:  # NOQA
         """
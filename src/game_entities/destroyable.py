@@ -2,7 +2,6 @@
 Defines Destroyable class, an entity that could be destroyed.
 """
 
-import os
 from collections.abc import Sequence
 from enum import Enum
 from typing import Union
@@ -13,6 +12,31 @@ from lxml import etree
 from src.game_entities.entity import Entity
 from src.gui.constant_sprites import constant_sprites
 from src.gui.position import Position
+from src.services.sound_bank import get_sound
+
+# Damage bars already scaled, by name of the damage sprite and width,
+# along with the sprite they have been scaled from
+_damage_bars: dict[tuple[str, int], tuple[pygame.Surface, pygame.Surface]] = {}
+
+
+def damage_bar(sprite_name: str, width: int) -> pygame.Surface:
+    """
+    Return the given damage sprite scaled to the given width,
+    scaling it only the first time the width is requested.
+
+    Keyword arguments:
+    sprite_name -- the name of the damage sprite among the constant sprites
+    width -- the width of the bar in pixels
+    """
+    sprite = constant_sprites[sprite_name]
+    cached = _damage_bars.get((sprite_name, width))
+    if cached is None or cached[0] is not sprite:
+        cached = (
+            sprite,
+            pygame.transform.scale(sprite, (width, sprite.get_height())),
+        )
+        _damage_bars[(sprite_name, width)] = cached
+    return cached[1]
 
 
 class DamageKind(Enum):
@@ -60,9 +84,7 @@ class Destroyable(Entity):
         self.hit_points: int = hit_points
         self.defense: int = defense
         self.resistance: int = resistance
-        self.attack_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "attack.ogg")
-        )
+        self.attack_sfx: pygame.mixer.Sound = get_sound("attack.ogg")
 
     def display_hit_points(self, screen: pygame.Surface) -> None:
         """
@@ -73,26 +95,21 @@ class Destroyable(Entity):
         screen -- the screen on which the bar should be drawn
         """
         if self.hit_points != self.hit_points_max:
-            damage_bar = constant_sprites["lightly_damaged"]
+            sprite_name = "lightly_damaged"
             if self.hit_points < self.hit_points_max * 0.1:
-                damage_bar = constant_sprites["almost_dead"]
+                sprite_name = "almost_dead"
             elif self.hit_points < self.hit_points_max * 0.25:
-                damage_bar = constant_sprites["severely_damaged"]
+                sprite_name = "severely_damaged"
             elif self.hit_points < self.hit_points_max * 0.5:
-                damage_bar = constant_sprites["heavily_damaged"]
+                sprite_name = "heavily_damaged"
             elif self.hit_points < self.hit_points_max * 0.75:
-                damage_bar = constant_sprites["moderately_damaged"]
-            damage_bar = pygame.transform.scale(
-                damage_bar,
-                (
-                    int(
-                        damage_bar.get_width() * (self.hit_points / self.hit_points_max)
-                    ),
-                    damage_bar.get_height(),
-                ),
+                sprite_name = "moderately_damaged"
+            width = int(
+                constant_sprites[sprite_name].get_width()
+                * (self.hit_points / self.hit_points_max)
             )
             screen.blit(constant_sprites["hp_bar"], self.position)
-            screen.blit(damage_bar, self.position)
+            screen.blit(damage_bar(sprite_name, width), self.position)
 
     def attacked(
         self, entity: Entity, damage: int, kind: DamageKind, allies: Sequence[Entity]
@@ -9,6 +9,7 @@ import pygame
 
 from src.constants import TILE_SIZE
 from src.gui.position import Position
+from src.gui.sprite_registry import get_sprite
 from src.services.language import *
 
 
@@ -27,7 +28,7 @@ class Entity:
     name -- the name of the entity
     position -- the current position of the entity on screen
     sprite -- the pygame Surface corresponding to the appearance of the entity on screen, it should
-    match the size of a tile
+    match the size of a tile, shared with the other entities loaded from the same file
     """
 
     def __init__(
@@ -38,9 +39,7 @@ class Entity:
         self.sprite: pygame.Surface = (
             sprite
             if isinstance(sprite, pygame.Surface)
-            else pygame.transform.scale(
-                pygame.image.load(sprite).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-            )
+            else get_sprite(sprite)
         )
 
     def display(self, screen: pygame.Surface) -> None:
@@ -9,8 +9,9 @@ from collections.abc import Sequence
 
 import pygame
 
-from src.constants import LIGHT_GREY, TILE_SIZE
+from src.constants import LIGHT_GREY
 from src.game_entities.item import Item
+from src.gui.sprite_registry import get_sprite
 from src.services.language import TRANSLATIONS
 
 
@@ -67,21 +68,12 @@ class Equipment(Item):
         self.weight: int = weight
         self.restrictions: dict[str, Sequence[str]] = restrictions
         self.body_part: str = body_part
-        raw_equipped_sprite: pygame.Surface = pygame.image.load(
-            equipped_sprites[0]
-        ).convert_alpha()
-        self.equipped_sprite: pygame.Surface = pygame.transform.scale(
-            raw_equipped_sprite, (TILE_SIZE, TILE_SIZE)
-        )
+        self.equipped_sprite: pygame.Surface = get_sprite(equipped_sprites[0])
         if len(equipped_sprites) > 1:
+            # The first layer is shared with other equipments, it is copied before being drawn on
+            self.equipped_sprite = self.equipped_sprite.copy()
             for equipped_sprite in equipped_sprites[1:]:
-                self.equipped_sprite.blit(
-                    pygame.transform.scale(
-                        pygame.image.load(equipped_sprite).convert_alpha(),
-                        (TILE_SIZE, TILE_SIZE),
-                    ),
-                    (0, 0),
-                )
+                self.equipped_sprite.blit(get_sprite(equipped_sprite), (0, 0))
 
         # Used when character wearing the equipment cannot be selected
         self.sprite_unavailable: pygame.Surface = self.equipped_sprite.copy()
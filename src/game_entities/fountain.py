@@ -8,12 +8,12 @@ import pygame
 from lxml import etree
 from pygamepopup.components import BoxElement, TextElement
 
-from src.constants import TILE_SIZE
 from src.game_entities.destroyable import Destroyable
 from src.game_entities.effect import Effect
 from src.game_entities.entity import Entity
 from src.gui.fonts import fonts
 from src.gui.position import Position
+from src.gui.sprite_registry import get_sprite
 
 
 class Fountain(Entity):
@@ -47,9 +47,7 @@ class Fountain(Entity):
         super().__init__(name, position, sprite)
         self.effect: Effect = effect
         self.times: int = times
-        self.sprite_empty: pygame.Surface = pygame.transform.scale(
-            pygame.image.load(sprite_empty).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-        )
+        self.sprite_empty: pygame.Surface = get_sprite(sprite_empty)
 
     def drink(self, entity: Destroyable) -> list[list[BoxElement]]:
         """
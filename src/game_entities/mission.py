@@ -11,12 +11,12 @@ from typing import TYPE_CHECKING, Optional
 
 import pygame
 
-from src.constants import TILE_SIZE
 from src.game_entities.destroyable import Destroyable
 from src.game_entities.item import Item
 from src.game_entities.objective import Objective
 from src.game_entities.player import Player
 from src.gui.position import Position
+from src.services.tiles import manhattan_distance, tile_coordinates
 
 if TYPE_CHECKING:
     from src.scenes.level_scene import LevelEntityCollections
@@ -59,6 +59,7 @@ class Mission:
     min_players -- the minimal number of player characters that should validate the mission
     succeeded_chars -- the player characters which have validated the mission
     targets -- the sequence of destroyable entities that should be eliminated
+    _objective_coordinates -- the coordinates of the tiles of the objectives linked to the mission
     """
 
     def __init__(
@@ -78,6 +79,9 @@ class Mission:
         self.main: bool = is_main
         self.type: MissionType = nature
         self.objective_tiles: Sequence[Objective] = objective_tiles
+        self._objective_coordinates: frozenset[tuple[int, int]] = frozenset(
+            tile_coordinates(objective.position) for objective in objective_tiles
+        )
         self.description: str = description
         self.ended: bool = self.type is MissionType.TURN_LIMIT
         self.turn_limit: int = turn_limit
@@ -96,16 +100,14 @@ class Mission:
         Keyword Arguments:
         position -- the position that should be checked
         """
+        tile = tile_coordinates(position)
         if self.type is MissionType.POSITION:
-            return position in self.objective_tiles
+            return tile in self._objective_coordinates
         if self.type is MissionType.TOUCH_POSITION:
-            for objective in self.objective_tiles:
-                if (
-                    abs(position[0] - objective.position[0])
-                    + abs(position[1] - objective.position[1])
-                    == TILE_SIZE
-                ):
-                    return True
+            return any(
+                manhattan_distance(tile, objective_tile) == 1
+                for objective_tile in self._objective_coordinates
+            )
         return False
 
     def update_state(
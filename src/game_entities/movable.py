@@ -5,10 +5,9 @@ different classes handling the management of entities that can move, only living
 
 from __future__ import annotations
 
-import os
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from enum import Enum, IntEnum, auto
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import pygame
 from lxml import etree
@@ -21,8 +20,13 @@ from src.game_entities.entity import Entity
 from src.game_entities.item import Item
 from src.game_entities.skill import Skill, SkillNature
 from src.gui.position import Position
+from src.gui.sprite_registry import get_sprite
 from src.services import options_manager
 from src.services.language import TRANSLATIONS
+from src.services.sound_bank import get_sound
+
+if TYPE_CHECKING:
+    from src.services.threat_map import ThreatMap
 
 TIMER = 60
 NB_ITEMS_MAX = 8
@@ -52,6 +56,8 @@ class EntityStrategy(Enum):
     SEMI_ACTIVE = auto()
     # Entity always move to get closer to opponents
     ACTIVE = auto()
+    # Entity weighs its possible moves and attacks against the replies of its opponents
+    TACTICAL = auto()
     # Entity is controlled by a human player
     MANUAL = auto()
 
@@ -110,9 +116,7 @@ class Movable(Destroyable):
         This operation should be called after the initialization of a pygame window.
         """
         selected_sprite: str = "imgs/dungeon_crawl/misc/cursor.png"
-        Movable.SELECTED_DISPLAY = pygame.transform.scale(
-            pygame.image.load(selected_sprite).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-        )
+        Movable.SELECTED_DISPLAY = get_sprite(selected_sprite)
 
     def __init__(
         self,
@@ -149,11 +153,9 @@ class Movable(Destroyable):
         self.state: EntityState = EntityState.HAVE_TO_ACT
         self.target: Optional[Entity] = None
         if complementary_sprite_link:
-            complementary_sprite: pygame.Surface = pygame.transform.scale(
-                pygame.image.load(complementary_sprite_link).convert_alpha(),
-                (TILE_SIZE, TILE_SIZE),
-            )
-            self.sprite.blit(complementary_sprite, (0, 0))
+            # The base sprite may be shared with other entities, it is copied before being drawn on
+            self.sprite = self.sprite.copy()
+            self.sprite.blit(get_sprite(complementary_sprite_link), (0, 0))
 
         self._attack_kind: DamageKind = (
             DamageKind[attack_kind] if attack_kind is not None else None
@@ -161,18 +163,10 @@ class Movable(Destroyable):
         self.strategy: EntityStrategy = EntityStrategy[strategy]
         self.skills: Sequence[Skill] = skills
 
-        self.walk_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "walk.ogg")
-        )
-        self.skeleton_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "skeleton_walk.ogg")
-        )
-        self.necrophage_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "necro_walk.ogg")
-        )
-        self.centaur_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "cent_walk.ogg")
-        )
+        self.walk_sfx: pygame.mixer.Sound = get_sound("walk.ogg")
+        self.skeleton_sfx: pygame.mixer.Sound = get_sound("skeleton_walk.ogg")
+        self.necrophage_sfx: pygame.mixer.Sound = get_sound("necro_walk.ogg")
+        self.centaur_sfx: pygame.mixer.Sound = get_sound("cent_walk.ogg")
 
     def display(self, screen: pygame.Surface) -> None:
         """
@@ -183,6 +177,15 @@ class Movable(Destroyable):
         screen -- the screen on which the movable entity should be drawn
         """
         Destroyable.display(self, screen)
+        self.display_activity_indicator(screen)
+
+    def display_activity_indicator(self, screen: pygame.Surface) -> None:
+        """
+        Display an indicator on the entity if it is currently active.
+
+        Keyword arguments:
+        screen -- the screen on which the indicator should be drawn
+        """
         if self.state in range(EntityState.ON_MOVE, EntityState.HAVE_TO_ATTACK + 1):
             screen.blit(Movable.SELECTED_DISPLAY, self.position)
 
@@ -473,7 +476,7 @@ class Movable(Destroyable):
         return True
 
     def act(
-        self, possible_moves: dict[Position, int], targets: dict[Entity, int]
+        self, possible_moves: Mapping[Position, int], targets: dict[Entity, int]
     ) -> Optional[Position]:
         """
         Determine what action should be done by the entity controlled by AI.
@@ -497,7 +500,12 @@ class Movable(Destroyable):
             self.end_turn()
         return None
 
-    def determine_attack(self, targets: Sequence[Entity]) -> Optional[Position]:
+    def determine_attack(
+        self,
+        targets: Sequence[Entity],
+        position: Optional[Position] = None,
+        threat_map: Optional[ThreatMap] = None,
+    ) -> Optional[Position]:
         """
         Determine which entity should be attacked by the entity controlled by AI.
 
@@ -505,13 +513,27 @@ class Movable(Destroyable):
 
         Keyword arguments:
         targets -- the sequence of entities that could be attacked
+        position -- the position from which the attack would be made, the current one of the entity if None
+        threat_map -- the opponents that could be hit from each tile, built from the given targets,
+        the distances are computed for each target if None
         """
+        if position is None:
+            position = self.position
         temporary_attack: Optional[Position] = None
+        if threat_map is not None:
+            threats = threat_map.threats_at(position)
+            for distance in self.reach:
+                for target, target_distance in threats:
+                    if target_distance == distance and target in targets:
+                        if self.target and target == self.target:
+                            return target.position
+                        temporary_attack = target.position
+            return temporary_attack
         for distance in self.reach:
             for target in targets:
                 if (
-                    abs(self.position[0] - target.position[0])
-                    + abs(self.position[1] - target.position[1])
+                    abs(position[0] - target.position[0])
+                    + abs(position[1] - target.position[1])
                     == TILE_SIZE * distance
                 ):
                     if self.target and target == self.target:
@@ -520,7 +542,11 @@ class Movable(Destroyable):
         return temporary_attack
 
     def determine_move(
-        self, possible_moves: dict[Position, int], targets: dict[Entity, int]
+        self,
+        possible_moves: Mapping[Position, int],
+        targets: dict[Entity, int],
+        threat_map: Optional[ThreatMap] = None,
+        follows_path: bool = False,
     ) -> Position:
         """
         Determine which movement should be selected by the entity controlled by AI.
@@ -532,9 +558,27 @@ class Movable(Destroyable):
         possible_moves -- the collection of tiles that could be reached by the entity
         with their associated distance from the entity
         targets -- the collection of entities that could be attacked with their associated distance from the entity
+        threat_map -- the opponents that could be hit from each tile, built from the given targets,
+        the distances are computed for each target if None
+        follows_path -- whether the possible moves are the steps of the shortest path
+        to the nearest target, used by the active strategy
         """
         self.target: Optional[Position] = None
-        if self.strategy is EntityStrategy.SEMI_ACTIVE:
+        if self.strategy is EntityStrategy.SEMI_ACTIVE and threat_map is not None:
+            # Same choice as below: the first target, then the first reach, then the first move
+            target_order = {target: index for index, target in enumerate(targets)}
+            reach_order = {distance: index for index, distance in enumerate(self.reach)}
+            best_choice: Optional[tuple[tuple[int, int, int], Entity, Position]] = None
+            for move_order, move in enumerate(possible_moves):
+                for target, distance in threat_map.threats_at(move):
+                    if target in target_order and distance in reach_order:
+                        order = (target_order[target], reach_order[distance], move_order)
+                        if best_choice is None or order < best_choice[0]:
+                            best_choice = (order, target, move)
+            if best_choice is not None:
+                self.target = best_choice[1]
+                return best_choice[2]
+        elif self.strategy is EntityStrategy.SEMI_ACTIVE:
             for target, dist in targets.items():
                 for distance in self.reach:
                     for move in possible_moves:
@@ -549,6 +593,18 @@ class Movable(Destroyable):
         elif self.strategy is EntityStrategy.ACTIVE:
             # Targets the nearest opponent
             self.target = min(targets.keys(), key=(lambda k: targets[k]))
+            if follows_path:
+                # Go as far as possible along the path, stopping at the first step
+                # from which the target can be attacked
+                best_move = self.position
+                for move in sorted(possible_moves, key=possible_moves.get):
+                    best_move = move
+                    if (
+                        abs(move[0] - self.target.position[0])
+                        + abs(move[1] - self.target.position[1])
+                    ) in (TILE_SIZE * distance for distance in self.reach):
+                        break
+                return best_move
             best_move = self.position
             min_dist = INITIAL_MAX
             for distance in self.reach:
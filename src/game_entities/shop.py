@@ -4,7 +4,6 @@ Defines Shop class, a Building in which a player character can buy or sell stuff
 
 from __future__ import annotations
 
-import os
 from copy import copy
 from typing import Optional
 
@@ -19,6 +18,7 @@ from src.gui.fonts import fonts
 from src.gui.position import Position
 from src.services import menu_creator_manager
 from src.services.language import *
+from src.services.sound_bank import get_sound
 
 
 class Shop(Building):
@@ -64,9 +64,7 @@ class Shop(Building):
         self.menu: InfoBox = menu_creator_manager.create_shop_menu(
             Shop.interaction_callback, self.stock, 0, self.shop_balance
         )
-        self.gold_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "trade.ogg")
-        )
+        self.gold_sfx: pygame.mixer.Sound = get_sound("trade.ogg")
 
     def get_item_entry(self, item: Item) -> Optional[dict[str, any]]:
         """
@@ -9,6 +9,8 @@ import pygame
 from src.constants import (BLACK, MAX_MAP_HEIGHT, MAX_MAP_WIDTH, TILE_SIZE,
                            WHITE)
 from src.gui.fonts import fonts
+from src.gui.sprite_registry import get_sprite
+from src.gui.texture_atlas import load_image
 from src.services.language import *
 
 LANDING_OPACITY = 80
@@ -17,6 +19,8 @@ LANDING_SPRITE = "imgs/dungeon_crawl/misc/move.png"
 ATTACKABLE_OPACITY = 80
 ATTACKABLE_SPRITE = "imgs/dungeon_crawl/misc/attackable.png"
 
+DANGER_ZONE_OPACITY = 40
+
 INTERACTION_OPACITY = 500
 INTERACTION_SPRITE = "imgs/dungeon_crawl/misc/landing.png"
 
@@ -44,16 +48,10 @@ def init_constant_sprites() -> None:
     Initialize all sprites by loading them into a pygame Surface.
     These sprites will be available in all modules by importing the constant_sprites dictionary.
     """
-    constant_sprites["landing"] = pygame.transform.scale(
-        pygame.image.load(LANDING_SPRITE).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-    )
-    constant_sprites["attackable"] = pygame.transform.scale(
-        pygame.image.load(ATTACKABLE_SPRITE).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-    )
-    constant_sprites["interaction"] = pygame.transform.scale(
-        pygame.image.load(INTERACTION_SPRITE).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-    )
-    new_turn = pygame.image.load(NEW_TURN_SPRITE).convert_alpha()
+    constant_sprites["landing"] = get_sprite(LANDING_SPRITE)
+    constant_sprites["attackable"] = get_sprite(ATTACKABLE_SPRITE)
+    constant_sprites["interaction"] = get_sprite(INTERACTION_SPRITE)
+    new_turn = load_image(NEW_TURN_SPRITE)
     new_turn = pygame.transform.scale(
         new_turn.convert_alpha(),
         (int(new_turn.get_width() * 1.5), int(new_turn.get_height() * 1.5)),
@@ -91,13 +89,10 @@ def init_constant_sprites() -> None:
     )
     constant_sprites["defeat"].blit(defeat_text, defeat_text_pos)
 
-    constant_sprites["cracked"] = pygame.transform.scale(
-        pygame.image.load(CRACKED_SPRITE).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-    )
+    constant_sprites["cracked"] = get_sprite(CRACKED_SPRITE)
 
-    constant_sprites["frame"] = pygame.transform.scale(
-        pygame.image.load(FRAME_SPRITE).convert_alpha(),
-        (TILE_SIZE + 10, TILE_SIZE + 10),
+    constant_sprites["frame"] = get_sprite(
+        FRAME_SPRITE, (TILE_SIZE + 10, TILE_SIZE + 10)
     )
     constant_sprites["main_mission_text"] = fonts["SIDEBAR_TITLE_FONT"].render(
         STR_MAIN_MISSION, 1, BLACK
@@ -106,26 +101,10 @@ def init_constant_sprites() -> None:
         STR_OPTIONAL_OBJECTIVES, 1, BLACK
     )
 
-    constant_sprites["lightly_damaged"] = pygame.transform.scale(
-        pygame.image.load(LIGHTLY_DAMAGED_SPRITE).convert_alpha(),
-        (TILE_SIZE, TILE_SIZE),
-    )
-    constant_sprites["moderately_damaged"] = pygame.transform.scale(
-        pygame.image.load(MODERATELY_DAMAGED_SPRITE).convert_alpha(),
-        (TILE_SIZE, TILE_SIZE),
-    )
-    constant_sprites["heavily_damaged"] = pygame.transform.scale(
-        pygame.image.load(HEAVILY_DAMAGED_SPRITE).convert_alpha(),
-        (TILE_SIZE, TILE_SIZE),
-    )
-    constant_sprites["severely_damaged"] = pygame.transform.scale(
-        pygame.image.load(SEVERELY_DAMAGED_SPRITE).convert_alpha(),
-        (TILE_SIZE, TILE_SIZE),
-    )
-    constant_sprites["almost_dead"] = pygame.transform.scale(
-        pygame.image.load(ALMOST_DEAD_SPRITE).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-    )
+    constant_sprites["lightly_damaged"] = get_sprite(LIGHTLY_DAMAGED_SPRITE)
+    constant_sprites["moderately_damaged"] = get_sprite(MODERATELY_DAMAGED_SPRITE)
+    constant_sprites["heavily_damaged"] = get_sprite(HEAVILY_DAMAGED_SPRITE)
+    constant_sprites["severely_damaged"] = get_sprite(SEVERELY_DAMAGED_SPRITE)
+    constant_sprites["almost_dead"] = get_sprite(ALMOST_DEAD_SPRITE)
 
-    constant_sprites["hp_bar"] = pygame.transform.scale(
-        pygame.image.load(HP_BAR_SPRITE).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-    )
+    constant_sprites["hp_bar"] = get_sprite(HP_BAR_SPRITE)
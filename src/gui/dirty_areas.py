@@ -0,0 +1,96 @@
+"""
+Defines DirtyAreas class, telling which areas of a screen changed from one frame to the next.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+from typing import Optional
+
+import pygame
+
+# Share of the screen above which drawing everything again is cheaper than drawing the changes
+MAX_DIRTY_SHARE = 0.5
+
+
+class DirtyAreas:
+    """
+    DirtyAreas compares what is drawn on a screen at each frame with what was drawn at the previous one.
+
+    Each frame is described as a collection of parts, each one identified by a key,
+    covering an area of the screen and being in a given state.
+    A part that appeared, disappeared, moved or whose state changed makes dirty the areas
+    it covers at both frames.
+
+    Keyword arguments:
+    screen_size -- the size of the screen on which the parts are drawn
+
+    Attributes:
+    screen_size -- the size of the screen on which the parts are drawn
+    _drawn -- the parts drawn at the previous frame by key, with their area and their state,
+    None if they are not known
+    """
+
+    def __init__(self, screen_size: tuple[int, int]) -> None:
+        self.screen_size: tuple[int, int] = screen_size
+        self._drawn: Optional[dict[Hashable, tuple[pygame.Rect, Hashable]]] = None
+
+    def changes(
+        self, drawn: Mapping[Hashable, tuple[pygame.Rect, Hashable]]
+    ) -> Optional[list[pygame.Rect]]:
+        """
+        Remember the parts drawn at the new frame and return the areas that changed since the previous one,
+        overlapping areas being merged.
+
+        Return None if the whole screen should be drawn again: the previous frame is not known
+        or the changes cover too much of the screen.
+
+        Keyword arguments:
+        drawn -- the parts drawn at the new frame by key, with their area and their state
+        """
+        previous, self._drawn = self._drawn, dict(drawn)
+        if previous is None:
+            return None
+        areas: list[pygame.Rect] = []
+        for key, (area, state) in self._drawn.items():
+            previous_part = previous.get(key)
+            if previous_part is None:
+                areas.append(area)
+            elif previous_part[0] != area or previous_part[1] != state:
+                areas.extend((previous_part[0], area))
+        for key, (area, _) in previous.items():
+            if key not in self._drawn:
+                areas.append(area)
+        areas = merge_areas(areas)
+        if sum(area.w * area.h for area in areas) > (
+            MAX_DIRTY_SHARE * self.screen_size[0] * self.screen_size[1]
+        ):
+            return None
+        return areas
+
+    def forget(self) -> None:
+        """
+        Forget the parts drawn at the previous frame, after the screen has been drawn by other means.
+        """
+        self._drawn = None
+
+
+def merge_areas(areas: list[pygame.Rect]) -> list[pygame.Rect]:
+    """
+    Return the given areas with the overlapping ones replaced by the smallest area containing them.
+    Empty areas are left out.
+
+    Keyword arguments:
+    areas -- the areas to merge
+    """
+    merged: list[pygame.Rect] = []
+    for area in areas:
+        if area.w <= 0 or area.h <= 0:
+            continue
+        area = area.copy()
+        overlapping = area.collidelist(merged)
+        while overlapping != -1:
+            area.union_ip(merged.pop(overlapping))
+            overlapping = area.collidelist(merged)
+        merged.append(area)
+    return merged
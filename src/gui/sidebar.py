@@ -2,7 +2,8 @@
 Defines Sidebar class, an element of the GUI that will be display permanently
 at the bottom of the screen.
 """
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Sequence
+from typing import Optional
 
 import pygame
 
@@ -18,6 +19,8 @@ from src.game_entities.player import Player
 from src.gui.constant_sprites import constant_sprites
 from src.gui.fonts import fonts
 from src.gui.position import Position
+from src.gui.sprite_registry import get_sprite
+from src.gui.text_cache import render_text
 from src.gui.tools import determine_gauge_color
 from src.services.language import *
 
@@ -45,6 +48,9 @@ class Sidebar:
     sprite -- the pygame Surface representing the background of the sidebar
     missions -- the list of missions that should be accomplished by the players
     level_id -- id of the current level
+    sections -- the rendered elements of each section of the sidebar with their position on the screen,
+    along with everything their content depends on
+    rendering -- the whole sidebar as displayed last time, None if not displayed yet
     """
 
     def __init__(
@@ -56,214 +62,365 @@ class Sidebar:
     ) -> None:
         self.size: tuple[int, int] = size
         self.position: Position = position
-        self.sprite: pygame.Surface = pygame.transform.scale(
-            pygame.image.load(SIDEBAR_SPRITE).convert_alpha(), size
-        )
+        self.sprite: pygame.Surface = get_sprite(SIDEBAR_SPRITE, size)
         self.missions: Sequence[Mission] = missions
         self.level_id: int = level_id
+        self.sections: dict[
+            str, tuple[Hashable, list[tuple[pygame.Surface, Position]]]
+        ] = {}
+        self.rendering: Optional[pygame.Surface] = None
 
     def display(
-        self, screen: pygame.Surface, number_turns: int, hovered_entity: Entity
+        self,
+        screen: pygame.Surface,
+        number_turns: int,
+        hovered_entity: Entity,
+        planning_progress: Optional[float] = None,
     ) -> None:
         """
         Display the sidebar and all the expected information on the screen provided.
+        Only the sections whose content changed since the last display are rendered again.
 
         Keyword arguments:
         screen -- the screen on which the elements should be displayed
         number_turns -- the current turn of the ongoing level
         hovered_entity -- the currently hovered entity if there is any
+        planning_progress -- the share of the AI turn already planned if it is being planned
+        """
+        planning_percentage: Optional[int] = (
+            int(planning_progress * 100) if planning_progress is not None else None
+        )
+        changed = self._update_section(
+            "turn",
+            (number_turns, planning_percentage),
+            lambda: self._render_turn(number_turns, planning_percentage),
+        )
+        changed |= self._update_section(
+            "missions",
+            tuple((mission.description, mission.ended) for mission in self.missions),
+            self._render_missions,
+        )
+        changed |= self._update_section(
+            "hovered_entity",
+            self._hovered_entity_key(hovered_entity),
+            lambda: self._render_hovered_entity(hovered_entity),
+        )
+
+        if changed or self.rendering is None:
+            # Drawn over black, like the bottom of the level screen
+            self.rendering = pygame.Surface(self.size).convert()
+            self.rendering.blit(self.sprite, (0, 0))
+            for _, blits in self.sections.values():
+                for surface, position in blits:
+                    self.rendering.blit(
+                        surface,
+                        (
+                            position[0] - self.position[0],
+                            position[1] - self.position[1],
+                        ),
+                    )
+        screen.blit(self.rendering, self.position)
+
+    def _update_section(
+        self,
+        name: str,
+        key: Hashable,
+        render: Callable[[], list[tuple[pygame.Surface, Position]]],
+    ) -> bool:
         """
-        # Sidebar background
-        screen.blit(self.sprite, self.position)
+        Render the given section again if what it depends on changed since it was last rendered.
 
+        Return whether the section has been rendered again.
+
+        Keyword arguments:
+        name -- the name of the section
+        key -- everything the content of the section depends on
+        render -- the function rendering the section
+        """
+        section = self.sections.get(name)
+        if section is not None and section[0] == key:
+            return False
+        self.sections[name] = (key, render())
+        return True
+
+    @staticmethod
+    def _hovered_entity_key(hovered_entity: Optional[Entity]) -> Hashable:
+        """
+        Return everything about the given hovered entity that is shown by the sidebar.
+
+        Keyword arguments:
+        hovered_entity -- the currently hovered entity if there is any
+        """
+        if not hovered_entity:
+            return None
+        key: tuple = (
+            id(hovered_entity),
+            str(hovered_entity),
+            id(hovered_entity.sprite),
+        )
+        if isinstance(hovered_entity, Destroyable):
+            key += (hovered_entity.hit_points, hovered_entity.hit_points_max)
+        if isinstance(hovered_entity, Movable):
+            key += (
+                hovered_entity.lvl,
+                hovered_entity.get_abbreviated_alterations(),
+            )
+        if isinstance(hovered_entity, Character):
+            key += (
+                tuple(id(equip.equipped_sprite) for equip in hovered_entity.equipments),
+                hovered_entity.get_formatted_race(),
+            )
+        if isinstance(hovered_entity, Player):
+            key += (hovered_entity.get_formatted_classes(),)
+        return key
+
+    def _render_turn(
+        self, number_turns: int, planning_percentage: Optional[int]
+    ) -> list[tuple[pygame.Surface, Position]]:
+        """
+        Return the rendered turn and level indications along with their position on the screen.
+
+        Keyword arguments:
+        number_turns -- the current turn of the ongoing level
+        planning_percentage -- the percentage of the AI turn already planned if it is being planned
+        """
+        blits: list[tuple[pygame.Surface, Position]] = []
         # Turn indication
-        turn_text: pygame.Surface = fonts["MENU_TITLE_FONT"].render(
-            f_TURN_NUMBER_SIDEBAR(number_turns), True, BLACK
+        turn_text: pygame.Surface = render_text(
+            "MENU_TITLE_FONT", f_TURN_NUMBER_SIDEBAR(number_turns), True, BLACK
         )
-        screen.blit(turn_text, (self.position[0] + 50, self.position[1] + 15))
+        blits.append((turn_text, (self.position[0] + 50, self.position[1] + 15)))
 
         # Level indication
-        turn_text: pygame.Surface = fonts["MENU_TITLE_FONT"].render(
-            f_LEVEL_NUMBER_SIDEBAR(self.level_id), True, BLACK
+        turn_text: pygame.Surface = render_text(
+            "MENU_TITLE_FONT", f_LEVEL_NUMBER_SIDEBAR(self.level_id), True, BLACK
         )
-        screen.blit(turn_text, (self.position[0] + 50, self.position[1] + 50))
+        blits.append((turn_text, (self.position[0] + 50, self.position[1] + 50)))
 
+        # AI planning indication
+        if planning_percentage is not None:
+            planning_text: pygame.Surface = render_text(
+                "ITEM_FONT_STRONG",
+                f_AI_PLANNING_SIDEBAR(planning_percentage),
+                True,
+                BLACK,
+            )
+            blits.append(
+                (planning_text, (self.position[0] + 50, self.position[1] + 78))
+            )
+        return blits
+
+    def _render_missions(self) -> list[tuple[pygame.Surface, Position]]:
+        """
+        Return the rendered missions along with their position on the screen.
+        """
+        blits: list[tuple[pygame.Surface, Position]] = []
         # Main mission header
-        screen.blit(
-            constant_sprites["main_mission_text"],
-            (self.position[0] + self.size[0] - 500, self.position[1] + 10),
+        blits.append(
+            (
+                constant_sprites["main_mission_text"],
+                (self.position[0] + self.size[0] - 500, self.position[1] + 10),
+            )
         )
         # Secondaries missions header if any
         if len(self.missions) > 1:
-            screen.blit(
-                constant_sprites["secondaries_mission_text"],
-                (self.position[0] + self.size[0] - 300, self.position[1] + 10),
+            blits.append(
+                (
+                    constant_sprites["secondaries_mission_text"],
+                    (self.position[0] + self.size[0] - 300, self.position[1] + 10),
+                )
             )
         # Missions
         vertical_shift: int = 0
         for mission in self.missions:
             mission_color = DARK_GREEN if mission.ended else BROWN_RED
-            mission_description = fonts["MISSION_FONT"].render(
-                f"> {mission.description}", True, mission_color
+            mission_description = render_text(
+                "MISSION_FONT", f"> {mission.description}", True, mission_color
             )
             if mission.main:
-                screen.blit(
-                    mission_description,
+                blits.append(
                     (
-                        self.position[0] + self.size[0] - 480,
-                        self.position[1]
-                        + 10
-                        + constant_sprites["main_mission_text"].get_height(),
-                    ),
+                        mission_description,
+                        (
+                            self.position[0] + self.size[0] - 480,
+                            self.position[1]
+                            + 10
+                            + constant_sprites["main_mission_text"].get_height(),
+                        ),
+                    )
                 )
             else:
-                screen.blit(
-                    mission_description,
+                blits.append(
                     (
-                        self.position[0] + self.size[0] - 280,
-                        self.position[1]
-                        + 10
-                        + constant_sprites["secondaries_mission_text"].get_height()
-                        + vertical_shift * mission_description.get_height(),
-                    ),
+                        mission_description,
+                        (
+                            self.position[0] + self.size[0] - 280,
+                            self.position[1]
+                            + 10
+                            + constant_sprites["secondaries_mission_text"].get_height()
+                            + vertical_shift * mission_description.get_height(),
+                        ),
+                    )
                 )
                 vertical_shift += 1
+        return blits
 
-        # Display the current information about the entity hovered
-        if hovered_entity:
-            # Set up color depending on entity's nature
-            if isinstance(hovered_entity, Foe):
-                nature: str = STR_FOE
-                color: pygame.Color = RED
-            elif isinstance(hovered_entity, Player):
-                nature = STR_PLAYER
-                color = MIDNIGHT_BLUE
-            elif isinstance(hovered_entity, Character):
-                nature = STR_ALLY
-                color = DARK_GREEN
-            else:
-                nature = STR_UNLIVING_ENTITY
-                color = BLACK
+    def _render_hovered_entity(
+        self, hovered_entity: Optional[Entity]
+    ) -> list[tuple[pygame.Surface, Position]]:
+        """
+        Return the rendered information about the hovered entity along with their position on the screen.
 
-            # Display the entity nature
-            nature_display: pygame.Surface = fonts["MISSION_FONT"].render(
-                nature, True, color
-            )
-            nature_position: Position = (
-                self.position[0]
-                + self.size[0] / 4
-                + constant_sprites["frame"].get_width() / 2
-                - nature_display.get_width() / 2,
-                self.position[1] + 5,
-            )
-            screen.blit(nature_display, nature_position)
-            # Display the entity sprite in a frame
-            frame_position: Position = (
-                self.position[0] + self.size[0] // 4,
-                self.position[1] + 5 + nature_display.get_height(),
+        Keyword arguments:
+        hovered_entity -- the currently hovered entity if there is any
+        """
+        blits: list[tuple[pygame.Surface, Position]] = []
+        if not hovered_entity:
+            return blits
+
+        # Set up color depending on entity's nature
+        if isinstance(hovered_entity, Foe):
+            nature: str = STR_FOE
+            color: pygame.Color = RED
+        elif isinstance(hovered_entity, Player):
+            nature = STR_PLAYER
+            color = MIDNIGHT_BLUE
+        elif isinstance(hovered_entity, Character):
+            nature = STR_ALLY
+            color = DARK_GREEN
+        else:
+            nature = STR_UNLIVING_ENTITY
+            color = BLACK
+
+        # Display the entity nature
+        nature_display: pygame.Surface = render_text(
+            "MISSION_FONT", nature, True, color
+        )
+        nature_position: Position = (
+            self.position[0]
+            + self.size[0] / 4
+            + constant_sprites["frame"].get_width() / 2
+            - nature_display.get_width() / 2,
+            self.position[1] + 5,
+        )
+        blits.append((nature_display, nature_position))
+        # Display the entity sprite in a frame
+        frame_position: Position = (
+            self.position[0] + self.size[0] // 4,
+            self.position[1] + 5 + nature_display.get_height(),
+        )
+        blits.append((constant_sprites["frame"], frame_position))
+        entity_position: Position = (frame_position[0] + 5, frame_position[1] + 5)
+        # If it is a character, its sprite is displayed with its equipment
+        if isinstance(hovered_entity, Character):
+            blits.append((hovered_entity.composite_sprite, entity_position))
+        else:
+            blits.append((hovered_entity.sprite, entity_position))
+        # If it is a breakable
+        if isinstance(hovered_entity, Breakable):
+            blits.append((constant_sprites["cracked"], entity_position))
+
+        # Display basic information about the entity
+        # Name
+        text_position_x: int = (
+            frame_position[0] + constant_sprites["frame"].get_width() + 15
+        )
+        name_pre_text: pygame.Surface = render_text(
+            "ITEM_FONT_STRONG", STR_NAME_SIDEBAR_, True, color
+        )
+        blits.append((name_pre_text, (text_position_x, frame_position[1])))
+        name_text: pygame.Surface = render_text(
+            "ITEM_FONT_STRONG", f"         {hovered_entity}", True, BLACK
+        )
+        blits.append((name_text, (text_position_x, frame_position[1])))
+
+        # HP if it's a destroyable entity
+        if isinstance(hovered_entity, Destroyable):
+            hit_points: int = hovered_entity.hit_points
+            hit_points_max: int = hovered_entity.hit_points_max
+            hit_points_pre_text: pygame.Surface = render_text(
+                "ITEM_FONT_STRONG", STR_HP_, True, color
             )
-            screen.blit(constant_sprites["frame"], frame_position)
-            entity_position: Position = (frame_position[0] + 5, frame_position[1] + 5)
-            screen.blit(hovered_entity.sprite, entity_position)
-            # If it is a character
-            if isinstance(hovered_entity, Character):
-                for equip in hovered_entity.equipments:
-                    screen.blit(equip.equipped_sprite, entity_position)
-            # If it is a breakable
-            elif isinstance(hovered_entity, Breakable):
-                screen.blit(constant_sprites["cracked"], entity_position)
-
-            # Display basic information about the entity
-            # Name
-            text_position_x: int = (
-                frame_position[0] + constant_sprites["frame"].get_width() + 15
+            text_position: Position = (
+                text_position_x,
+                frame_position[1]
+                + constant_sprites["frame"].get_height()
+                - hit_points_pre_text.get_height(),
             )
-            name_pre_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
-                STR_NAME_SIDEBAR_, True, color
+            blits.append((hit_points_pre_text, text_position))
+            hit_points_text: pygame.Surface = render_text(
+                "ITEM_FONT_STRONG",
+                f"      {hit_points}",
+                True,
+                determine_gauge_color(hit_points, hit_points_max, BLACK),
             )
-            screen.blit(name_pre_text, (text_position_x, frame_position[1]))
-            name_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
-                f"         {hovered_entity}", True, BLACK
+            blits.append((hit_points_text, text_position))
+            hp_post_text = render_text(
+                "ITEM_FONT_STRONG",
+                f'      {" " * len(str(hit_points))} / {hit_points_max}',
+                True,
+                BLACK,
             )
-            screen.blit(name_text, (text_position_x, frame_position[1]))
-
-            # HP if it's a destroyable entity
-            if isinstance(hovered_entity, Destroyable):
-                hit_points: int = hovered_entity.hit_points
-                hit_points_max: int = hovered_entity.hit_points_max
-                hit_points_pre_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
-                    STR_HP_, True, color
-                )
-                text_position: Position = (
-                    text_position_x,
-                    frame_position[1]
-                    + constant_sprites["frame"].get_height()
-                    - hit_points_pre_text.get_height(),
-                )
-                screen.blit(hit_points_pre_text, text_position)
-                hit_points_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
-                    f"      {hit_points}",
-                    True,
-                    determine_gauge_color(hit_points, hit_points_max, BLACK),
+            blits.append((hp_post_text, text_position))
+
+            # Display more information if it is a movable entity
+            if isinstance(hovered_entity, Movable):
+                # Level
+                level_text: pygame.Surface = render_text(
+                    "ITEM_FONT_STRONG", f"LVL : {hovered_entity.lvl}", True, BLACK
                 )
-                screen.blit(hit_points_text, text_position)
-                hp_post_text = fonts["ITEM_FONT_STRONG"].render(
-                    f'      {" " * len(str(hit_points))} / {hit_points_max}',
-                    True,
-                    BLACK,
+                lvl_text_position_x: int = (
+                    frame_position[0]
+                    + constant_sprites["frame"].get_width() / 2
+                    - level_text.get_width() / 2
                 )
-                screen.blit(hp_post_text, text_position)
-
-                # Display more information if it is a movable entity
-                if isinstance(hovered_entity, Movable):
-                    # Level
-                    level_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
-                        f"LVL : {hovered_entity.lvl}", True, BLACK
-                    )
-                    lvl_text_position_x: int = (
-                        frame_position[0]
-                        + constant_sprites["frame"].get_width() / 2
-                        - level_text.get_width() / 2
-                    )
-                    screen.blit(
+                blits.append(
+                    (
                         level_text,
                         (
                             lvl_text_position_x,
                             frame_position[1] + constant_sprites["frame"].get_height(),
                         ),
                     )
+                )
 
-                    # Status
-                    status_pre_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
-                        STR_ALTERATIONS_, True, color
-                    )
-                    screen.blit(
+                # Status
+                status_pre_text: pygame.Surface = render_text(
+                    "ITEM_FONT_STRONG", STR_ALTERATIONS_, True, color
+                )
+                blits.append(
+                    (
                         status_pre_text,
                         (
                             text_position_x,
                             frame_position[1] + constant_sprites["frame"].get_height(),
                         ),
                     )
-                    status_text = fonts["ITEM_FONT_STRONG"].render(
-                        " " * 18 + hovered_entity.get_abbreviated_alterations(),
-                        True,
-                        BLACK,
-                    )
-                    screen.blit(
+                )
+                status_text = render_text(
+                    "ITEM_FONT_STRONG",
+                    " " * 18 + hovered_entity.get_abbreviated_alterations(),
+                    True,
+                    BLACK,
+                )
+                blits.append(
+                    (
                         status_text,
                         (
                             text_position_x,
                             frame_position[1] + constant_sprites["frame"].get_height(),
                         ),
                     )
+                )
 
-                    # Display more information if it is a character
-                    if isinstance(hovered_entity, Character):
-                        race: str = hovered_entity.get_formatted_race()
-                        race_pre_text: pygame.Surface = fonts[
-                            "ITEM_FONT_STRONG"
-                        ].render(STR_RACE_, True, color)
-                        screen.blit(
+                # Display more information if it is a character
+                if isinstance(hovered_entity, Character):
+                    race: str = hovered_entity.get_formatted_race()
+                    race_pre_text: pygame.Surface = render_text(
+                        "ITEM_FONT_STRONG", STR_RACE_, True, color
+                    )
+                    blits.append(
+                        (
                             race_pre_text,
                             (
                                 text_position_x,
@@ -271,10 +428,12 @@ class Sidebar:
                                 + (fonts["ITEM_FONT_STRONG"].get_height() - SHIFT) * 2,
                             ),
                         )
-                        race_text = fonts["ITEM_FONT_STRONG"].render(
-                            f"        {race}", True, BLACK
-                        )
-                        screen.blit(
+                    )
+                    race_text = render_text(
+                        "ITEM_FONT_STRONG", f"        {race}", True, BLACK
+                    )
+                    blits.append(
+                        (
                             race_text,
                             (
                                 text_position_x,
@@ -282,14 +441,16 @@ class Sidebar:
                                 + (fonts["ITEM_FONT_STRONG"].get_height() - SHIFT) * 2,
                             ),
                         )
+                    )
 
-                        # Display more information if it is a player
-                        if isinstance(hovered_entity, Player):
-                            classes = hovered_entity.get_formatted_classes()
-                            classes_pre_text = fonts["ITEM_FONT_STRONG"].render(
-                                STR_CLASS_, True, color
-                            )
-                            screen.blit(
+                    # Display more information if it is a player
+                    if isinstance(hovered_entity, Player):
+                        classes = hovered_entity.get_formatted_classes()
+                        classes_pre_text = render_text(
+                            "ITEM_FONT_STRONG", STR_CLASS_, True, color
+                        )
+                        blits.append(
+                            (
                                 classes_pre_text,
                                 (
                                     text_position_x,
@@ -298,10 +459,12 @@ class Sidebar:
                                     - SHIFT,
                                 ),
                             )
-                            classes_text = fonts["ITEM_FONT_STRONG"].render(
-                                "         " + classes, True, BLACK
-                            )
-                            screen.blit(
+                        )
+                        classes_text = render_text(
+                            "ITEM_FONT_STRONG", "         " + classes, True, BLACK
+                        )
+                        blits.append(
+                            (
                                 classes_text,
                                 (
                                     text_position_x,
@@ -310,3 +473,5 @@ class Sidebar:
                                     - SHIFT,
                                 ),
                             )
+                        )
+        return blits
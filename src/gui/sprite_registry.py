@@ -0,0 +1,140 @@
+"""
+Defines SpriteRegistry class, the sprites already loaded and scaled for the entities,
+and the get_sprite and scale_sprite functions using the instance shared by all modules.
+"""
+
+from __future__ import annotations
+
+import os
+from weakref import WeakKeyDictionary
+
+import pygame
+
+from src.constants import TILE_SIZE
+from src.gui.texture_atlas import load_image
+
+
+class SpriteRegistry:
+    """
+    A SpriteRegistry keeps each sprite loaded from a file and scaled to a given size,
+    so all the entities looking the same share a single surface instead of loading
+    and scaling the file each time.
+    It also keeps the scaled versions of surfaces that are not loaded from their own file,
+    such as the tiles of a map, as long as the original surface exists.
+
+    The sprites are shared: they should be copied before being drawn on.
+
+    Attributes:
+    hits -- the number of requested sprites found in the registry
+    misses -- the number of requested sprites that had to be loaded or scaled
+    _sprites -- the loaded sprites by path and size
+    _scaled_surfaces -- the scaled versions of each original surface by size
+    """
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self._sprites: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+        self._scaled_surfaces: WeakKeyDictionary[
+            pygame.Surface, dict[tuple[int, int], pygame.Surface]
+        ] = WeakKeyDictionary()
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the share of the requested sprites found in the registry, 0 if none was requested.
+        """
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def get(
+        self, path: str, size: tuple[int, int] = (TILE_SIZE, TILE_SIZE)
+    ) -> pygame.Surface:
+        """
+        Return the sprite stored in the given file scaled to the given size,
+        loading it only if it is not in the registry.
+
+        Keyword arguments:
+        path -- the path to the file of the sprite
+        size -- the size of the sprite
+        """
+        key = (os.path.normpath(path), (int(size[0]), int(size[1])))
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = pygame.transform.scale(load_image(path), key[1])
+        self._sprites[key] = sprite
+        return sprite
+
+    def scale(
+        self, surface: pygame.Surface, size: tuple[int, int] = (TILE_SIZE, TILE_SIZE)
+    ) -> pygame.Surface:
+        """
+        Return the given surface scaled to the given size,
+        scaling it only if it has not been yet.
+
+        Keyword arguments:
+        surface -- the original surface, which should not be modified afterwards
+        size -- the size of the scaled surface
+        """
+        size = (int(size[0]), int(size[1]))
+        scaled_surfaces = self._scaled_surfaces.setdefault(surface, {})
+        scaled_surface = scaled_surfaces.get(size)
+        if scaled_surface is not None:
+            self.hits += 1
+            return scaled_surface
+
+        self.misses += 1
+        scaled_surface = pygame.transform.scale(surface, size)
+        scaled_surfaces[size] = scaled_surface
+        return scaled_surface
+
+    def clear(self) -> None:
+        """
+        Forget all the loaded and scaled sprites and reset the counters.
+        """
+        self._sprites.clear()
+        self._scaled_surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sprites) + sum(
+            len(scaled_surfaces) for scaled_surfaces in self._scaled_surfaces.values()
+        )
+
+
+sprite_registry = SpriteRegistry()
+
+
+def get_sprite(
+    path: str, size: tuple[int, int] = (TILE_SIZE, TILE_SIZE)
+) -> pygame.Surface:
+    """
+    Return the sprite stored in the given file scaled to the given size,
+    through the registry shared by all modules.
+    The sprite is shared and should be copied before being drawn on.
+
+    Keyword arguments:
+    path -- the path to the file of the sprite
+    size -- the size of the sprite
+    """
+    return sprite_registry.get(path, size)
+
+
+def scale_sprite(
+    surface: pygame.Surface, size: tuple[int, int] = (TILE_SIZE, TILE_SIZE)
+) -> pygame.Surface:
+    """
+    Return the given surface scaled to the given size,
+    through the registry shared by all modules.
+    The scaled surface is shared and should be copied before being drawn on.
+
+    Keyword arguments:
+    surface -- the original surface, which should not be modified afterwards
+    size -- the size of the scaled surface
+    """
+    return sprite_registry.scale(surface, size)
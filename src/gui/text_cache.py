@@ -0,0 +1,120 @@
+"""
+Defines TextCache class, the memory of the texts already rendered with the fonts of the application,
+and the render_text function using the instance shared by all modules.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Union
+
+import pygame
+
+from src.gui.fonts import fonts
+
+TEXT_CACHE_SIZE = 512
+
+ColorValue = Union[pygame.Color, str, tuple[int, ...]]
+
+
+class TextCache:
+    """
+    A TextCache keeps the last rendered texts, so rendering again the same text
+    with the same font and colors gives back the same surface instead of rasterising it again.
+
+    The surfaces are shared: they should be blitted, never modified.
+    The least recently used one is forgotten once the cache is full.
+
+    Keyword arguments:
+    max_size -- the maximum number of surfaces kept
+
+    Attributes:
+    max_size -- the maximum number of surfaces kept
+    hits -- the number of renderings found in the cache
+    misses -- the number of renderings that had to be done
+    _surfaces -- the font used and the rendered surface, by font name, text, antialiasing,
+    color and background color, from the least to the most recently used
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._surfaces: OrderedDict[tuple, tuple[pygame.font.Font, pygame.Surface]] = (
+            OrderedDict()
+        )
+
+    def render(
+        self,
+        font_name: str,
+        text: str,
+        antialias: bool,
+        color: ColorValue,
+        background: Optional[ColorValue] = None,
+    ) -> pygame.Surface:
+        """
+        Return the given text rendered with the given font, rendering it only if it is not in the cache.
+
+        Keyword arguments:
+        font_name -- the name of the font among the fonts of the application
+        text -- the text to render
+        antialias -- whether the characters should have smooth edges
+        color -- the color of the text
+        background -- the color of the background, transparent if None
+        """
+        font = fonts[font_name]
+        key = (
+            font_name,
+            text,
+            bool(antialias),
+            tuple(pygame.Color(color)),
+            None if background is None else tuple(pygame.Color(background)),
+        )
+        cached = self._surfaces.get(key)
+        # The fonts could have been loaded again since the text has been rendered
+        if cached is not None and cached[0] is font:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return cached[1]
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = (font, surface)
+        self._surfaces.move_to_end(key)
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """
+        Forget all the rendered texts and reset the counters.
+        """
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+text_cache = TextCache(TEXT_CACHE_SIZE)
+
+
+def render_text(
+    font_name: str,
+    text: str,
+    antialias: bool,
+    color: ColorValue,
+    background: Optional[ColorValue] = None,
+) -> pygame.Surface:
+    """
+    Return the given text rendered with the given font, through the cache shared by all modules.
+
+    Keyword arguments:
+    font_name -- the name of the font among the fonts of the application
+    text -- the text to render
+    antialias -- whether the characters should have smooth edges
+    color -- the color of the text
+    background -- the color of the background, transparent if None
+    """
+    return text_cache.render(font_name, text, antialias, color, background)
@@ -0,0 +1,263 @@
+"""
+Defines TextureAtlas class, the sprites of the game packed in a few large sheets,
+the load_image function handing out the sprites from the atlas when they are in it,
+and the build step packing the sprites used by each level.
+
+The atlas is built by running this module from the root of the game:
+python -m src.gui.texture_atlas
+It should be built again whenever a sprite of the imgs directory is modified.
+Sprites that are not in the atlas are loaded from their own file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Sequence
+from typing import Optional
+
+import pygame
+
+ATLAS_DIRECTORY = "atlas/"
+ATLAS_INDEX = "index.json"
+ATLAS_SHEET_SIZE = 2048
+
+
+class TextureAtlas:
+    """
+    A TextureAtlas hands out the sprites packed in its sheets as subsurfaces of them.
+
+    Each sheet is loaded only when one of its sprites is requested for the first time.
+    The handed out sprites share their pixels with the sheet: they should be copied, scaled
+    or blitted, never modified.
+
+    Keyword arguments:
+    directory -- the directory containing the sheets
+    sheet_names -- the file names of the sheets
+    regions -- the index of the sheet containing each sprite and its area in the sheet,
+    by sprite path
+
+    Attributes:
+    directory -- the directory containing the sheets
+    sheet_names -- the file names of the sheets
+    regions -- the index of the sheet containing each sprite and its area in the sheet,
+    by sprite path
+    sheets -- the sheets already loaded by index
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sheet_names: Sequence[str],
+        regions: dict[str, tuple[int, pygame.Rect]],
+    ) -> None:
+        self.directory: str = directory
+        self.sheet_names: Sequence[str] = sheet_names
+        self.regions: dict[str, tuple[int, pygame.Rect]] = regions
+        self.sheets: dict[int, pygame.Surface] = {}
+
+    def get(self, path: str) -> Optional[pygame.Surface]:
+        """
+        Return the sprite loaded from the given file, None if it is not in the atlas.
+
+        Keyword arguments:
+        path -- the path to the file of the sprite
+        """
+        region = self.regions.get(os.path.normpath(path))
+        if region is None:
+            return None
+        sheet_index, area = region
+        sheet = self.sheets.get(sheet_index)
+        if sheet is None:
+            sheet = pygame.image.load(
+                os.path.join(self.directory, self.sheet_names[sheet_index])
+            ).convert_alpha()
+            self.sheets[sheet_index] = sheet
+        return sheet.subsurface(area)
+
+
+texture_atlas: Optional[TextureAtlas] = None
+# The paths of all the files requested by load_image, in order of first request
+requested_images: dict[str, None] = {}
+
+
+def init_texture_atlas(directory: str = ATLAS_DIRECTORY) -> None:
+    """
+    Load the index of the atlas so sprites are handed out from its sheets,
+    if the atlas has been built.
+    Should be called after the initialization of at least one pygame window.
+
+    Keyword arguments:
+    directory -- the directory containing the atlas
+    """
+    global texture_atlas
+    texture_atlas = load_atlas(directory)
+
+
+def load_atlas(directory: str) -> Optional[TextureAtlas]:
+    """
+    Return the atlas stored in the given directory, None if there is none.
+
+    Keyword arguments:
+    directory -- the directory containing the atlas
+    """
+    index_path = os.path.join(directory, ATLAS_INDEX)
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, "r", encoding="utf-8") as index_file:
+        index = json.load(index_file)
+    regions = {
+        path: (sheet_index, pygame.Rect(x, y, width, height))
+        for path, (sheet_index, x, y, width, height) in index["sprites"].items()
+    }
+    return TextureAtlas(directory, index["sheets"], regions)
+
+
+def load_image(path: str) -> pygame.Surface:
+    """
+    Return the sprite stored in the given file, converted for fast blitting with its transparency.
+    The sprite is taken from the atlas if it is in it, and shouldn't be modified.
+
+    Keyword arguments:
+    path -- the path to the file of the sprite
+    """
+    requested_images.setdefault(os.path.normpath(path))
+    if texture_atlas is not None:
+        sprite = texture_atlas.get(path)
+        if sprite is not None:
+            return sprite
+    return pygame.image.load(path).convert_alpha()
+
+
+def pack_sprites(
+    sizes: Sequence[tuple[int, int]], sheet_size: int = ATLAS_SHEET_SIZE
+) -> list[Optional[tuple[int, pygame.Rect]]]:
+    """
+    Place sprites of the given sizes in square sheets, in rows of sprites ordered by height.
+
+    Return the index of the sheet and the area of each sprite in the order of the given sizes,
+    None for sprites too large to fit in a sheet.
+
+    Keyword arguments:
+    sizes -- the size of each sprite
+    sheet_size -- the width and height of a sheet
+    """
+    placements: list[Optional[tuple[int, pygame.Rect]]] = [None] * len(sizes)
+    sheet_index = 0
+    x = y = row_height = 0
+    for sprite_index in sorted(
+        range(len(sizes)), key=lambda index: (-sizes[index][1], -sizes[index][0])
+    ):
+        width, height = sizes[sprite_index]
+        if width > sheet_size or height > sheet_size:
+            continue
+        if x + width > sheet_size:
+            x, y, row_height = 0, y + row_height, 0
+        if y + height > sheet_size:
+            sheet_index += 1
+            x = y = row_height = 0
+        placements[sprite_index] = (sheet_index, pygame.Rect(x, y, width, height))
+        x += width
+        row_height = max(row_height, height)
+    return placements
+
+
+def build_atlas(
+    groups: Sequence[Sequence[str]],
+    directory: str = ATLAS_DIRECTORY,
+    sheet_size: int = ATLAS_SHEET_SIZE,
+) -> TextureAtlas:
+    """
+    Pack the sprites of the given files in sheets saved in the given directory,
+    with the index of the area of each sprite.
+    Each group of sprites is packed in its own sheets, so only the sheets of the groups in use
+    are loaded.
+    Should be called after the initialization of at least one pygame window.
+
+    Return the built atlas.
+
+    Keyword arguments:
+    groups -- the paths to the files of the sprites, by group of sprites used together
+    directory -- the directory in which the atlas is saved
+    sheet_size -- the maximum width and height of a sheet
+    """
+    os.makedirs(directory, exist_ok=True)
+    sheet_names: list[str] = []
+    regions: dict[str, tuple[int, pygame.Rect]] = {}
+    for group in groups:
+        paths = [
+            path
+            for path in dict.fromkeys(map(os.path.normpath, group))
+            if path not in regions
+        ]
+        images = [pygame.image.load(path).convert_alpha() for path in paths]
+        placements = pack_sprites([image.get_size() for image in images], sheet_size)
+        group_sheets: dict[int, list[tuple[str, pygame.Surface, pygame.Rect]]] = {}
+        for path, image, placement in zip(paths, images, placements):
+            if placement is not None:
+                group_sheets.setdefault(placement[0], []).append(
+                    (path, image, placement[1])
+                )
+        for sprites in group_sheets.values():
+            sheet_index = len(sheet_names)
+            sheet_area = sprites[0][2].unionall([area for _, _, area in sprites])
+            sheet = pygame.Surface(sheet_area.bottomright, pygame.SRCALPHA)
+            for path, image, area in sprites:
+                # Maximum with the empty sheet copies the pixels with their transparency
+                sheet.blit(image, area, special_flags=pygame.BLEND_RGBA_MAX)
+                regions[path] = (sheet_index, area)
+            sheet_names.append(f"sheet_{sheet_index}.png")
+            pygame.image.save(sheet, os.path.join(directory, sheet_names[-1]))
+
+    with open(
+        os.path.join(directory, ATLAS_INDEX), "w", encoding="utf-8"
+    ) as index_file:
+        json.dump(
+            {
+                "sheets": sheet_names,
+                "sprites": {
+                    path: [sheet_index, *area]
+                    for path, (sheet_index, area) in regions.items()
+                },
+            },
+            index_file,
+            indent=1,
+        )
+    return TextureAtlas(directory, sheet_names, regions)
+
+
+if __name__ == "__main__":
+    import pygamepopup
+
+    from src.constants import MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH
+    from src.game_entities.character import Character
+    from src.game_entities.movable import Movable
+    from src.gui import constant_sprites, fonts
+    # The sprites are requested through the module imported by the game, not this script
+    from src.gui.texture_atlas import requested_images
+    from src.scenes.level_scene import LevelScene
+    from src.scenes.start_scene import StartScene
+    from src.services import load_from_xml_manager as loader
+
+    pygame.init()
+    pygamepopup.init()
+    fonts.init_fonts()
+    pygame.display.set_mode((MAIN_WIN_WIDTH, MAIN_WIN_HEIGHT))
+
+    # The sprites loaded at start are grouped together, then the ones first loaded by each level
+    Movable.init_constant_sprites()
+    constant_sprites.init_constant_sprites()
+    Character.init_data(loader.load_races(), loader.load_classes())
+    sprite_groups = [list(requested_images)]
+    for level_id in LevelScene.IDS:
+        already_requested = len(requested_images)
+        StartScene.load_new_level(
+            level_id, StartScene.generate_level_window()
+        ).load_level_content()
+        sprite_groups.append(list(requested_images)[already_requested:])
+
+    atlas = build_atlas(sprite_groups)
+    print(
+        f"{len(atlas.regions)} sprites packed in {len(atlas.sheet_names)} sheets "
+        f"in {ATLAS_DIRECTORY}"
+    )
@@ -0,0 +1,80 @@
+"""
+Defines TileOverlay class, a layer highlighting a set of tiles of the map.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Optional
+
+import pygame
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+
+
+class TileOverlay:
+    """
+    A TileOverlay draws the same translucent sprite on each highlighted tile.
+
+    All the highlighted tiles are drawn once on a single surface covering them,
+    drawn again only when the highlighted tiles change, so highlighting them at each frame
+    costs one blit whatever their number.
+
+    Keyword arguments:
+    sprite -- the sprite drawn on each highlighted tile
+    opacity -- the opacity with which the sprite is drawn
+
+    Attributes:
+    tile_sprite -- the sprite drawn on each highlighted tile, with its opacity,
+    a copy private to the overlay
+    surface -- the surface on which the highlighted tiles are drawn,
+    None if no tile is highlighted
+    area -- the area of the screen covered by the surface
+    _tiles -- the highlighted tiles drawn on the surface, None if the surface has not been drawn yet
+    """
+
+    def __init__(self, sprite: pygame.Surface, opacity: int) -> None:
+        self.tile_sprite: pygame.Surface = sprite.copy()
+        self.tile_sprite.set_alpha(opacity)
+        self.surface: Optional[pygame.Surface] = None
+        self.area: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+        self._tiles: Optional[frozenset[tuple[int, int]]] = None
+
+    def update(self, tiles: Iterable[Position]) -> None:
+        """
+        Draw the surface again if the highlighted tiles are not the ones already drawn.
+
+        Keyword arguments:
+        tiles -- the highlighted tiles
+        """
+        highlighted_tiles = frozenset((int(tile[0]), int(tile[1])) for tile in tiles)
+        if highlighted_tiles == self._tiles:
+            return
+        self._tiles = highlighted_tiles
+        if not highlighted_tiles:
+            self.surface = None
+            self.area = pygame.Rect(0, 0, 0, 0)
+            return
+
+        tile_areas = [
+            pygame.Rect(tile, (TILE_SIZE, TILE_SIZE)) for tile in highlighted_tiles
+        ]
+        self.area = tile_areas[0].unionall(tile_areas[1:])
+        self.surface = pygame.Surface(self.area.size, pygame.SRCALPHA)
+        for tile_area in tile_areas:
+            self.surface.blit(
+                self.tile_sprite, tile_area.move(-self.area.x, -self.area.y)
+            )
+
+    def display(self, screen: pygame.Surface, tiles: Iterable[Position]) -> None:
+        """
+        Highlight the given tiles on the screen.
+
+        Keyword arguments:
+        screen -- the screen on which the tiles should be highlighted
+        tiles -- the highlighted tiles
+        """
+        self.update(tiles)
+        if self.surface is not None:
+            screen.blit(self.surface, self.area)
@@ -11,40 +11,26 @@ import pygame
 from src.constants import (DARK_GREEN, LIGHT_YELLOW, ORANGE, RED, TILE_SIZE,
                            YELLOW)
 from src.gui.position import Position
+from src.gui.text_cache import render_text
 
 
 def show_fps(
-    surface: pygame.Surface, inner_clock: pygame.time.Clock, font: pygame.font.Font
-) -> None:
+    surface: pygame.Surface, inner_clock: pygame.time.Clock, font_name: str
+) -> pygame.Rect:
     """
     Display in the top left corner of the screen the current frame rate.
 
+    Return the area in which the frame rate has been drawn.
+
     Keyword arguments:
     screen -- the surface on which the framerate should be drawn
     inner_clock -- the pygame clock running and containing the current frame rate
-    font -- the font used to display the frame rate
-    """
-    fps_text = font.render(f"FPS: {inner_clock.get_fps():.0f}", True, LIGHT_YELLOW)
-    surface.blit(fps_text, (2, 2))
-
-
-def blit_alpha(
-    target: pygame.Surface,
-    source: pygame.Surface,
-    location: Position,
-    opacity: int,
-):
+    font_name -- the name of the font used to display the frame rate
     """
-    Blit a surface on one other but with a specific opacity.
-
-    Keyword arguments:
-    target -- the destination pygame Surface
-    source -- the pygame Surface that will be blitted
-    location -- the position where the blit should be done
-    opacity -- the opacity of the blitted surface
-    """
-    source.set_alpha(opacity)
-    target.blit(source, location)
+    fps_text = render_text(
+        font_name, f"FPS: {inner_clock.get_fps():.0f}", True, LIGHT_YELLOW
+    )
+    return surface.blit(fps_text, (2, 2))
 
 
 def distance(position: Position, other_position: Position) -> int:
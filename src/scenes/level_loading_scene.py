@@ -9,8 +9,8 @@ import pygame
 from src.constants import WHITE
 from src.gui.animation import Frame
 from src.gui.fade_in_out_animation import FadeInOutAnimation
-from src.gui.fonts import fonts
 from src.gui.position import Position
+from src.gui.text_cache import render_text
 from src.scenes.level_scene import LevelScene
 from src.scenes.scene import Scene
 from src.services.language import *
@@ -70,12 +70,15 @@ class LevelLoadingScene(Scene):
 
         Return the surface containing the rendered text.
         """
-        chapter_rendering = fonts["LEVEL_TITLE_FONT"].render(
-            f_CHAPTER_NUMBER(self.level.chapter), True, WHITE
+        chapter_rendering = render_text(
+            "LEVEL_TITLE_FONT", f_CHAPTER_NUMBER(self.level.chapter), True, WHITE
         )
 
-        level_name_rendering = fonts["LEVEL_TITLE_FONT"].render(
-            f_LEVEL_NUMBER_AND_NAME(self.level.number, self.level.name), True, WHITE
+        level_name_rendering = render_text(
+            "LEVEL_TITLE_FONT",
+            f_LEVEL_NUMBER_AND_NAME(self.level.number, self.level.name),
+            True,
+            WHITE,
         )
 
         surface_size = (
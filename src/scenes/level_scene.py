@@ -5,8 +5,7 @@ corresponding to an ongoing level.
 
 from __future__ import annotations
 
-import os
-from collections.abc import Sequence
+from collections.abc import Collection, Hashable, Mapping, Sequence
 from enum import IntEnum, auto
 from typing import Optional, Union
 
@@ -37,7 +36,7 @@ from src.game_entities.gold import Gold
 from src.game_entities.item import Item
 from src.game_entities.key import Key
 from src.game_entities.mission import Mission, MissionType
-from src.game_entities.movable import Movable
+from src.game_entities.movable import EntityState, EntityStrategy, Movable
 from src.game_entities.objective import Objective
 from src.game_entities.obstacle import Obstacle
 from src.game_entities.player import Player
@@ -46,23 +45,37 @@ from src.game_entities.shop import Shop
 from src.game_entities.skill import Skill
 from src.game_entities.weapon import Weapon
 from src.gui.animation import Animation, Frame
-from src.gui.constant_sprites import (ATTACKABLE_OPACITY, INTERACTION_OPACITY,
-                                      LANDING_OPACITY, constant_sprites)
+from src.gui.constant_sprites import (ATTACKABLE_OPACITY, DANGER_ZONE_OPACITY,
+                                      INTERACTION_OPACITY, LANDING_OPACITY,
+                                      constant_sprites)
+from src.gui.dirty_areas import DirtyAreas, merge_areas
 from src.gui.fonts import fonts
 from src.gui.position import Position
 from src.gui.sidebar import Sidebar
-from src.gui.tools import blit_alpha
+from src.gui.tile_overlay import TileOverlay
 from src.scenes.scene import QuitActionKind, Scene
 from src.services import load_from_tmx_manager as tmx_loader
 from src.services import load_from_xml_manager as loader
-from src.services import menu_creator_manager
+from src.services import menu_creator_manager, options_manager
+from src.services.distance_field import DistanceFields
 from src.services.language import *
 from src.services.menu_creator_manager import (CHARACTER_ACTION_MENU_ID,
                                                INVENTORY_MENU_ID, SHOP_MENU_ID,
                                                create_event_dialog,
                                                create_save_dialog)
 from src.services.menus import CharacterMenu
+from src.services.occupancy_grid import OccupancyGrid
+from src.services.pathfinding import PossibleMoves, find_path, flood_fill
+from src.services.range_cache import RangeCache
 from src.services.save_state_manager import SaveStateManager
+from src.services.sound_bank import get_sound
+from src.services.tactical_ai import evaluation_pool
+from src.services.threat_map import ThreatMap, max_reach
+from src.services.tile_mask import TileMask
+from src.services.tiles import tile_coordinates, tile_position
+from src.services.turn_planner import (PlannedAction, PlanningBoard,
+                                       TurnPlanning)
+from src.services.walkability_grid import WalkabilityGrid
 
 
 class LevelStatus(IntEnum):
@@ -90,6 +103,29 @@ class LevelEntityCollections:
     def values(self):
         return self.__dict__.values()
 
+    def static_values(self):
+        """
+        Return the collections of the entities that never move,
+        in the order in which they should be drawn.
+        """
+        return (
+            self.obstacles,
+            self.chests,
+            self.buildings,
+            self.breakables,
+            self.portals,
+            self.fountains,
+            self.objectives,
+            self.doors,
+        )
+
+    def dynamic_values(self):
+        """
+        Return the collections of the entities that can move,
+        in the order in which they should be drawn.
+        """
+        return self.players, self.allies, self.foes
+
     def update(self, entities: dict[str, Sequence[Entity]]):
         self.__dict__.update(entities)
 
@@ -130,6 +166,7 @@ class LevelScene(Scene):
     concerning the level are stored
     number -- the number identifying the level
     map -- a dictionary containing the properties of the level's map
+    walkability -- the grid telling which tiles of the map can be crossed
     chapter -- the id corresponding to the chapter in which the level is part
     name -- the full title of the level
     is_loaded -- whether the level is ready to be played or not
@@ -141,6 +178,15 @@ class LevelScene(Scene):
     if it should be displayed or not
     players -- the list of players that are still actives on the level
     entities -- the structure containing all the entities of the level by category
+    occupancy -- the index of the entities of the level by the tile they are standing on
+    distance_fields -- the distance fields leading to the entities targeted by the AI, shared for a whole turn
+    ranges -- the last possible moves and attacks computed for each entity on the current board
+    danger_zone -- the tiles the foes could hit without moving, computed for the current board
+    background -- the ground of the map with all the entities that never move drawn on it,
+    None if it should be drawn again
+    dirty_areas -- the parts of the level drawn at the previous frame, telling which areas changed
+    overlays -- the layers highlighting the possible moves, attacks, interactions, placements
+    and the danger zone, by kind
     passed_players -- the list of players who left the level
     missions -- the list of missions to be done
     main_mission -- the main mission that is the winning condition for players
@@ -218,6 +264,11 @@ class LevelScene(Scene):
             "x": (GRID_WIDTH - self.tmx_data.width) // 2 * TILE_SIZE,
             "y": (GRID_HEIGHT - self.tmx_data.height) // 2 * TILE_SIZE,
         }
+        self.walkability: WalkabilityGrid = WalkabilityGrid(
+            (self.map["x"] // TILE_SIZE, self.map["y"] // TILE_SIZE),
+            (self.tmx_data.width, self.tmx_data.height),
+            tmx_loader.load_walkable_tiles(self.tmx_data),
+        )
 
         self.data: Optional[etree.Element] = data
 
@@ -234,6 +285,26 @@ class LevelScene(Scene):
         self.escaped_players: list[Player] = []
 
         self.entities: LevelEntityCollections = LevelEntityCollections()
+        self.occupancy: OccupancyGrid = OccupancyGrid(self.walkability)
+        self.distance_fields: DistanceFields = DistanceFields(self.walkability)
+        self.ranges: RangeCache = RangeCache(self.occupancy)
+        self.danger_zone: set[Position] = set()
+        self.background: Optional[pygame.Surface] = None
+        self.dirty_areas: DirtyAreas = DirtyAreas(self.screen.get_size())
+        self._danger_zone_version: Optional[int] = None
+        self.overlays: dict[str, TileOverlay] = {
+            "moves": TileOverlay(constant_sprites["landing"], LANDING_OPACITY),
+            "attacks": TileOverlay(constant_sprites["attackable"], ATTACKABLE_OPACITY),
+            "interactions": TileOverlay(
+                constant_sprites["interaction"], INTERACTION_OPACITY
+            ),
+            "placements": TileOverlay(constant_sprites["landing"], LANDING_OPACITY),
+            "danger_zone": TileOverlay(
+                constant_sprites["attackable"], DANGER_ZONE_OPACITY
+            ),
+        }
+        self.turn_plan: dict[Movable, PlannedAction] = {}
+        self.turn_planning: Optional[TurnPlanning] = None
 
         self.missions: Optional[list[Mission]] = None
         self.main_mission: Optional[Mission] = None
@@ -246,8 +317,8 @@ class LevelScene(Scene):
         self.defeat: bool = False
 
         # Data structures for possible actions
-        self.possible_moves: dict[Position, int] = {}
-        self.possible_attacks: list[Position] = []
+        self.possible_moves: Mapping[Position, int] = {}
+        self.possible_attacks: Collection[Position] = []
         self.possible_interactions: list[Position] = []
 
         # Storage of current selected entity
@@ -334,6 +405,7 @@ class LevelScene(Scene):
                     create_save_dialog({"yes": self.yes_save, "no": self.no_dont_save})
                 )
 
+            self._build_occupancy_index()
             self._determine_players_initial_position()
 
             self.entities.foes = tmx_loader.load_foes(self.tmx_data, gap_x, gap_y)
@@ -378,6 +450,8 @@ class LevelScene(Scene):
             for mission in self.missions
             for objective in mission.objective_tiles
         ]
+        self._build_occupancy_index()
+        self.invalidate_background()
 
         self.sidebar = Sidebar(
             (MENU_WIDTH, MENU_HEIGHT),
@@ -386,13 +460,11 @@ class LevelScene(Scene):
             self.number,
         )
 
-        self.wait_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "waiting.ogg"))
-        self.inventory_sfx = pygame.mixer.Sound(
-            os.path.join("sound_fx", "inventory.ogg")
-        )
-        self.armor_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "armor.ogg"))
-        self.talk_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "talking.ogg"))
-        self.gold_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "trade.ogg"))
+        self.wait_sfx = get_sound("waiting.ogg")
+        self.inventory_sfx = get_sound("inventory.ogg")
+        self.armor_sfx = get_sound("armor.ogg")
+        self.talk_sfx = get_sound("talking.ogg")
+        self.gold_sfx = get_sound("trade.ogg")
 
         self.is_loaded = True
 
@@ -401,10 +473,17 @@ class LevelScene(Scene):
             for tile in self.player_possible_placements:
                 if self.get_entity_on_tile(tile) is None:
                     player.set_initial_pos(tile)
+                    self.occupancy.update(player)
                     break
             else:
                 print(STR_ERROR_NOT_ENOUGH_TILES_TO_SET_PLAYERS)
 
+    def _build_occupancy_index(self) -> None:
+        """
+        Index all the entities of the level by the tile they are standing on
+        """
+        self.occupancy.rebuild(self.entities.values())
+
     def open_save_menu(self) -> None:
         """
         Replace the current active menu by a freshly created save game interface
@@ -530,6 +609,7 @@ class LevelScene(Scene):
 
         if self.selected_player:
             self.selected_player.move()
+            self.occupancy.update(self.selected_player)
             if (
                 self.selected_player.is_waiting_post_action()
                 and not self.possible_attacks
@@ -604,18 +684,168 @@ class LevelScene(Scene):
         Display also all the menus in the background (that should be visible)
         and lastly the active menu.
         """
-        self.active_screen_part.blit(self.map["img"], (self.map["x"], self.map["y"]))
-        self.sidebar.display(self.active_screen_part, self.turn, self.hovered_entity)
+        self._draw()
+        self.dirty_areas.forget()
 
-        for mission in self.missions:
-            mission.display(self.active_screen_part)
+    def display_changes(
+        self, areas: Sequence[pygame.Rect]
+    ) -> Optional[list[pygame.Rect]]:
+        """
+        Display again the parts of the level that changed since the last display,
+        along with the given areas of the screen.
+        Everything is displayed again while an animation is ongoing,
+        or if the changes cover too much of the screen.
+
+        Return the areas of the screen that have been drawn, or None if the whole screen has.
+
+        Keyword arguments:
+        areas -- the areas of the screen that should be drawn again anyway
+        """
+        if self.background is None:
+            self.background = self._draw_background()
+        changed_areas = self.dirty_areas.changes(self._describe_frame())
+        if changed_areas is None or self.animation:
+            self.screen.fill(BLACK)
+            self._draw()
+            return None
+
+        offset = self.active_screen_part.get_abs_offset()
+        redrawn_areas = merge_areas(
+            [area.move(offset) for area in changed_areas] + list(areas)
+        )
+        for area in redrawn_areas:
+            self.screen.set_clip(area)
+            self.active_screen_part.set_clip(area.move(-offset[0], -offset[1]))
+            self.screen.fill(BLACK)
+            self._draw()
+        self.screen.set_clip(None)
+        self.active_screen_part.set_clip(None)
+        return redrawn_areas
+
+    def _describe_frame(self) -> dict[Hashable, tuple[pygame.Rect, Hashable]]:
+        """
+        Return the parts of the level that could change from one frame to the next,
+        by key with the area of the level screen they cover and their state,
+        menus being considered changed at each frame since they react to the mouse.
+        """
+        parts: dict[Hashable, tuple[pygame.Rect, Hashable]] = {
+            "background": (
+                pygame.Rect(
+                    self.map["x"], self.map["y"], self.map["width"], self.map["height"]
+                ),
+                id(self.background),
+            )
+        }
+
+        hovered_entity = self.hovered_entity
+        parts["sidebar"] = (
+            pygame.Rect(self.sidebar.position, self.sidebar.size),
+            (
+                self.turn,
+                int(self.turn_planning.progress * 100) if self.turn_planning else None,
+                tuple(mission.ended for mission in self.missions),
+                id(hovered_entity),
+                self._entity_state(hovered_entity) if hovered_entity else None,
+            ),
+        )
+
+        for breakable in self.entities.breakables:
+            parts[id(breakable)] = (breakable.get_rect(), breakable.hit_points)
+        for collection in self.entities.dynamic_values():
+            for entity in collection:
+                parts[id(entity)] = (
+                    entity.get_rect().union(
+                        pygame.Rect(entity.position, (TILE_SIZE, TILE_SIZE))
+                    ),
+                    self._entity_state(entity),
+                )
+
+        overlays: list[tuple[str, Collection[Position]]] = []
+        if int(options_manager.get_option("danger_zone")):
+            overlays.append(("danger_zone", self.update_danger_zone()))
+        if self.watched_entity:
+            overlays.append(("moves", self.possible_moves))
+            overlays.append(("attacks", self.possible_attacks))
+        if self.game_phase is LevelStatus.INITIALIZATION:
+            overlays.append(("placements", self.player_possible_placements))
+        elif self.selected_player:
+            overlays.append(("moves", self.possible_moves))
+            overlays.append(("attacks", self.possible_attacks))
+            overlays.append(("interactions", self.possible_interactions))
+        for kind, tiles in overlays:
+            for tile in tiles:
+                parts[(kind, tuple(tile))] = (
+                    pygame.Rect(tile, (TILE_SIZE, TILE_SIZE)),
+                    None,
+                )
 
-        for collection in self.entities.values():
+        offset = self.active_screen_part.get_abs_offset()
+        menus = [
+            menu
+            for menu in self.menu_manager.background_menus
+            if menu.visible_on_background
+        ]
+        if self.menu_manager.active_menu:
+            menus.append(self.menu_manager.active_menu)
+        for menu in menus:
+            if menu.position is not None:
+                parts[id(menu)] = (
+                    pygame.Rect(menu.position, menu.sprite.get_size()).move(
+                        -offset[0], -offset[1]
+                    ),
+                    object(),
+                )
+            else:
+                # Not placed yet, the whole screen is concerned
+                parts[id(menu)] = (self.active_screen_part.get_rect(), object())
+        return parts
+
+    @staticmethod
+    def _entity_state(entity: Entity) -> Hashable:
+        """
+        Return everything about the given entity that affects the way it is drawn.
+
+        Keyword arguments:
+        entity -- the entity concerned
+        """
+        return (
+            tuple(entity.position),
+            id(entity.sprite),
+            entity.hit_points if isinstance(entity, Destroyable) else None,
+            entity.state if isinstance(entity, Movable) else None,
+            tuple(map(id, entity.equipments)) if isinstance(entity, Character) else None,
+        )
+
+    def _draw(self) -> None:
+        """
+        Draw all the elements of the level, the animation or the menus on the screen.
+        """
+        if self.background is None:
+            self.background = self._draw_background()
+        map_area = pygame.Rect(
+            self.map["x"], self.map["y"], self.map["width"], self.map["height"]
+        )
+        self.active_screen_part.blit(self.background, map_area, map_area)
+        self.sidebar.display(
+            self.active_screen_part,
+            self.turn,
+            self.hovered_entity,
+            self.turn_planning.progress if self.turn_planning else None,
+        )
+
+        # Hit points of the breakables can change without their sprite being affected
+        for breakable in self.entities.breakables:
+            breakable.display_hit_points(self.active_screen_part)
+
+        for collection in self.entities.dynamic_values():
             for entity in collection:
                 entity.display(self.active_screen_part)
                 if isinstance(entity, Destroyable):
                     entity.display_hit_points(self.active_screen_part)
 
+        if int(options_manager.get_option("danger_zone")):
+            self.show_danger_zone(self.active_screen_part)
+
         if self.watched_entity:
             self.show_possible_actions(self.watched_entity, self.active_screen_part)
 
@@ -641,6 +871,29 @@ class LevelScene(Scene):
         else:
             self.menu_manager.display()
 
+    def _draw_background(self) -> pygame.Surface:
+        """
+        Draw the ground of the map, the objective tiles and all the entities that never move
+        on a surface the size of the level screen, so they are not drawn one by one at each frame.
+
+        Return the drawn surface.
+        """
+        background = pygame.Surface(self.active_screen_part.get_size()).convert()
+        background.blit(self.map["img"], (self.map["x"], self.map["y"]))
+        for mission in self.missions:
+            mission.display(background)
+        for collection in self.entities.static_values():
+            for entity in collection:
+                entity.display(background)
+        return background
+
+    def invalidate_background(self) -> None:
+        """
+        Have the background drawn again at next display, after one of the entities that never move
+        changed or disappeared.
+        """
+        self.background = None
+
     def show_possible_actions(self, movable: Movable, screen: pygame.Surface) -> None:
         """
         Display all the possible actions of the given movable entity
@@ -660,11 +913,9 @@ class LevelScene(Scene):
         movable -- the movable entity concerned
         screen -- the screen on which the possibilities should be drawn
         """
-        for tile in self.possible_attacks:
-            if movable.position != tile:
-                blit_alpha(
-                    screen, constant_sprites["attackable"], tile, ATTACKABLE_OPACITY
-                )
+        self.overlays["attacks"].display(
+            screen, (tile for tile in self.possible_attacks if movable.position != tile)
+        )
 
     def show_possible_moves(self, movable: Movable, screen: pygame.Surface) -> None:
         """
@@ -674,9 +925,9 @@ class LevelScene(Scene):
         movable -- the movable entity concerned
         screen -- the screen on which the possibilities should be drawn
         """
-        for tile in self.possible_moves:
-            if movable.position != tile:
-                blit_alpha(screen, constant_sprites["landing"], tile, LANDING_OPACITY)
+        self.overlays["moves"].display(
+            screen, (tile for tile in self.possible_moves if movable.position != tile)
+        )
 
     def show_possible_interactions(self, screen: pygame.Surface) -> None:
         """
@@ -685,10 +936,27 @@ class LevelScene(Scene):
         Keyword arguments:
         screen -- the screen on which the possibilities should be drawn
         """
-        for tile in self.possible_interactions:
-            blit_alpha(
-                screen, constant_sprites["interaction"], tile, INTERACTION_OPACITY
-            )
+        self.overlays["interactions"].display(screen, self.possible_interactions)
+
+    def update_danger_zone(self) -> set[Position]:
+        """
+        Return the tiles the foes could hit without moving,
+        computed again only if an entity moved, appeared or disappeared since the last call.
+        """
+        if self._danger_zone_version != self.occupancy.version:
+            foes = self.entities.foes
+            self.danger_zone = ThreatMap(foes, max_reach(foes)).danger_zone()
+            self._danger_zone_version = self.occupancy.version
+        return self.danger_zone
+
+    def show_danger_zone(self, screen: pygame.Surface) -> None:
+        """
+        Display the tiles the foes could hit without moving
+
+        Keyword arguments:
+        screen -- the screen on which the danger zone should be drawn
+        """
+        self.overlays["danger_zone"].display(screen, self.update_danger_zone())
 
     def show_possible_placements(self, screen: pygame.Surface) -> None:
         """
@@ -697,8 +965,7 @@ class LevelScene(Scene):
         Keyword arguments:
         screen -- the screen on which the possibilities should be drawn
         """
-        for tile in self.player_possible_placements:
-            blit_alpha(screen, constant_sprites["landing"], tile, LANDING_OPACITY)
+        self.overlays["placements"].display(screen, self.player_possible_placements)
 
     def start_game(self) -> None:
         """
@@ -718,6 +985,7 @@ class LevelScene(Scene):
                     player = loader.init_player(player_el["name"])
                     player.position = player_el["position"]
                     self.players.append(player)
+                self._build_occupancy_index()
 
     def get_next_cases(self, position: Position) -> list[Optional[Entity]]:
         """
@@ -736,36 +1004,36 @@ class LevelScene(Scene):
                 tiles_content.append(tile_content)
         return tiles_content
 
-    def get_possible_moves(
-        self, position: Position, max_moves: int
-    ) -> dict[Position, int]:
+    def get_possible_moves(self, position: Position, max_moves: int) -> PossibleMoves:
         """
-        Return all the possible moves with their distance from the starting position
+        Return all the possible moves with their distance from the starting position.
+        The returned moves also keep track of the path leading to each of them.
 
         Keyword arguments:
         position -- the starting position
         max_moves -- the maximum number of tiles that could be traveled
         """
-        new_position = Position(position.x, position.y)
-        tiles: dict[Position, int] = {new_position: 0}
-        previously_computed_tiles: dict[Position, int] = tiles
-        for i in range(1, max_moves + 1):
-            tiles_current_level: dict[Position, int] = {}
-            for tile in previously_computed_tiles:
-                for x_coordinate in range(-1, 2):
-                    for y_coordinate in (1 - abs(x_coordinate), -1 + abs(x_coordinate)):
-                        tile_x: int = tile[0] + (x_coordinate * TILE_SIZE)
-                        tile_y: int = tile[1] + (y_coordinate * TILE_SIZE)
-                        tile_position = Position(tile_x, tile_y)
-                        if (
-                            self.is_tile_available(tile_position)
-                            and tile_position not in tiles
-                        ):
-                            tiles_current_level[tile_position] = i
-            tiles.update(previously_computed_tiles)
-            previously_computed_tiles = tiles_current_level
-        tiles.update(previously_computed_tiles)
-        return tiles
+        return flood_fill(self.walkability, tile_coordinates(position), max_moves)
+
+    def get_path(
+        self, start: Position, destination: Position, max_cost: Optional[int] = None
+    ) -> Optional[tuple[list[Position], int]]:
+        """
+        Return the shortest path between two positions with its cost,
+        or None if there is no such path within the cost bound.
+        The destination may be occupied by an entity, in which case the path ends on it.
+
+        Keyword arguments:
+        start -- the starting position
+        destination -- the position of the destination
+        max_cost -- the maximum number of tiles that could be traveled, no limit if None
+        """
+        return find_path(
+            self.walkability,
+            tile_coordinates(start),
+            tile_coordinates(destination),
+            max_cost,
+        )
 
     def get_possible_attacks(
         self,
@@ -781,25 +1049,64 @@ class LevelScene(Scene):
         reach -- the reach of the attacking entity
         from_ally_side -- a boolean indicating whether this is a friendly attack or not
         """
-        tiles: list[Position] = []
-
         entities = list(self.entities.breakables)
         if from_ally_side:
             entities += self.entities.foes
         else:
             entities += self.entities.allies + self.players
 
-        for entity in entities:
-            for i in reach:
-                for x_coordinate in range(-i, i + 1):
-                    for y_coordinate in (i - abs(x_coordinate), -i + abs(x_coordinate)):
-                        tile_x: int = entity.position[0] + (x_coordinate * TILE_SIZE)
-                        tile_y: int = entity.position[1] + (y_coordinate * TILE_SIZE)
-                        tile_position = Position(tile_x, tile_y)
-                        if tile_position in possible_moves:
-                            tiles.append(entity.position)
+        origin = (self.walkability.origin_x, self.walkability.origin_y)
+        size = (self.walkability.width, self.walkability.height)
+        margin = max(reach, default=0)
+        moves_tiles = (
+            possible_moves.tiles()
+            if isinstance(possible_moves, PossibleMoves)
+            else (tile_coordinates(move) for move in possible_moves)
+        )
+        moves_mask = TileMask(origin, size, margin, moves_tiles)
+        targets_mask = TileMask(
+            origin,
+            size,
+            margin,
+            (tile_coordinates(entity.position) for entity in entities),
+        )
+        # Targets at one of the reach distances of at least one of the possible moves
+        attackable_mask = moves_mask.dilated(reach).intersection(targets_mask)
+        return {tile_position(tile) for tile in attackable_mask.tiles()}
+
+    def get_possible_actions(
+        self, entity: Movable, max_moves: int, from_ally_side: bool
+    ) -> tuple[PossibleMoves, frozenset[Position]]:
+        """
+        Return the possible moves and attacks of the given entity.
+        They are only computed again if the board or the entity changed since the last time.
 
-        return set([Position(i.x, i.y) for i in tiles])
+        Keyword arguments:
+        entity -- the entity whose possible actions should be computed
+        max_moves -- the maximum number of tiles that could be traveled by the entity
+        from_ally_side -- a boolean indicating whether the entity is on the side of the players or not
+        """
+        can_attack = entity.can_attack()
+        parameters = (
+            tile_coordinates(entity.position),
+            max_moves,
+            tuple(entity.reach),
+            can_attack,
+            from_ally_side,
+        )
+        possible_actions = self.ranges.get(entity, parameters)
+        if possible_actions is None:
+            possible_moves = self.get_possible_moves(entity.position, max_moves)
+            possible_attacks: frozenset[Position] = frozenset()
+            if can_attack:
+                possible_attacks = frozenset(
+                    self.get_possible_attacks(
+                        possible_moves, entity.reach, from_ally_side
+                    )
+                )
+            possible_actions = (possible_moves, possible_attacks)
+            self.ranges.store(entity, parameters, *possible_actions)
+        return possible_actions
 
     def is_tile_available(self, tile: Position) -> bool:
         """
@@ -808,25 +1115,7 @@ class LevelScene(Scene):
         Keyword arguments:
         tile -- the position of the tile
         """
-        min_case: Position = Position(self.map["x"], self.map["y"])
-        max_case: Position = Position(
-            self.map["x"] + self.map["width"],
-            self.map["y"] + self.map["height"],
-        )
-        if not (
-            all(
-                minimum <= case < maximum
-                for minimum, case, maximum in zip(min_case, tile, max_case)
-            )
-        ):
-            return False
-
-        entity_on_tile = self.get_entity_on_tile(tile)
-        if isinstance(entity_on_tile, Objective):
-            if entity_on_tile.is_walkable:
-                return True
-
-        return entity_on_tile is None
+        return self.walkability.is_walkable(tile_coordinates(tile))
 
     def get_entity_on_tile(self, tile: Position) -> Optional[Entity]:
         """
@@ -835,35 +1124,20 @@ class LevelScene(Scene):
         Keyword arguments:
         tile -- the position of the tile
         """
-        # Check all entities
-        for collection in self.entities.values():
-            for entity in collection:
-                if entity.position == tile:
-                    return entity
-        return None
+        return self.occupancy.get(tile_coordinates(tile))
 
+    @staticmethod
     def determine_path_to(
-        self, destination_tile: Position, distance_for_tile: dict[Position, int]
+        destination_tile: Position, possible_moves: PossibleMoves
     ) -> list[Position]:
         """
         Return an ordered list of position that represent the path from one tile to another
 
         Keyword arguments:
         destination_tile -- the position of the destination
-        distance -- the distance between the starting tile and the destination
-        """
-        path: list[Position] = [destination_tile]
-        current_tile: Position = destination_tile
-        while distance_for_tile[current_tile] > 1:
-            # Check for neighbour cases
-            available_tiles: dict[Position, int] = self.get_possible_moves(current_tile, 1)
-            for tile in available_tiles:
-                if tile in distance_for_tile:
-                    distance = distance_for_tile[tile]
-                    if distance < distance_for_tile[current_tile]:
-                        current_tile = tile
-                        path.insert(0, current_tile)
-        return path
+        possible_moves -- the possible moves computed from the starting tile, including the destination
+        """
+        return possible_moves.path_to(destination_tile)
 
     def distance_between_all(
         self, entity: Entity, all_other_entities: Sequence
@@ -875,22 +1149,11 @@ class LevelScene(Scene):
         entity -- the entity for which the distance from all other entities should be computed
         all_other_entities -- all other entities for which the distance should be computed
         """
-        free_tiles_distance: dict[Position, int] = self.get_possible_moves(
-            entity.position,
-            (self.map["width"] * self.map["height"]) // (TILE_SIZE * TILE_SIZE),
+        return self.distance_fields.distances_from(
+            tile_coordinates(entity.position),
+            all_other_entities,
+            self.map["width"] * self.map["height"],
         )
-        entities_distance: dict[Entity, int] = {
-            entity: self.map["width"] * self.map["height"]
-            for entity in all_other_entities
-        }
-        for tile, distance in free_tiles_distance.items():
-            for neighbour in self.get_next_cases(tile):
-                if (
-                    neighbour in all_other_entities
-                    and distance < entities_distance[neighbour]
-                ):
-                    entities_distance[neighbour] = distance
-        return entities_distance
 
     def open_chest(self, actor: Character, chest: Chest) -> None:
         """
@@ -902,6 +1165,7 @@ class LevelScene(Scene):
         """
         # Get object inside the chest
         item = chest.open()
+        self.invalidate_background()
 
         if isinstance(item, Gold):
             # If it was some gold, it should be added to the total amount of the player
@@ -954,6 +1218,8 @@ class LevelScene(Scene):
         door -- the door that should be opened
         """
         self.entities.doors.remove(door)
+        self.occupancy.remove(door)
+        self.invalidate_background()
 
         # TODO: move the creation of the pop-up in menu_creator_manager
         grid_element = [
@@ -998,6 +1264,7 @@ class LevelScene(Scene):
         player.hit_points = character.hit_points
         player.position = character.position
         player.items = character.items
+        self._build_occupancy_index()
 
     def interact(
         self, actor: Character, target: Entity, target_position: Position
@@ -1021,6 +1288,7 @@ class LevelScene(Scene):
             if self.wait_for_teleportation_destination:
                 self.wait_for_teleportation_destination = False
                 actor.position = target_position
+                self.occupancy.update(actor)
 
                 # Turn is finished
                 self.end_active_character_turn()
@@ -1096,13 +1364,15 @@ class LevelScene(Scene):
         # Check if player tries to use a portal
         elif isinstance(target, Portal):
             new_based_position: Position = target.linked_to.position
-            possible_positions_with_distance: dict[
-                Position, int
-            ] = self.get_possible_moves(new_based_position, 1)
+            possible_moves: PossibleMoves = self.get_possible_moves(
+                new_based_position, 1
+            )
             # Remove portal pos since player cannot be on the portal
-            del possible_positions_with_distance[new_based_position]
-            if possible_positions_with_distance:
-                self.possible_interactions = possible_positions_with_distance.keys()
+            free_positions: list[Position] = [
+                position for position in possible_moves if position != new_based_position
+            ]
+            if free_positions:
+                self.possible_interactions = free_positions
                 self.wait_for_teleportation_destination = True
             else:
                 self.menu_manager.open_menu(
@@ -1115,6 +1385,8 @@ class LevelScene(Scene):
         # Check if player tries to drink in a fountain
         elif isinstance(target, Fountain):
             element_grid = target.drink(actor)
+            # The fountain may be empty now
+            self.invalidate_background()
             self.menu_manager.open_menu(
                 InfoBox(
                     str(target),
@@ -1185,9 +1457,12 @@ class LevelScene(Scene):
             collection = self.entities.players
         elif isinstance(entity, Breakable):
             collection = self.entities.breakables
+            self.invalidate_background()
         elif isinstance(entity, Character):
             collection = self.entities.allies
         collection.remove(entity)
+        self.occupancy.remove(entity)
+        self.distance_fields.forget(entity)
 
     def duel(
         self,
@@ -1319,33 +1594,88 @@ class LevelScene(Scene):
 
     def process_entity_action(self, entity: Movable, is_ally: bool) -> None:
         """
-        Compute the action of a non-playable entity (AI)
+        Play the next step of the action planned for a non-playable entity (AI)
+
+        Nothing is done while the plan of the turn is being computed,
+        the plan being taken into account by the first call following the end of the planning.
 
         Keyword arguments:
-        entity -- the entity for which the action should be computed
+        entity -- the entity whose action should be played
         is_ally -- a boolean indicating if the entity is an ally or not
         """
-        possible_moves: dict[Position, int] = self.get_possible_moves(
-            entity.position, entity.max_moves
-        )
-        targets: Sequence[Movable] = (
-            self.entities.foes if is_ally else self.players + self.entities.allies
-        )
-        tile: Optional[Position] = entity.act(
-            possible_moves, self.distance_between_all(entity, targets)
-        )
-
-        if tile:
-            if tuple(tile) in possible_moves:
-                # Entity choose to move to case
-                self.hovered_entity = entity
-                path = self.determine_path_to(tile, possible_moves)
-                entity.set_move(path)
-            else:
-                # Entity choose to attack the entity on the tile
-                entity_attacked = self.get_entity_on_tile(tile)
+        if self.turn_planning is not None:
+            if not self.turn_planning.update():
+                return
+            self.turn_plan = self.turn_planning.result()
+            self.turn_planning = None
+
+        targets: Sequence[Movable] = self.get_targets(is_ally)
+        if entity.state is EntityState.HAVE_TO_ACT:
+            planned_action = self.turn_plan.get(entity)
+            if planned_action is None or not planned_action.is_valid(targets):
+                # Someone died since the beginning of the turn, plan again for the entities left
+                side = self.entities.allies if is_ally else self.entities.foes
+                self.start_turn_planning(
+                    [other for other in side if not other.turn_is_finished()], is_ally
+                )
+                return
+            self.hovered_entity = entity
+            entity.target = planned_action.move_target
+            entity.set_move(planned_action.path)
+        elif entity.state is EntityState.ON_MOVE:
+            entity.move()
+            self.occupancy.update(entity)
+        elif entity.state is EntityState.HAVE_TO_ATTACK:
+            planned_action = self.turn_plan.pop(entity, None)
+            entity_attacked: Optional[Entity] = None
+            if planned_action is not None and planned_action.attack_target in targets:
+                entity_attacked = planned_action.attack_target
+            elif entity.can_attack():
+                attack_position = entity.determine_attack(targets)
+                if attack_position is not None:
+                    entity_attacked = self.get_entity_on_tile(attack_position)
+            if entity_attacked is not None and entity.can_attack():
                 self.duel(entity, entity_attacked, targets, entity.attack_kind)
-                entity.end_turn()
+            entity.end_turn()
+
+    def get_targets(self, is_ally: bool) -> list[Movable]:
+        """
+        Return the entities that can be attacked by the non-playable entities of a side
+
+        Keyword arguments:
+        is_ally -- a boolean indicating if the side is the one of the allies or not
+        """
+        if is_ally:
+            return self.entities.foes
+        return self.players + self.entities.allies
+
+    def start_turn_planning(self, entities: Sequence[Movable], is_ally: bool) -> None:
+        """
+        Start planning the actions of the given non-playable entities,
+        all of them being planned at once on a snapshot of the current state of the level.
+        Depending on the options, the planning runs in the background or within a time budget at each frame.
+        The previous plan is dropped.
+
+        Keyword arguments:
+        entities -- the entities of the side, in the order in which they will act
+        is_ally -- a boolean indicating if the entities are allies or not
+        """
+        self.turn_plan = {}
+        self.turn_planning = None
+        if entities:
+            board = PlanningBoard(
+                self.walkability, self.map["width"] * self.map["height"]
+            )
+            has_tactical_entities = any(
+                entity.strategy is EntityStrategy.TACTICAL for entity in entities
+            )
+            self.turn_planning = TurnPlanning(
+                board,
+                entities,
+                self.get_targets(is_ally),
+                int(options_manager.get_option("ai_planning_budget")),
+                evaluation_pool() if has_tactical_entities else None,
+            )
 
     def interact_item_shop(self, item: Item, item_button: Button) -> None:
         """
@@ -1444,6 +1774,7 @@ class LevelScene(Scene):
                     if mission.is_position_valid(self.selected_player.position):
                         mission.update_state(self.selected_player)
                         self.players.remove(self.selected_player)
+                        self.occupancy.remove(self.selected_player)
                         self.escaped_players.append(self.selected_player)
                         if mission.main and mission.ended:
                             self.victory = True
@@ -1557,8 +1888,8 @@ class LevelScene(Scene):
         self.selected_player = None
         self.traded_items.clear()
         self.traded_gold.clear()
-        self.possible_moves.clear()
-        self.possible_attacks.clear()
+        self.possible_moves = {}
+        self.possible_attacks = []
         self.possible_interactions.clear()
         if clear_menus:
             self.menu_manager.clear_menus()
@@ -2024,6 +2355,11 @@ class LevelScene(Scene):
         for entity in entities:
             entity.new_turn()
 
+        if self.side_turn is EntityTurn.PLAYER:
+            self.turn_plan = {}
+        else:
+            self.start_turn_planning(entities, self.side_turn is EntityTurn.ALLIES)
+
     def new_turn(self) -> None:
         """
         Begin of a new turn
@@ -2107,8 +2443,10 @@ class LevelScene(Scene):
                         entity = self.get_entity_on_tile(tile)
                         if entity:
                             entity.set_initial_pos(self.selected_player.position)
+                            self.occupancy.update(entity)
 
                         self.selected_player.set_initial_pos(tile)
+                        self.occupancy.update(self.selected_player)
                         return
             return
         for player in self.players:
@@ -2126,16 +2464,13 @@ class LevelScene(Scene):
                 else:
                     player.selected = True
                     self.selected_player = player
-                    self.possible_moves = self.get_possible_moves(
-                        player.position,
+                    (
+                        self.possible_moves,
+                        self.possible_attacks,
+                    ) = self.get_possible_actions(
+                        player,
                         player.max_moves + player.get_stat_change("speed"),
-                    )
-                    self.possible_attacks = (
-                        self.get_possible_attacks(
-                            self.possible_moves, self.selected_player.reach, True
-                        )
-                        if player.can_attack()
-                        else {}
+                        True,
                     )
                 return
         for entity in self.entities.foes + self.entities.allies:
@@ -2183,6 +2518,7 @@ class LevelScene(Scene):
                 # current move should be cancelled if possible
                 if self.menu_manager.active_menu.identifier == CHARACTER_ACTION_MENU_ID:
                     if self.selected_player.cancel_move():
+                        self.occupancy.update(self.selected_player)
                         if self.traded_items:
                             # Return traded items
                             for item in self.traded_items:
@@ -2270,17 +2606,14 @@ class LevelScene(Scene):
                             entity, Movable
                         ) and entity.get_rect().collidepoint(position_inside_level):
                             self.watched_entity = entity
-                            self.possible_moves = self.get_possible_moves(
-                                entity.position, entity.max_moves
+                            (
+                                self.possible_moves,
+                                self.possible_attacks,
+                            ) = self.get_possible_actions(
+                                entity,
+                                entity.max_moves,
+                                isinstance(entity, Character),
                             )
-                            reach: Sequence[int] = self.watched_entity.reach
-                            self.possible_attacks = {}
-                            if entity.can_attack():
-                                self.possible_attacks = self.get_possible_attacks(
-                                    self.possible_moves,
-                                    reach,
-                                    isinstance(entity, Character),
-                                )
                             return
 
     def key_down(self, keyname):
@@ -4,10 +4,13 @@ Define Scene class, the abstract base class for any other scene.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from enum import IntEnum, auto
+from typing import Optional
 
 import pygame
 
+from src.constants import BLACK
 from src.gui.position import Position
 
 
@@ -43,6 +46,23 @@ class Scene:
         """
         pass
 
+    def display_changes(
+        self, areas: Sequence[pygame.Rect]
+    ) -> Optional[list[pygame.Rect]]:
+        """
+        Display again the parts of the scene that changed since the last display,
+        along with the given areas of the screen.
+        Scenes not keeping track of their changes display everything again.
+
+        Return the areas of the screen that have been drawn, or None if the whole screen has.
+
+        Keyword arguments:
+        areas -- the areas of the screen that should be drawn again anyway
+        """
+        self.screen.fill(BLACK)
+        self.display()
+        return None
+
     def update_state(self) -> bool:
         """
         Take care of updating the state of the scene and returning whether it's finished or not.
@@ -17,6 +17,7 @@ from src.game_entities.movable import Movable
 from src.game_entities.player import Player
 from src.gui.fonts import fonts
 from src.gui.position import Position
+from src.gui.sprite_registry import get_sprite
 from src.scenes.level_scene import LevelScene, LevelStatus
 from src.scenes.scene import QuitActionKind, Scene
 from src.services import menu_creator_manager
@@ -49,11 +50,8 @@ class StartScene(Scene):
         self.menu_screen: pygame.Surface = self.screen.copy()
 
         # Start screen loop
-        background_image: pygame.Surface = pygame.image.load(
-            "imgs/interface/main_menu_background.jpg"
-        ).convert_alpha()
-        self.background: pygame.Surface = pygame.transform.scale(
-            background_image, screen.get_size()
+        self.background: pygame.Surface = get_sprite(
+            "imgs/interface/main_menu_background.jpg", screen.get_size()
         )
 
         self.menu_manager = MenuManager(screen)
@@ -211,6 +209,13 @@ class StartScene(Scene):
                     "language": str(options_manager.get_option("language")),
                     "move_speed": int(options_manager.get_option("move_speed")),
                     "screen_size": int(options_manager.get_option("screen_size")),
+                    "ai_planning_budget": int(
+                        options_manager.get_option("ai_planning_budget")
+                    ),
+                    "danger_zone": int(options_manager.get_option("danger_zone")),
+                    "dirty_rendering": int(
+                        options_manager.get_option("dirty_rendering")
+                    ),
                 },
                 self.modify_option_value,
             )
@@ -245,6 +250,12 @@ class StartScene(Scene):
             Movable.move_speed = option_value
         elif option_name == "screen_size":
             StartScene.screen_size = option_value
+        elif option_name == "ai_planning_budget":
+            # Read again at the beginning of each turn of the AI
+            pass
+        elif option_name in ("danger_zone", "dirty_rendering"):
+            # Read again at each frame
+            pass
         else:
             print(f"Unrecognized option name : {option_name} with value {option_value}")
             return
@@ -0,0 +1,304 @@
+"""
+Defines DistanceField class, the distance from every tile of a level to a given entity,
+and DistanceFields class, the cache of these fields shared by all the entities controlled by the AI.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+from src.game_entities.entity import Entity
+from src.services.tiles import NEIGHBOUR_OFFSETS, tile_coordinates
+from src.services.walkability_grid import WalkabilityGrid
+
+UNREACHABLE = -1
+# Above this share of changed tiles, computing the distances from scratch is cheaper than repairing them
+REPAIR_LIMIT_RATIO = 0.25
+
+
+def indexes_around(
+    walkability: WalkabilityGrid, tile: tuple[int, int]
+) -> frozenset[int]:
+    """
+    Return the indexes of the tiles of the map next to the given one.
+
+    Keyword arguments:
+    walkability -- the grid in which the indexes are computed
+    tile -- the coordinates of the tile
+    """
+    indexes = (
+        walkability.index((tile[0] + offset_x, tile[1] + offset_y))
+        for offset_x, offset_y in NEIGHBOUR_OFFSETS
+    )
+    return frozenset(index for index in indexes if index is not None)
+
+
+class DistanceField:
+    """
+    A DistanceField gives, for every tile of the map, the number of tiles that should be crossed
+    from this tile to stand next to a target tile.
+
+    It is computed by a single breadth-first search starting from all the tiles around the target,
+    so any number of entities can then query their own distance to the target without any new search.
+    When a few tiles change afterwards (an entity moving, a door being opened...), only the distances
+    depending on these tiles are repaired, in the spirit of Lifelong Planning A*.
+
+    Keyword arguments:
+    walkability -- the grid telling which tiles can be crossed
+    target_tile -- the coordinates of the tile of the target
+
+    Attributes:
+    walkability -- the grid telling which tiles can be crossed
+    target_tile -- the coordinates of the tile of the target
+    goals -- the indexes of the tiles around the target, from which the target can be reached
+    distances -- the distance of each tile of the map to the goals, by tile index,
+    UNREACHABLE if there is no path
+    version -- the version of the walkability grid for which the distances have been computed
+    """
+
+    def __init__(
+        self, walkability: WalkabilityGrid, target_tile: tuple[int, int]
+    ) -> None:
+        self.walkability: WalkabilityGrid = walkability
+        self.target_tile: tuple[int, int] = target_tile
+        self.goals: frozenset[int] = indexes_around(walkability, target_tile)
+        self.distances: list[int] = []
+        self.version: int = -1
+        self.compute()
+
+    def compute(self) -> None:
+        """
+        Compute the distances from scratch according to the current walkability of the map.
+        """
+        walkable = self.walkability.walkable
+        neighbours = self.walkability.neighbours
+        distances = [UNREACHABLE] * len(walkable)
+        frontier: deque[int] = deque()
+        for goal in self.goals:
+            if walkable[goal]:
+                distances[goal] = 0
+                frontier.append(goal)
+        while frontier:
+            index = frontier.popleft()
+            distance = distances[index] + 1
+            for neighbour in neighbours[index]:
+                if walkable[neighbour] and distances[neighbour] == UNREACHABLE:
+                    distances[neighbour] = distance
+                    frontier.append(neighbour)
+        self.distances = distances
+        self.version = self.walkability.version
+
+    def refresh(self, target_tile: tuple[int, int]) -> None:
+        """
+        Bring the distances up to date with the current walkability of the map and the given target tile,
+        repairing only the distances affected by the tiles that changed since the last update.
+
+        Keyword arguments:
+        target_tile -- the current coordinates of the tile of the target
+        """
+        if target_tile == self.target_tile and not self.is_outdated():
+            return
+        changed_indexes = self.walkability.changes_since(self.version)
+        if (
+            changed_indexes is None
+            or len(changed_indexes) > len(self.distances) * REPAIR_LIMIT_RATIO
+        ):
+            self.target_tile = target_tile
+            self.goals = indexes_around(self.walkability, target_tile)
+            self.compute()
+            return
+        changed = set(changed_indexes)
+        if target_tile != self.target_tile:
+            goals = indexes_around(self.walkability, target_tile)
+            changed |= self.goals ^ goals
+            self.target_tile = target_tile
+            self.goals = goals
+        self.repair(changed)
+        self.version = self.walkability.version
+
+    def repair(self, changed: Iterable[int]) -> None:
+        """
+        Update the distances after the walkability or the goal status of the given tiles changed.
+
+        The distances that may have increased are first invalidated, going away from the changed tiles
+        as long as tiles lose every neighbour through which they were reaching the goals.
+        The invalidated and changed tiles are then given back their best distance from their neighbours,
+        and any improvement is propagated in order of distance.
+
+        Keyword arguments:
+        changed -- the indexes of the tiles that changed
+        """
+        walkable = self.walkability.walkable
+        neighbours = self.walkability.neighbours
+        distances = self.distances
+        changed = list(changed)
+
+        # Invalidate the distances that were depending on the changed tiles
+        raised: list[tuple[int, int]] = []
+        for index in changed:
+            if distances[index] != UNREACHABLE:
+                raised.append((distances[index], index))
+                distances[index] = UNREACHABLE
+        heapq.heapify(raised)
+        invalidated: set[int] = set()
+        while raised:
+            distance, index = heapq.heappop(raised)
+            if distances[index] == distance:
+                if self._has_support(index, distance):
+                    continue
+                distances[index] = UNREACHABLE
+            elif index in invalidated:
+                continue
+            invalidated.add(index)
+            for neighbour in neighbours[index]:
+                if distances[neighbour] == distance + 1:
+                    heapq.heappush(raised, (distance + 1, neighbour))
+
+        # Give back to each affected tile its best distance and propagate the improvements
+        lowered: list[tuple[int, int]] = []
+        for index in invalidated.union(changed):
+            if not walkable[index]:
+                continue
+            distance = self._best_distance(index)
+            if distance is not None and (
+                distances[index] == UNREACHABLE or distance < distances[index]
+            ):
+                distances[index] = distance
+                lowered.append((distance, index))
+        heapq.heapify(lowered)
+        while lowered:
+            distance, index = heapq.heappop(lowered)
+            if distances[index] != distance:
+                continue
+            for neighbour in neighbours[index]:
+                if walkable[neighbour] and (
+                    distances[neighbour] == UNREACHABLE
+                    or distances[neighbour] > distance + 1
+                ):
+                    distances[neighbour] = distance + 1
+                    heapq.heappush(lowered, (distance + 1, neighbour))
+
+    def _has_support(self, index: int, distance: int) -> bool:
+        """
+        Return whether the given tile still has a neighbour through which it is at the given distance.
+        """
+        if distance == 0:
+            return index in self.goals
+        return any(
+            self.distances[neighbour] == distance - 1
+            for neighbour in self.walkability.neighbours[index]
+        )
+
+    def _best_distance(self, index: int) -> Optional[int]:
+        """
+        Return the best distance of the given tile according to its neighbours,
+        or None if none of them can reach the goals.
+        """
+        if index in self.goals:
+            return 0
+        best: Optional[int] = None
+        for neighbour in self.walkability.neighbours[index]:
+            distance = self.distances[neighbour]
+            if distance != UNREACHABLE and (best is None or distance + 1 < best):
+                best = distance + 1
+        return best
+
+    def is_outdated(self) -> bool:
+        """
+        Return whether the walkability of the map changed since the distances have been computed.
+        """
+        return self.version != self.walkability.version
+
+    def distance_from(self, tile: tuple[int, int]) -> Optional[int]:
+        """
+        Return the number of tiles that an entity standing on the given tile should cross
+        to stand next to the target, or None if the target cannot be reached.
+
+        The tile of the entity itself is not expected to be walkable since the entity is standing on it.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile of the entity
+        """
+        index = self.walkability.index(tile)
+        if index is None:
+            return None
+        return self._best_distance(index)
+
+
+class DistanceFields:
+    """
+    DistanceFields keeps the distance field leading to each target entity of the level, so all
+    the entities of one side can share them during their turn instead of each one running its own search.
+
+    A field is only refreshed when it is requested while the target moved or the walkability of the map
+    changed since its last update, and then only the affected distances are repaired.
+
+    Keyword arguments:
+    walkability -- the grid telling which tiles can be crossed
+
+    Attributes:
+    walkability -- the grid telling which tiles can be crossed
+    _fields -- the distance field leading to each target, by target id
+    """
+
+    def __init__(self, walkability: WalkabilityGrid) -> None:
+        self.walkability: WalkabilityGrid = walkability
+        self._fields: dict[int, DistanceField] = {}
+
+    def field_to(self, target: Entity) -> DistanceField:
+        """
+        Return the up-to-date distance field leading to the given target.
+
+        Keyword arguments:
+        target -- the entity that should be reached
+        """
+        target_tile = tile_coordinates(target.position)
+        field = self._fields.get(id(target))
+        if field is None:
+            field = DistanceField(self.walkability, target_tile)
+            self._fields[id(target)] = field
+        else:
+            field.refresh(target_tile)
+        return field
+
+    def prepare(self, targets: Iterable[Entity]) -> None:
+        """
+        Make sure the distance fields leading to all the given targets are up-to-date.
+        Should be called at the beginning of a side turn for the opponents of this side.
+
+        Keyword arguments:
+        targets -- the entities that will be targeted
+        """
+        for target in targets:
+            self.field_to(target)
+
+    def forget(self, target: Entity) -> None:
+        """
+        Drop the distance field leading to the given target if there is any.
+
+        Keyword arguments:
+        target -- the entity that will no longer be targeted
+        """
+        self._fields.pop(id(target), None)
+
+    def distances_from(
+        self, tile: tuple[int, int], targets: Sequence[Entity], unreachable_distance: int
+    ) -> dict[Entity, int]:
+        """
+        Return the distance between the given tile and each target.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile of the entity for which the distances should be computed
+        targets -- the entities for which the distance should be computed
+        unreachable_distance -- the value given to the targets that cannot be reached
+        """
+        targets_distance: dict[Entity, int] = {}
+        for target in targets:
+            distance = self.field_to(target).distance_from(tile)
+            targets_distance[target] = (
+                unreachable_distance if distance is None else distance
+            )
+        return targets_distance
@@ -22,6 +22,7 @@ from src.game_entities.player import Player
 from src.game_entities.portal import Portal
 from src.game_entities.shop import Shop
 from src.gui.position import Position
+from src.gui.sprite_registry import scale_sprite
 from src.services import load_from_xml_manager as xml_loader
 from src.services.global_foes import foes_by_mission, link_foe_to_mission
 
@@ -41,12 +42,22 @@ def load_ground(tmx_data: pytmx.TiledMap, size: tuple[int, int]) -> pygame.Surfa
     for x, y, gid in tmx_data.get_layer_by_name("ground"):
         tile = tmx_data.get_tile_image_by_gid(gid)
         map_ground.blit(
-            pygame.transform.scale(tile, (TILE_SIZE, TILE_SIZE)),
+            scale_sprite(tile),
             (x * TILE_SIZE, y * TILE_SIZE),
         )
     return map_ground
 
 
+def load_walkable_tiles(tmx_data: pytmx.TiledMap) -> bytearray:
+    walkable_tiles = bytearray(b"\x01") * (tmx_data.width * tmx_data.height)
+    for x, y, gid in tmx_data.get_layer_by_name("obstacles"):
+        tile = tmx_data.get_tile_properties_by_gid(gid)
+        if tile and tile["type"] == "void":
+            continue
+        walkable_tiles[y * tmx_data.width + x] = 0
+    return walkable_tiles
+
+
 def load_obstacles(
         tmx_data: pytmx.TiledMap, horizontal_gap: int, vertical_gap: int
 ) -> list[Obstacle]:
@@ -55,9 +66,7 @@ def load_obstacles(
         tile = tmx_data.get_tile_properties_by_gid(gid)
         if tile and tile["type"] == "void":
             continue
-        obstacle_image = pygame.transform.scale(
-            tmx_data.get_tile_image_by_gid(gid), (TILE_SIZE, TILE_SIZE)
-        )
+        obstacle_image = scale_sprite(tmx_data.get_tile_image_by_gid(gid))
         position = Position(x * TILE_SIZE + horizontal_gap, y * TILE_SIZE + vertical_gap)
         obstacles.append(Obstacle(position, obstacle_image))
     return obstacles
@@ -72,9 +81,7 @@ def _link_objective_to_mission(objective: Objective, mission_id: str) -> None:
 def _load_objectives(tmx_data, horizontal_gap, vertical_gap) -> None:
     for tile_object in tmx_data.get_layer_by_name("dynamic_data"):
         if tile_object.type == "objective":
-            objective_image = pygame.transform.scale(
-                tile_object.image, (TILE_SIZE, TILE_SIZE)
-            )
+            objective_image = scale_sprite(tile_object.image)
             position = _get_object_position(tile_object, horizontal_gap, vertical_gap)
             mission_id = tile_object.properties["mission"]
             walkable = tile_object.properties["walkable"]
@@ -221,7 +228,7 @@ def load_chests(
     for tile_object in tmx_data.get_layer_by_name("dynamic_data"):
         if tile_object.type == "chest":
             position = _get_object_position(tile_object, horizontal_gap, vertical_gap)
-            image = pygame.transform.scale(tile_object.image, (TILE_SIZE, TILE_SIZE))
+            image = scale_sprite(tile_object.image)
             content_possibilities = []
             for index in range(tile_object.properties["content_possibilities"]):
                 item = xml_loader.parse_item_file(
@@ -313,7 +320,7 @@ def load_buildings(
     for tile_object in tmx_data.get_layer_by_name("dynamic_data"):
         if tile_object.type == "building":
             position = _get_object_position(tile_object, horizontal_gap, vertical_gap)
-            image = pygame.transform.scale(tile_object.image, (TILE_SIZE, TILE_SIZE))
+            image = scale_sprite(tile_object.image)
             interaction: Optional[dict[str, any]] = {}
             dialog_ids: Optional[Sequence[str]] = (
                 tile_object.properties["house_dialogs"].split(",")
@@ -399,7 +406,7 @@ def load_doors(
     for tile_object in tmx_data.get_layer_by_name("dynamic_data"):
         if tile_object.type == "door":
             position = _get_object_position(tile_object, horizontal_gap, vertical_gap)
-            image = pygame.transform.scale(tile_object.image, (TILE_SIZE, TILE_SIZE))
+            image = scale_sprite(tile_object.image)
             doors.append(
                 Door(position, tile_object.properties["sprite_link"], sprite=image)
             )
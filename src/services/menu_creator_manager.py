@@ -12,9 +12,9 @@ from pygamepopup.components import (BoxElement, Button, DynamicButton, InfoBox,
                                     TextElement)
 from pygamepopup.components.image_button import ImageButton
 
-from src.constants import (ACTION_MENU_WIDTH, ANIMATION_SPEED,
-                           BATTLE_SUMMARY_WIDTH, BLACK, DARK_GREEN,
-                           DIALOG_WIDTH, EQUIPMENT_MENU_WIDTH,
+from src.constants import (ACTION_MENU_WIDTH, AI_PLANNING_BUDGET,
+                           ANIMATION_SPEED, BATTLE_SUMMARY_WIDTH, BLACK,
+                           DARK_GREEN, DIALOG_WIDTH, EQUIPMENT_MENU_WIDTH,
                            FOE_STATUS_MENU_WIDTH, GOLD, GREEN,
                            ITEM_BUTTON_SIZE, ITEM_INFO_MENU_WIDTH,
                            ITEM_MENU_WIDTH, ORANGE, REWARD_MENU_WIDTH,
@@ -1351,6 +1351,39 @@ def create_options_menu(
                     lambda value: modify_option_function("screen_size", value),
                 ),
             ],
+            [
+                load_parameter_button(
+                    STR_AI_PLANNING_,
+                    [
+                        {"label": STR_IN_BACKGROUND, "value": 0},
+                        {"label": STR_EACH_FRAME, "value": AI_PLANNING_BUDGET},
+                    ],
+                    parameters["ai_planning_budget"],
+                    lambda value: modify_option_function("ai_planning_budget", value),
+                ),
+            ],
+            [
+                load_parameter_button(
+                    STR_DANGER_ZONE_,
+                    [
+                        {"label": STR_HIDDEN, "value": 0},
+                        {"label": STR_SHOWN, "value": 1},
+                    ],
+                    parameters["danger_zone"],
+                    lambda value: modify_option_function("danger_zone", value),
+                ),
+            ],
+            [
+                load_parameter_button(
+                    STR_RENDERING_,
+                    [
+                        {"label": STR_WHOLE_SCREEN, "value": 0},
+                        {"label": STR_CHANGES_ONLY, "value": 1},
+                    ],
+                    parameters["dirty_rendering"],
+                    lambda value: modify_option_function("dirty_rendering", value),
+                ),
+            ],
         ],
         width=START_MENU_WIDTH,
     )
@@ -0,0 +1,134 @@
+"""
+Defines OccupancyGrid class, the index of the entities of a level by the tile they are standing on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+from src.game_entities.entity import Entity
+from src.game_entities.objective import Objective
+from src.game_entities.obstacle import Obstacle
+from src.services.tiles import tile_coordinates
+from src.services.walkability_grid import WalkabilityGrid
+
+
+def is_blocking(entity: Entity) -> bool:
+    """
+    Return whether the given entity prevents movable entities from crossing its tile.
+    Obstacles are not considered since they are already part of the static walkability of the map.
+
+    Keyword arguments:
+    entity -- the entity to be checked
+    """
+    if isinstance(entity, Obstacle):
+        return False
+    if isinstance(entity, Objective):
+        return not entity.is_walkable
+    return True
+
+
+class OccupancyGrid:
+    """
+    An OccupancyGrid keeps track of which entities are standing on which tile so the level
+    does not have to scan every entity collection to know what is on a given tile.
+
+    Several entities may share the same tile (a player standing on a walkable objective for example),
+    in that case the entity coming from the collection with the highest priority is returned first,
+    priorities being given by the order of the collections at build time.
+
+    Keyword arguments:
+    walkability -- the walkability grid whose dynamic overlay should follow the blocking entities if any
+
+    Attributes:
+    walkability -- the walkability grid whose dynamic overlay should follow the blocking entities if any
+    version -- a counter increased each time an entity is added, moved or removed
+    _entities_by_tile -- the entities standing on each tile, sorted by priority
+    _tile_by_entity -- the tile on which each indexed entity is standing, by entity id
+    _priority_by_entity -- the priority of each indexed entity, by entity id
+    """
+
+    def __init__(self, walkability: Optional[WalkabilityGrid] = None) -> None:
+        self.walkability: Optional[WalkabilityGrid] = walkability
+        self.version: int = 0
+        self._entities_by_tile: dict[tuple[int, int], list[Entity]] = {}
+        self._tile_by_entity: dict[int, tuple[int, int]] = {}
+        self._priority_by_entity: dict[int, int] = {}
+
+    def rebuild(self, collections: Iterable[Sequence[Entity]]) -> None:
+        """
+        Forget the current content of the grid and index all the given entities.
+
+        Keyword arguments:
+        collections -- the ordered collections of entities, the first ones having the highest priority
+        """
+        self._entities_by_tile.clear()
+        self._tile_by_entity.clear()
+        self._priority_by_entity.clear()
+        self.version += 1
+        if self.walkability:
+            self.walkability.clear_blockers()
+        for priority, collection in enumerate(collections):
+            for entity in collection:
+                self._priority_by_entity[id(entity)] = priority
+                self._insert(entity, tile_coordinates(entity.position))
+
+    def update(self, entity: Entity) -> None:
+        """
+        Move the given entity to the tile matching its current position if it has changed.
+        Entities that are not indexed are ignored.
+
+        Keyword arguments:
+        entity -- the entity that may have moved
+        """
+        previous_tile = self._tile_by_entity.get(id(entity))
+        if previous_tile is None:
+            return
+        tile = tile_coordinates(entity.position)
+        if tile != previous_tile:
+            self._discard(entity, previous_tile)
+            self._insert(entity, tile)
+
+    def remove(self, entity: Entity) -> None:
+        """
+        Remove the given entity from the grid.
+        Entities that are not indexed are ignored.
+
+        Keyword arguments:
+        entity -- the entity that should be removed
+        """
+        tile = self._tile_by_entity.get(id(entity))
+        if tile is None:
+            return
+        self._discard(entity, tile)
+        del self._priority_by_entity[id(entity)]
+
+    def get(self, tile: tuple[int, int]) -> Optional[Entity]:
+        """
+        Return the entity with the highest priority standing on the given tile if there is any.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile
+        """
+        entities = self._entities_by_tile.get(tile)
+        return entities[0] if entities else None
+
+    def _insert(self, entity: Entity, tile: tuple[int, int]) -> None:
+        entities = self._entities_by_tile.setdefault(tile, [])
+        entities.append(entity)
+        entities.sort(key=lambda other: self._priority_by_entity[id(other)])
+        self._tile_by_entity[id(entity)] = tile
+        self.version += 1
+        if self.walkability and is_blocking(entity):
+            self.walkability.add_blocker(tile)
+
+    def _discard(self, entity: Entity, tile: tuple[int, int]) -> None:
+        entities = self._entities_by_tile[tile]
+        entities[:] = [other for other in entities if other is not entity]
+        if not entities:
+            del self._entities_by_tile[tile]
+        del self._tile_by_entity[id(entity)]
+        self.version += 1
+        if self.walkability and is_blocking(entity):
+            self.walkability.remove_blocker(tile)
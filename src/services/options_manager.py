@@ -3,10 +3,15 @@ import os
 import json
 from typing import Any
 
+from src.constants import AI_PLANNING_BUDGET
+
 DEFAULT_OPTIONS = {
     "language": "en",
     "move_speed": 4,
-    "screen_size": 1
+    "screen_size": 1,
+    "ai_planning_budget": AI_PLANNING_BUDGET,
+    "danger_zone": 0,
+    "dirty_rendering": 0,
 }
 
 options_path = pathlib.Path("saves/options.json")
@@ -33,6 +38,7 @@ options = load_options()
 def get_option(option_name: str):
     """
     Get the value of a specific option.
+    The default value is returned if the option is missing from an older options file.
 
     Arguments:
     option_name -- Name of the option to retrieve
@@ -40,7 +46,7 @@ def get_option(option_name: str):
     Returns:
     Value of the specified option
     """
-    return options[option_name]
+    return options.get(option_name, DEFAULT_OPTIONS[option_name])
 
 def save_options():
     """
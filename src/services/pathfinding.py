@@ -0,0 +1,238 @@
+"""
+Defines the path finding algorithms working on the tile grid of a level.
+
+Tiles are identified by their index in the walkability grid during the searches,
+positions on screen being only built for the results handed back to the level.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import count
+from typing import Optional
+
+from src.gui.position import Position
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class PossibleMoves(Mapping):
+    """
+    The tiles that can be reached from a starting tile, given as a mapping associating the position
+    of each tile with its distance from the start.
+
+    The distances are stored by tile index, and the positions on screen are only built
+    the first time the moves are iterated over, usually to be displayed.
+
+    It also remembers from which tile each one has been reached during the search,
+    so the path to any of them can be rebuilt by following these links back to the start.
+
+    Keyword arguments:
+    walkability -- the grid in which the moves have been computed
+    start -- the index of the starting tile, None if it is out of the map
+    distances -- the distance of each reachable tile from the start, by tile index
+    predecessors -- the index of the tile from which each reachable tile has been reached, by tile index
+
+    Attributes:
+    walkability -- the grid in which the moves have been computed
+    start -- the index of the starting tile, None if it is out of the map
+    distances -- the distance of each reachable tile from the start, by tile index
+    predecessors -- the index of the tile from which each reachable tile has been reached, by tile index
+    _positions -- the positions of the reachable tiles once they have been built
+    """
+
+    def __init__(
+        self,
+        walkability: WalkabilityGrid,
+        start: Optional[int],
+        distances: dict[int, int],
+        predecessors: dict[int, int],
+    ) -> None:
+        self.walkability: WalkabilityGrid = walkability
+        self.start: Optional[int] = start
+        self.distances: dict[int, int] = distances
+        self.predecessors: dict[int, int] = predecessors
+        self._positions: Optional[list[Position]] = None
+
+    @classmethod
+    def along_path(
+        cls, walkability: WalkabilityGrid, start: int, path: Sequence[int]
+    ) -> PossibleMoves:
+        """
+        Return the possible moves made only of the tiles of the given path.
+
+        Keyword arguments:
+        walkability -- the grid in which the path has been computed
+        start -- the index of the starting tile
+        path -- the indexes of the tiles to be crossed in order, the starting tile excluded
+        """
+        distances: dict[int, int] = {start: 0}
+        predecessors: dict[int, int] = {}
+        previous = start
+        for distance, index in enumerate(path, 1):
+            distances[index] = distance
+            predecessors[index] = previous
+            previous = index
+        return cls(walkability, start, distances, predecessors)
+
+    def __getitem__(self, position: Position) -> int:
+        index = self.walkability.position_index(position)
+        if index is None or index not in self.distances:
+            raise KeyError(position)
+        return self.distances[index]
+
+    def __contains__(self, position: object) -> bool:
+        index = self.walkability.position_index(position)
+        return index is not None and index in self.distances
+
+    def __iter__(self) -> Iterator[Position]:
+        if self._positions is None:
+            self._positions = [
+                self.walkability.position(index) for index in self.distances
+            ]
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def tiles(self) -> Iterator[tuple[int, int]]:
+        """
+        Iterate over the coordinates of the reachable tiles.
+        """
+        return (self.walkability.tile(index) for index in self.distances)
+
+    def path_to(self, destination: Position) -> list[Position]:
+        """
+        Return the ordered list of positions that should be crossed to go from the start to the destination,
+        the starting tile excluded unless it is the destination itself.
+
+        Keyword arguments:
+        destination -- the position of the destination, it should be one of the reachable tiles
+        """
+        path: list[Position] = []
+        index = self.walkability.position_index(destination)
+        while index in self.predecessors:
+            path.append(self.walkability.position(index))
+            index = self.predecessors[index]
+        if not path:
+            return [destination]
+        path.reverse()
+        return path
+
+
+def flood_fill(
+    walkability: WalkabilityGrid, start: tuple[int, int], max_moves: int
+) -> PossibleMoves:
+    """
+    Compute all the tiles that could be reached from the starting tile by crossing
+    at most the given number of walkable tiles.
+
+    Return the reachable tiles with their distance and predecessor.
+
+    Keyword arguments:
+    walkability -- the grid telling which tiles can be crossed
+    start -- the coordinates of the starting tile
+    max_moves -- the maximum number of tiles that could be traveled
+    """
+    start_index = walkability.index(start)
+    if start_index is None:
+        return PossibleMoves(walkability, None, {}, {})
+    walkable = walkability.walkable
+    neighbours = walkability.neighbours
+    distances: dict[int, int] = {start_index: 0}
+    predecessors: dict[int, int] = {}
+    frontier: deque[int] = deque([start_index])
+    while frontier:
+        index = frontier.popleft()
+        distance = distances[index] + 1
+        if distance > max_moves:
+            # Tiles are visited by increasing distance, none of the remaining ones can go further
+            break
+        for neighbour in neighbours[index]:
+            if walkable[neighbour] and neighbour not in distances:
+                distances[neighbour] = distance
+                predecessors[neighbour] = index
+                frontier.append(neighbour)
+    return PossibleMoves(walkability, start_index, distances, predecessors)
+
+
+def find_path(
+    walkability: WalkabilityGrid,
+    start: tuple[int, int],
+    destination: tuple[int, int],
+    max_cost: Optional[int] = None,
+) -> Optional[tuple[list[Position], int]]:
+    """
+    Search for the shortest path between two tiles with the A* algorithm,
+    guided by the Manhattan distance to the destination.
+
+    Return the ordered list of positions that should be crossed, the starting tile excluded,
+    with the cost of the path, or None if there is no path within the cost bound.
+
+    Among paths of the same cost, the one getting closer to the destination first is preferred,
+    and remaining ties are broken by the order in which neighbours are scanned,
+    so the same query always gives the same path.
+
+    The destination itself does not need to be walkable, so a path leading to an entity can be searched,
+    it is then up to the caller to stop before the last position.
+
+    Keyword arguments:
+    walkability -- the grid telling which tiles can be crossed
+    start -- the coordinates of the starting tile
+    destination -- the coordinates of the destination tile
+    max_cost -- the maximum number of tiles that could be traveled, no limit if None
+    """
+    if start == destination:
+        return [], 0
+    start_index = walkability.index(start)
+    destination_index = walkability.index(destination)
+    if start_index is None or destination_index is None:
+        return None
+    width = walkability.width
+    destination_x = destination_index % width
+    destination_y = destination_index // width
+    heuristic = abs(start_index % width - destination_x) + abs(
+        start_index // width - destination_y
+    )
+    if max_cost is not None and heuristic > max_cost:
+        return None
+
+    walkable = walkability.walkable
+    neighbours = walkability.neighbours
+    costs: dict[int, int] = {start_index: 0}
+    predecessors: dict[int, int] = {}
+    visited: set[int] = set()
+    insertion_order = count()
+    frontier: list[tuple[int, int, int, int]] = [
+        (heuristic, heuristic, next(insertion_order), start_index)
+    ]
+    while frontier:
+        *_, index = heapq.heappop(frontier)
+        if index == destination_index:
+            path: list[Position] = []
+            while index != start_index:
+                path.append(walkability.position(index))
+                index = predecessors[index]
+            path.reverse()
+            return path, costs[destination_index]
+        if index in visited:
+            continue
+        visited.add(index)
+        cost = costs[index] + 1
+        for neighbour in neighbours[index]:
+            if neighbour != destination_index and not walkable[neighbour]:
+                continue
+            if neighbour in costs and costs[neighbour] <= cost:
+                continue
+            heuristic = abs(neighbour % width - destination_x) + abs(
+                neighbour // width - destination_y
+            )
+            if max_cost is not None and cost + heuristic > max_cost:
+                continue
+            costs[neighbour] = cost
+            predecessors[neighbour] = index
+            heapq.heappush(
+                frontier, (cost + heuristic, heuristic, next(insertion_order), neighbour)
+            )
+    return None
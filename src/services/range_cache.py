@@ -0,0 +1,85 @@
+"""
+Defines RangeCache class, the memory of the last movement and attack ranges computed for each entity.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Optional
+
+from src.game_entities.entity import Entity
+from src.gui.position import Position
+from src.services.occupancy_grid import OccupancyGrid
+from src.services.pathfinding import PossibleMoves
+
+
+class RangeCache:
+    """
+    A RangeCache remembers the possible moves and attacks of the entities of a level,
+    so watching or selecting the same entity again does not compute them from scratch.
+
+    The ranges are only valid for a given state of the board: all of them are forgotten
+    as soon as the occupancy of the level changes.
+
+    Keyword arguments:
+    occupancy -- the index of the entities of the level whose changes invalidate the ranges
+
+    Attributes:
+    occupancy -- the index of the entities of the level whose changes invalidate the ranges
+    _version -- the version of the occupancy for which the ranges have been computed
+    _ranges -- the parameters, possible moves and possible attacks computed for each entity, by entity id
+    """
+
+    def __init__(self, occupancy: OccupancyGrid) -> None:
+        self.occupancy: OccupancyGrid = occupancy
+        self._version: int = occupancy.version
+        self._ranges: dict[
+            int, tuple[Hashable, PossibleMoves, frozenset[Position]]
+        ] = {}
+
+    def get(
+        self, entity: Entity, parameters: Hashable
+    ) -> Optional[tuple[PossibleMoves, frozenset[Position]]]:
+        """
+        Return the possible moves and attacks of the given entity if they have already been computed
+        with the same parameters on the current board, None otherwise.
+
+        Keyword arguments:
+        entity -- the entity whose ranges are requested
+        parameters -- everything about the entity the ranges depend on (position, moves, reach...)
+        """
+        if self._version != self.occupancy.version:
+            self._ranges.clear()
+            self._version = self.occupancy.version
+            return None
+        cached = self._ranges.get(id(entity))
+        if cached is None or cached[0] != parameters:
+            return None
+        return cached[1], cached[2]
+
+    def store(
+        self,
+        entity: Entity,
+        parameters: Hashable,
+        possible_moves: PossibleMoves,
+        possible_attacks: frozenset[Position],
+    ) -> None:
+        """
+        Remember the possible moves and attacks computed for the given entity on the current board.
+
+        Keyword arguments:
+        entity -- the entity whose ranges have been computed
+        parameters -- everything about the entity the ranges depend on (position, moves, reach...)
+        possible_moves -- the possible moves of the entity
+        possible_attacks -- the possible attacks of the entity
+        """
+        if self._version != self.occupancy.version:
+            self._ranges.clear()
+            self._version = self.occupancy.version
+        self._ranges[id(entity)] = (parameters, possible_moves, possible_attacks)
+
+    def clear(self) -> None:
+        """
+        Forget all the ranges.
+        """
+        self._ranges.clear()
@@ -4,9 +4,12 @@ Define SceneManager class, the orchestrator of the communication between every d
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Optional
+
 import pygame
 
-from src.constants import MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH
+from src.constants import BLACK, MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH
 from src.scenes.level_loading_scene import LevelLoadingScene
 from src.scenes.level_scene import LevelScene, LevelStatus
 from src.scenes.scene import QuitActionKind, Scene
@@ -24,18 +27,28 @@ class SceneManager:
 
     Attributes:
     active_scene -- the current active scene that should handle all incoming events
+    updated_areas -- the areas of the screen drawn during the last iteration,
+    None if the whole screen has been drawn
     """
 
     def __init__(self, screen: pygame.Surface) -> None:
         self.active_scene: Scene = StartScene(screen)
+        self.updated_areas: Optional[list[pygame.Rect]] = None
 
-    def process_game_iteration(self) -> QuitActionKind:
+    def process_game_iteration(
+        self, redrawn_areas: Optional[Sequence[pygame.Rect]] = None
+    ) -> QuitActionKind:
         """
         Handle a single game iteration.
         Extract every ongoing event and delegate them to the active scene.
         Update the state of the active scene.
 
         Return whether the game should be ended or not.
+
+        Keyword arguments:
+        redrawn_areas -- the areas of the screen that should be drawn again anyway
+        if only the changes of the active scene should be displayed,
+        None if the whole scene should be displayed on a cleared screen
         """
         quit_game = QuitActionKind.CONTINUE
         for event in pygame.event.get():
@@ -51,10 +64,16 @@ class SceneManager:
                     self.active_scene.button_down(event.button, event.pos)
             elif event.type == pygame.KEYDOWN:
                 self.active_scene.key_down(event.key)
+        self.updated_areas = None
         if self.active_scene.update_state():
             self.start_new_scene()
+            if redrawn_areas is not None:
+                self.active_scene.screen.fill(BLACK)
             return QuitActionKind.CONTINUE
-        self.active_scene.display()
+        if redrawn_areas is None:
+            self.active_scene.display()
+        else:
+            self.updated_areas = self.active_scene.display_changes(redrawn_areas)
         return quit_game
 
     def start_new_scene(self) -> None:
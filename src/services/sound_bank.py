@@ -0,0 +1,60 @@
+"""
+Defines SoundBank class, the sound effects already loaded,
+and the get_sound function using the instance shared by all modules.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pygame
+
+SOUND_DIRECTORY = "sound_fx"
+
+
+class SoundBank:
+    """
+    A SoundBank loads each sound effect the first time it is requested,
+    so all the entities playing the same sound share a single one.
+
+    Keyword arguments:
+    directory -- the directory containing the sound files
+
+    Attributes:
+    directory -- the directory containing the sound files
+    _sounds -- the loaded sounds by file name
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory: str = directory
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+
+    def get(self, file_name: str) -> pygame.mixer.Sound:
+        """
+        Return the sound stored in the given file, loading it only if it has not been yet.
+
+        Keyword arguments:
+        file_name -- the name of the sound file in the directory of the bank
+        """
+        sound = self._sounds.get(file_name)
+        if sound is None:
+            sound = pygame.mixer.Sound(os.path.join(self.directory, file_name))
+            self._sounds[file_name] = sound
+        return sound
+
+    def __len__(self) -> int:
+        return len(self._sounds)
+
+
+sound_bank = SoundBank(SOUND_DIRECTORY)
+
+
+def get_sound(file_name: str) -> pygame.mixer.Sound:
+    """
+    Return the sound stored in the given file of the sound effects directory,
+    through the bank shared by all modules.
+
+    Keyword arguments:
+    file_name -- the name of the sound file
+    """
+    return sound_bank.get(file_name)
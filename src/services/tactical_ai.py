@@ -0,0 +1,315 @@
+"""
+Defines the shallow lookahead used by the entities following the tactical strategy.
+
+Candidate actions, a move possibly followed by an attack, are played on lightweight copies
+of the board and scored against the best replies of the opponents.
+The states only hold plain data, so they can be sent to other processes
+and the candidates evaluated in parallel.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+# Score given for each hit point taken from or lost by the tactical entity
+DAMAGE_WEIGHT = 1.0
+# Score given for defeating an opponent, and taken away for being defeated
+KILL_BONUS = 10.0
+DEATH_PENALTY = 20.0
+# Small score taken away for each tile separating the entity from its nearest opponent,
+# so it keeps getting closer when nothing better can be done
+APPROACH_WEIGHT = 0.1
+MAX_EVALUATION_WORKERS = 4
+
+_evaluation_pool: Optional[ProcessPoolExecutor] = None
+
+
+class UnitState:
+    """
+    A UnitState is the part of an entity that matters to the lookahead.
+
+    Keyword arguments:
+    tile -- the index of the tile of the unit on the board
+    hit_points -- the current hit points of the unit
+    defense -- the protection of the unit against physical attacks
+    resistance -- the protection of the unit against spiritual attacks
+    strength -- the expected power of the attacks of the unit
+    spiritual -- whether the attacks of the unit are spiritual or physical
+    reach -- the distances at which the unit can attack
+    max_moves -- the max number of tiles that could be crossed by the unit
+    can_attack -- whether the unit is allowed to attack or not
+
+    Attributes:
+    tile -- the index of the tile of the unit on the board
+    hit_points -- the current hit points of the unit
+    defense -- the protection of the unit against physical attacks
+    resistance -- the protection of the unit against spiritual attacks
+    strength -- the expected power of the attacks of the unit
+    spiritual -- whether the attacks of the unit are spiritual or physical
+    reach -- the distances at which the unit can attack
+    max_moves -- the max number of tiles that could be crossed by the unit
+    can_attack -- whether the unit is allowed to attack or not
+    """
+
+    def __init__(
+        self,
+        tile: int,
+        hit_points: int,
+        defense: int,
+        resistance: int,
+        strength: int,
+        spiritual: bool,
+        reach: Sequence[int],
+        max_moves: int,
+        can_attack: bool = True,
+    ) -> None:
+        self.tile: int = tile
+        self.hit_points: int = hit_points
+        self.defense: int = defense
+        self.resistance: int = resistance
+        self.strength: int = strength
+        self.spiritual: bool = spiritual
+        self.reach: tuple[int, ...] = tuple(reach)
+        self.max_moves: int = max_moves
+        self.can_attack: bool = can_attack
+
+    def damage_to(self, other: UnitState) -> int:
+        """
+        Return the hit points the other unit would lose if attacked by this one.
+
+        Keyword arguments:
+        other -- the attacked unit
+        """
+        protection = other.resistance if self.spiritual else other.defense
+        return min(max(self.strength - protection, 0), other.hit_points)
+
+
+class BoardState:
+    """
+    A BoardState is a lightweight copy of the board as seen by one tactical entity:
+    which tiles can be crossed, where the entity is and where its opponents are.
+
+    Keyword arguments:
+    width -- the width of the map in tiles
+    height -- the height of the map in tiles
+    walkable -- for each tile index, 1 if the tile can be crossed and 0 otherwise,
+    the tiles of the units being blocked
+    unit -- the tactical unit
+    opponents -- the units that can be attacked by the tactical unit
+
+    Attributes:
+    width -- the width of the map in tiles
+    height -- the height of the map in tiles
+    walkable -- for each tile index, 1 if the tile can be crossed and 0 otherwise
+    unit -- the tactical unit
+    opponents -- the units that can be attacked by the tactical unit
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        walkable: bytearray,
+        unit: UnitState,
+        opponents: Sequence[UnitState],
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.walkable: bytearray = walkable
+        self.unit: UnitState = unit
+        self.opponents: list[UnitState] = list(opponents)
+
+    def distance(self, tile: int, other_tile: int) -> int:
+        """
+        Return the Manhattan distance between two tiles.
+
+        Keyword arguments:
+        tile -- the index of the first tile
+        other_tile -- the index of the second tile
+        """
+        return abs(tile % self.width - other_tile % self.width) + abs(
+            tile // self.width - other_tile // self.width
+        )
+
+    def reachable(self, start: int, max_moves: int) -> dict[int, int]:
+        """
+        Return the tiles that could be reached from the starting tile with their distance,
+        the starting tile itself being included even though it is blocked by its unit.
+
+        Keyword arguments:
+        start -- the index of the starting tile
+        max_moves -- the maximum number of tiles that could be traveled
+        """
+        distances = {start: 0}
+        frontier = deque([start])
+        while frontier:
+            tile = frontier.popleft()
+            distance = distances[tile] + 1
+            if distance > max_moves:
+                break
+            x_coordinate, y_coordinate = tile % self.width, tile // self.width
+            for neighbour_x, neighbour_y in (
+                (x_coordinate - 1, y_coordinate),
+                (x_coordinate, y_coordinate + 1),
+                (x_coordinate, y_coordinate - 1),
+                (x_coordinate + 1, y_coordinate),
+            ):
+                if 0 <= neighbour_x < self.width and 0 <= neighbour_y < self.height:
+                    neighbour = neighbour_y * self.width + neighbour_x
+                    if self.walkable[neighbour] and neighbour not in distances:
+                        distances[neighbour] = distance
+                        frontier.append(neighbour)
+        return distances
+
+    def candidates(self) -> list[tuple[int, Optional[int]]]:
+        """
+        Return all the actions the tactical unit could take, as its destination tile
+        with the index of the opponent attacked from there, if any.
+        """
+        candidates: list[tuple[int, Optional[int]]] = []
+        for tile in self.reachable(self.unit.tile, self.unit.max_moves):
+            candidates.append((tile, None))
+            if self.unit.can_attack:
+                for index, opponent in enumerate(self.opponents):
+                    if self.distance(tile, opponent.tile) in self.unit.reach:
+                        candidates.append((tile, index))
+        return candidates
+
+    def can_be_attacked_by(self, opponent: UnitState) -> bool:
+        """
+        Return whether the given opponent could move to a tile from which it can attack the tactical unit.
+
+        Keyword arguments:
+        opponent -- the opponent whose reply is considered
+        """
+        if not opponent.can_attack or not opponent.reach:
+            return False
+        if (
+            self.distance(opponent.tile, self.unit.tile)
+            > opponent.max_moves + max(opponent.reach)
+        ):
+            return False
+        return any(
+            self.distance(tile, self.unit.tile) in opponent.reach
+            for tile in self.reachable(opponent.tile, opponent.max_moves)
+        )
+
+    def evaluate(self, candidate: tuple[int, Optional[int]]) -> float:
+        """
+        Return the score of the given action for the tactical unit, the higher the better.
+
+        The action is played, then each remaining opponent able to reach the unit is expected to attack it.
+
+        Keyword arguments:
+        candidate -- the destination tile of the unit with the index of the attacked opponent, if any
+        """
+        destination, attacked = candidate
+        score = 0.0
+        opponents = list(self.opponents)
+        if attacked is not None:
+            opponent = opponents[attacked]
+            damage = self.unit.damage_to(opponent)
+            score += DAMAGE_WEIGHT * damage
+            if damage >= opponent.hit_points:
+                score += KILL_BONUS
+                del opponents[attacked]
+
+        walkable = bytearray(self.walkable)
+        walkable[self.unit.tile] = 1
+        walkable[destination] = 0
+        for opponent in self.opponents:
+            if opponent not in opponents:
+                # A defeated opponent does not block its tile anymore
+                walkable[opponent.tile] = 1
+        unit = UnitState(
+            destination,
+            self.unit.hit_points,
+            self.unit.defense,
+            self.unit.resistance,
+            self.unit.strength,
+            self.unit.spiritual,
+            self.unit.reach,
+            self.unit.max_moves,
+            self.unit.can_attack,
+        )
+        after = BoardState(self.width, self.height, walkable, unit, opponents)
+
+        taken = sum(
+            opponent.damage_to(unit)
+            for opponent in opponents
+            if after.can_be_attacked_by(opponent)
+        )
+        score -= DAMAGE_WEIGHT * min(taken, unit.hit_points)
+        if taken >= unit.hit_points:
+            score -= DEATH_PENALTY
+        if opponents:
+            score -= APPROACH_WEIGHT * min(
+                after.distance(destination, opponent.tile) for opponent in opponents
+            )
+        return score
+
+
+def evaluate_candidates(
+    state: BoardState, candidates: Sequence[tuple[int, Optional[int]]]
+) -> list[float]:
+    """
+    Return the score of each of the given actions.
+    Meant to be run in the processes of the evaluation pool.
+
+    Keyword arguments:
+    state -- the board on which the actions are played
+    candidates -- the actions to score
+    """
+    return [state.evaluate(candidate) for candidate in candidates]
+
+
+def best_candidate(
+    candidates: Sequence[tuple[int, Optional[int]]], scores: Sequence[float]
+) -> tuple[int, Optional[int]]:
+    """
+    Return the action with the best score, the first one in case of ties,
+    so the same board always leads to the same choice.
+
+    Keyword arguments:
+    candidates -- the actions, at least one
+    scores -- the score of each action
+    """
+    best_index = max(range(len(candidates)), key=lambda index: (scores[index], -index))
+    return candidates[best_index]
+
+
+def evaluation_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Return the pool of processes in which the candidates are evaluated, created on first use,
+    or None if it cannot be created.
+    Processes are spawned rather than forked, so they do not inherit the state of the window.
+    """
+    global _evaluation_pool
+    if _evaluation_pool is None:
+        try:
+            _evaluation_pool = ProcessPoolExecutor(
+                max_workers=min(MAX_EVALUATION_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        except OSError:
+            return None
+    return _evaluation_pool
+
+
+def discard_evaluation_pool(pool: Executor) -> None:
+    """
+    Shut down the given pool that cannot be used anymore, for instance because one of its processes died,
+    so the next call to evaluation_pool creates a new one if it is the shared pool.
+
+    Keyword arguments:
+    pool -- the broken pool
+    """
+    global _evaluation_pool
+    if pool is _evaluation_pool:
+        _evaluation_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
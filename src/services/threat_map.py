@@ -0,0 +1,84 @@
+"""
+Defines ThreatMap class, the tiles from which each opponent of a side could be hit,
+computed once per turn from the positions of the opponents.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+
+from src.game_entities.entity import Entity
+from src.game_entities.movable import Movable
+from src.gui.position import Position
+from src.services.tiles import tile_coordinates, tile_position
+
+
+class ThreatMap:
+    """
+    A ThreatMap tells, for each tile, which opponents could be hit from it and at which distance.
+
+    Since the distance between two tiles does not depend on the direction,
+    the tiles from which an opponent could be hit at a given distance are also
+    the ones it could hit itself at that distance.
+
+    Keyword arguments:
+    opponents -- the entities that could be hit, in the order in which they should be considered
+    max_reach -- the greatest distance at which an attack could be made
+
+    Attributes:
+    opponents -- the entities that could be hit
+    max_reach -- the greatest distance at which an attack could be made
+    _threats -- the opponents that could be hit from each tile with their distance,
+    by tile coordinates, the opponents being kept in the given order
+    """
+
+    def __init__(self, opponents: Sequence[Entity], max_reach: int) -> None:
+        self.opponents: tuple[Entity, ...] = tuple(opponents)
+        self.max_reach: int = max_reach
+        self._threats: dict[tuple[int, int], list[tuple[Entity, int]]] = {}
+        for opponent in self.opponents:
+            x_coordinate, y_coordinate = tile_coordinates(opponent.position)
+            for distance in range(1, max_reach + 1):
+                for offset in range(distance):
+                    # Walk the four sides of the diamond of tiles at this distance
+                    for tile in (
+                        (x_coordinate + offset, y_coordinate - distance + offset),
+                        (x_coordinate + distance - offset, y_coordinate + offset),
+                        (x_coordinate - offset, y_coordinate + distance - offset),
+                        (x_coordinate - distance + offset, y_coordinate - offset),
+                    ):
+                        self._threats.setdefault(tile, []).append((opponent, distance))
+
+    def threats_at(self, position: Position) -> list[tuple[Entity, int]]:
+        """
+        Return the opponents that could be hit from the given position with their distance,
+        in the order in which the opponents have been given.
+
+        Keyword arguments:
+        position -- the position from which the attack would be made
+        """
+        return self._threats.get(tile_coordinates(position), [])
+
+    def danger_zone(self) -> set[Position]:
+        """
+        Return the positions that at least one of the opponents could hit without moving,
+        according to its own reach.
+        """
+        return {
+            tile_position(tile)
+            for tile, threats in self._threats.items()
+            if any(
+                isinstance(opponent, Movable) and distance in opponent.reach
+                for opponent, distance in threats
+            )
+        }
+
+
+def max_reach(entities: Collection[Movable]) -> int:
+    """
+    Return the greatest distance at which any of the given entities could attack, 0 if none.
+
+    Keyword arguments:
+    entities -- the attacking entities
+    """
+    return max((max(entity.reach) for entity in entities if entity.reach), default=0)
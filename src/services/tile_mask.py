@@ -0,0 +1,148 @@
+"""
+Defines TileMask class, a set of tiles of a level stored as the bits of a single integer,
+so operations on whole areas of the map are done by a few bitwise operations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+
+def manhattan_ring(distance: int) -> list[tuple[int, int]]:
+    """
+    Return the offsets of all the tiles at exactly the given Manhattan distance from a tile.
+
+    Keyword arguments:
+    distance -- the distance from the central tile, strictly positive
+    """
+    offsets: list[tuple[int, int]] = []
+    for offset_x in range(-distance, distance + 1):
+        offset_y = distance - abs(offset_x)
+        offsets.append((offset_x, offset_y))
+        if offset_y != 0:
+            offsets.append((offset_x, -offset_y))
+    return offsets
+
+
+class TileMask:
+    """
+    A TileMask is a set of tiles of the map stored as a bitset, one bit per tile, row by row.
+
+    Each row is followed by a few unused bits so that shifting the whole mask horizontally
+    by at most this margin never makes a tile wrap around to the neighbouring row.
+
+    Keyword arguments:
+    origin -- the coordinates of the top left tile of the map
+    size -- the width and height of the map in tiles
+    margin -- the maximum horizontal distance by which the mask could be shifted
+    tiles -- the coordinates of the tiles initially in the mask, those out of the map being ignored
+
+    Attributes:
+    origin_x -- the horizontal coordinate of the top left tile of the map
+    origin_y -- the vertical coordinate of the top left tile of the map
+    width -- the width of the map in tiles
+    height -- the height of the map in tiles
+    margin -- the maximum horizontal distance by which the mask could be shifted
+    stride -- the number of bits used by each row of the map
+    bits -- the integer whose bits tell which tiles are in the mask
+    """
+
+    def __init__(
+        self,
+        origin: tuple[int, int],
+        size: tuple[int, int],
+        margin: int = 0,
+        tiles: Iterable[tuple[int, int]] = (),
+    ) -> None:
+        self.origin_x, self.origin_y = origin
+        self.width, self.height = size
+        self.margin: int = margin
+        self.stride: int = self.width + margin
+        self.bits: int = 0
+        for tile in tiles:
+            self.add(tile)
+
+    def _bit(self, tile: tuple[int, int]) -> int:
+        x_coordinate = tile[0] - self.origin_x
+        y_coordinate = tile[1] - self.origin_y
+        if 0 <= x_coordinate < self.width and 0 <= y_coordinate < self.height:
+            return 1 << (y_coordinate * self.stride + x_coordinate)
+        return 0
+
+    def _area(self) -> int:
+        row = (1 << self.width) - 1
+        area = 0
+        for y_coordinate in range(self.height):
+            area |= row << (y_coordinate * self.stride)
+        return area
+
+    def _with_bits(self, bits: int) -> TileMask:
+        mask = TileMask(
+            (self.origin_x, self.origin_y), (self.width, self.height), self.margin
+        )
+        mask.bits = bits
+        return mask
+
+    def add(self, tile: tuple[int, int]) -> None:
+        """
+        Add the given tile to the mask, nothing is done if it is out of the map.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile
+        """
+        self.bits |= self._bit(tile)
+
+    def __contains__(self, tile: tuple[int, int]) -> bool:
+        bit = self._bit(tile)
+        return bit != 0 and self.bits & bit != 0
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def tiles(self) -> Iterator[tuple[int, int]]:
+        """
+        Iterate over the coordinates of the tiles in the mask, row by row.
+        """
+        bits = self.bits
+        while bits:
+            lowest_bit = bits & -bits
+            index = lowest_bit.bit_length() - 1
+            yield (
+                self.origin_x + index % self.stride,
+                self.origin_y + index // self.stride,
+            )
+            bits ^= lowest_bit
+
+    def dilated(self, distances: Iterable[int]) -> TileMask:
+        """
+        Return the mask of all the tiles at exactly one of the given Manhattan distances
+        from at least one tile of this mask.
+
+        Raise ValueError if a distance is greater than the margin of the mask.
+
+        Keyword arguments:
+        distances -- the strictly positive distances
+        """
+        dilated_bits = 0
+        for distance in set(distances):
+            if distance > self.margin:
+                raise ValueError(
+                    f"Cannot dilate by {distance} a mask with a margin of {self.margin}"
+                )
+            for offset_x, offset_y in manhattan_ring(distance):
+                shift = offset_y * self.stride + offset_x
+                if shift >= 0:
+                    dilated_bits |= self.bits << shift
+                else:
+                    dilated_bits |= self.bits >> -shift
+        return self._with_bits(dilated_bits & self._area())
+
+    def intersection(self, other: TileMask) -> TileMask:
+        """
+        Return the mask of the tiles that are both in this mask and in the other one.
+        Both masks should have the same geometry.
+
+        Keyword arguments:
+        other -- the other mask
+        """
+        return self._with_bits(self.bits & other.bits)
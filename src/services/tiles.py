@@ -0,0 +1,43 @@
+"""
+Defines the helpers converting positions on screen to the integer coordinates of the tiles of a level,
+and back.
+"""
+
+from __future__ import annotations
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+
+# Same order as the one historically used by the level to scan the neighbourhood of a tile
+NEIGHBOUR_OFFSETS: tuple[tuple[int, int], ...] = ((-1, 0), (0, 1), (0, -1), (1, 0))
+
+
+def tile_coordinates(position: Position) -> tuple[int, int]:
+    """
+    Return the integer coordinates of the tile containing the given position.
+
+    Keyword arguments:
+    position -- the position on screen
+    """
+    return int(position[0]) // TILE_SIZE, int(position[1]) // TILE_SIZE
+
+
+def tile_position(tile: tuple[int, int]) -> Position:
+    """
+    Return the position on screen of the top left corner of the given tile.
+
+    Keyword arguments:
+    tile -- the coordinates of the tile
+    """
+    return Position(tile[0] * TILE_SIZE, tile[1] * TILE_SIZE)
+
+
+def manhattan_distance(tile: tuple[int, int], other_tile: tuple[int, int]) -> int:
+    """
+    Return the number of tiles separating two tiles when moving only horizontally and vertically.
+
+    Keyword arguments:
+    tile -- the coordinates of the first tile
+    other_tile -- the coordinates of the second tile
+    """
+    return abs(tile[0] - other_tile[0]) + abs(tile[1] - other_tile[1])
@@ -0,0 +1,529 @@
+"""
+Defines TurnPlanner class, deciding at the beginning of the turn of a side controlled by the AI
+what each of its entities is going to do, and the few classes describing the board it plans on
+and the actions it produces.
+
+The planning is run on a snapshot of the board, either in a worker thread or a few steps
+at each frame, so the level keeps being animated while the AI thinks.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections.abc import Generator, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from src.game_entities.character import Character
+from src.game_entities.destroyable import DamageKind
+from src.game_entities.entity import Entity
+from src.game_entities.movable import EntityStrategy, Movable
+from src.gui.position import Position
+from src.services.distance_field import DistanceFields
+from src.services.pathfinding import PossibleMoves, find_path, flood_fill
+from src.services.tactical_ai import (BoardState, UnitState, best_candidate,
+                                      discard_evaluation_pool,
+                                      evaluate_candidates)
+from src.services.threat_map import ThreatMap, max_reach
+from src.services.tiles import tile_coordinates
+from src.services.walkability_grid import WalkabilityGrid
+
+# Number of batches in which the candidates of a tactical entity are split to be evaluated in parallel
+EVALUATION_BATCHES = 4
+# Seconds spent waiting for the evaluations before letting the planning pause
+EVALUATION_WAIT = 0.001
+
+_planning_executor: Optional[ThreadPoolExecutor] = None
+
+
+def unit_state(entity: Movable, tile: int) -> UnitState:
+    """
+    Return the expected fighting abilities of the given entity, as seen by the tactical lookahead.
+    Nothing is changed on the entity, its weapon is not worn out for instance.
+
+    Keyword arguments:
+    entity -- the entity, with a reach
+    tile -- the index of the tile of the entity on the board
+    """
+    strength = entity.strength + entity.get_stat_change("strength")
+    defense = entity.defense + entity.get_stat_change("defense")
+    resistance = entity.resistance + entity.get_stat_change("resistance")
+    if isinstance(entity, Character):
+        weapon = entity.get_weapon()
+        if weapon is not None:
+            strength += weapon.attack
+        for equipment in entity.equipments:
+            defense += equipment.defense
+            resistance += equipment.resistance
+    return UnitState(
+        tile,
+        entity.hit_points,
+        defense,
+        resistance,
+        strength,
+        entity.attack_kind is DamageKind.SPIRITUAL,
+        entity.reach,
+        entity.max_moves,
+        entity.can_attack(),
+    )
+
+
+class PlannedAction:
+    """
+    A PlannedAction is what an entity controlled by the AI has been planned to do during its turn:
+    follow a path, then attack a target if it can.
+
+    Keyword arguments:
+    entity -- the entity that should act
+    path -- the ordered positions to cross, reduced to the current position of the entity if it stays in place
+    move_target -- the entity chosen as target by the strategy of the entity if any
+    attack_target -- the entity that should be attacked at the end of the move if any
+    opponents -- the entities that could be attacked when the action has been planned
+
+    Attributes:
+    entity -- the entity that should act
+    path -- the ordered positions to cross, reduced to the current position of the entity if it stays in place
+    move_target -- the entity chosen as target by the strategy of the entity if any
+    attack_target -- the entity that should be attacked at the end of the move if any
+    opponents -- the entities that could be attacked when the action has been planned
+    """
+
+    def __init__(
+        self,
+        entity: Movable,
+        path: list[Position],
+        move_target: Optional[Entity],
+        attack_target: Optional[Entity],
+        opponents: Sequence[Entity],
+    ) -> None:
+        self.entity: Movable = entity
+        self.path: list[Position] = path
+        self.move_target: Optional[Entity] = move_target
+        self.attack_target: Optional[Entity] = attack_target
+        self.opponents: Sequence[Entity] = opponents
+
+    def is_valid(self, targets: Sequence[Entity]) -> bool:
+        """
+        Return whether the action still fits the board, that is whether all the opponents
+        known when it has been planned are still there.
+
+        Keyword arguments:
+        targets -- the entities that can currently be attacked by the entity
+        """
+        return all(opponent in targets for opponent in self.opponents)
+
+
+class PlanningBoard:
+    """
+    A PlanningBoard is the state of the level on which a turn is planned: which tiles can be crossed,
+    and the distance fields to the targets computed over them.
+
+    It works on its own copy of the walkability of the level, so the tiles reserved by the entities
+    whose action has already been planned do not affect the level itself.
+
+    Keyword arguments:
+    walkability -- the walkability of the level at the beginning of the turn
+    unreachable_distance -- the distance given to the targets that cannot be reached
+
+    Attributes:
+    walkability -- the copy of the walkability of the level, updated with the reservations
+    distance_fields -- the distance fields to the targets, shared by all the planned entities
+    unreachable_distance -- the distance given to the targets that cannot be reached
+    """
+
+    def __init__(self, walkability: WalkabilityGrid, unreachable_distance: int) -> None:
+        self.walkability: WalkabilityGrid = walkability.copy()
+        self.distance_fields: DistanceFields = DistanceFields(self.walkability)
+        self.unreachable_distance: int = unreachable_distance
+
+    def possible_moves(self, position: Position, max_moves: int) -> PossibleMoves:
+        """
+        Return all the possible moves from the given position on the board.
+
+        Keyword arguments:
+        position -- the starting position
+        max_moves -- the maximum number of tiles that could be traveled
+        """
+        return flood_fill(self.walkability, tile_coordinates(position), max_moves)
+
+    def moves_towards(
+        self, position: Position, target: Entity, max_moves: int
+    ) -> Optional[PossibleMoves]:
+        """
+        Return the moves along the shortest path leading to the given target,
+        limited to the given number of tiles, or None if the target cannot be reached.
+
+        Keyword arguments:
+        position -- the starting position
+        target -- the entity to get closer to
+        max_moves -- the maximum number of tiles that could be traveled
+        """
+        path_found = find_path(
+            self.walkability, tile_coordinates(position), tile_coordinates(target.position)
+        )
+        if path_found is None:
+            return None
+        path, _ = path_found
+        # The last position is the one of the target itself
+        return PossibleMoves.along_path(
+            self.walkability,
+            self.walkability.position_index(position),
+            [
+                self.walkability.position_index(step)
+                for step in path[:-1][:max_moves]
+            ],
+        )
+
+    def distances(
+        self, position: Position, targets: Sequence[Entity]
+    ) -> dict[Entity, int]:
+        """
+        Return the distance between the given position and each target.
+
+        Keyword arguments:
+        position -- the position from which the distances should be computed
+        targets -- the entities for which the distance should be computed
+        """
+        return self.distance_fields.distances_from(
+            tile_coordinates(position), targets, self.unreachable_distance
+        )
+
+    def tactical_state(
+        self, entity: Movable, targets: Sequence[Entity]
+    ) -> Optional[tuple[BoardState, list[Entity]]]:
+        """
+        Return the lightweight state of the board seen by the given tactical entity,
+        with the targets in the same order as the opponents of the state,
+        or None if the entity is out of the map.
+
+        Keyword arguments:
+        entity -- the tactical entity
+        targets -- the entities that could be attacked by it
+        """
+        tile = self.walkability.position_index(entity.position)
+        if tile is None:
+            return None
+        opponents: list[Entity] = []
+        opponent_states: list[UnitState] = []
+        for target in targets:
+            target_tile = self.walkability.position_index(target.position)
+            if target_tile is not None:
+                opponents.append(target)
+                opponent_states.append(unit_state(target, target_tile))
+        state = BoardState(
+            self.walkability.width,
+            self.walkability.height,
+            bytearray(self.walkability.walkable),
+            unit_state(entity, tile),
+            opponent_states,
+        )
+        return state, opponents
+
+    def reserve(self, origin: Position, destination: Position) -> None:
+        """
+        Move the blocker of an entity from its current tile to the one it is going to end its move on,
+        so the entities planned afterwards neither go through nor stop on it.
+
+        Keyword arguments:
+        origin -- the current position of the entity
+        destination -- the position at which the entity ends its move
+        """
+        origin_tile = tile_coordinates(origin)
+        destination_tile = tile_coordinates(destination)
+        if origin_tile != destination_tile:
+            self.walkability.remove_blocker(origin_tile)
+            self.walkability.add_blocker(destination_tile)
+
+
+class TurnPlanner:
+    """
+    A TurnPlanner decides in a single pass what every entity of a side controlled by the AI
+    is going to do during the turn.
+
+    The entities are planned in the order in which they will act, each one considering
+    the ones planned before it at the end of their moves, so no two of them ever aim at the same tile.
+    The decisions themselves are still taken by the strategy of each entity,
+    the candidate actions of the tactical ones being evaluated in the given pool if any.
+
+    Keyword arguments:
+    board -- the board on which the turn is planned
+    evaluation_pool -- the pool in which the candidate actions of the tactical entities are evaluated,
+    they are evaluated right away if None
+
+    Attributes:
+    board -- the board on which the turn is planned
+    evaluation_pool -- the pool in which the candidate actions of the tactical entities are evaluated
+    """
+
+    def __init__(
+        self, board: PlanningBoard, evaluation_pool: Optional[Executor] = None
+    ) -> None:
+        self.board: PlanningBoard = board
+        self.evaluation_pool: Optional[Executor] = evaluation_pool
+
+    def plan(
+        self, entities: Sequence[Movable], targets: Sequence[Entity]
+    ) -> dict[Movable, PlannedAction]:
+        """
+        Return the action planned for each of the given entities.
+
+        Keyword arguments:
+        entities -- the entities to plan, in the order in which they will act
+        targets -- the entities that could be attacked by them
+        """
+        steps = self.plan_steps(entities, targets)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def plan_steps(
+        self, entities: Sequence[Movable], targets: Sequence[Entity]
+    ) -> Generator[int, None, dict[Movable, PlannedAction]]:
+        """
+        Plan the given entities step by step, pausing after the distance field to each target
+        is computed, after each entity is planned and while the actions of a tactical entity are evaluated.
+
+        Yield the number of entities planned so far, and return the action planned for each entity.
+
+        Keyword arguments:
+        entities -- the entities to plan, in the order in which they will act
+        targets -- the entities that could be attacked by them
+        """
+        targets = tuple(targets)
+        for target in targets:
+            self.board.distance_fields.field_to(target)
+            yield 0
+        # The targets do not move during the turn
+        threat_map = ThreatMap(targets, max_reach(entities))
+        turn_plan: dict[Movable, PlannedAction] = {}
+        for entity in entities:
+            if entity.strategy is EntityStrategy.TACTICAL:
+                turn_plan[entity] = yield from self.plan_tactical_entity(
+                    entity, targets, len(turn_plan)
+                )
+            else:
+                turn_plan[entity] = self.plan_entity(entity, targets, threat_map)
+            yield len(turn_plan)
+        return turn_plan
+
+    def plan_tactical_entity(
+        self, entity: Movable, targets: Sequence[Entity], planned: int
+    ) -> Generator[int, None, PlannedAction]:
+        """
+        Plan the given tactical entity by scoring each of its possible actions with a shallow lookahead,
+        and reserve the tile on which it ends its move.
+
+        Yield the given number of planned entities while the actions are evaluated in the pool,
+        and return the best action.
+        If the pool breaks, it is discarded and the actions are evaluated right away.
+
+        Keyword arguments:
+        entity -- the entity to plan
+        targets -- the entities that could be attacked by it
+        planned -- the number of entities already planned
+        """
+        state_found = self.board.tactical_state(entity, targets)
+        if state_found is None:
+            return self.plan_entity(entity, targets)
+        state, opponents = state_found
+        candidates = state.candidates()
+        scores: Optional[list[float]] = None
+        if self.evaluation_pool is not None:
+            try:
+                batch_size = -(-len(candidates) // EVALUATION_BATCHES)
+                evaluations = [
+                    self.evaluation_pool.submit(
+                        evaluate_candidates,
+                        state,
+                        candidates[start : start + batch_size],
+                    )
+                    for start in range(0, len(candidates), batch_size)
+                ]
+                while wait(evaluations, timeout=EVALUATION_WAIT).not_done:
+                    yield planned
+                scores = [
+                    score for evaluation in evaluations for score in evaluation.result()
+                ]
+            except (BrokenProcessPool, OSError):
+                # The pool cannot be used anymore, the candidates are evaluated right away
+                discard_evaluation_pool(self.evaluation_pool)
+                self.evaluation_pool = None
+        if scores is None:
+            scores = evaluate_candidates(state, candidates)
+
+        destination, attacked = best_candidate(candidates, scores)
+        possible_moves = self.board.possible_moves(entity.position, entity.max_moves)
+        path = possible_moves.path_to(self.board.walkability.position(destination))
+        attack_target = opponents[attacked] if attacked is not None else None
+        self.board.reserve(entity.position, path[-1])
+        return PlannedAction(entity, path, attack_target, attack_target, targets)
+
+    def plan_entity(
+        self,
+        entity: Movable,
+        targets: Sequence[Entity],
+        threat_map: Optional[ThreatMap] = None,
+    ) -> PlannedAction:
+        """
+        Return the action planned for the given entity, and reserve the tile on which it ends its move.
+
+        Keyword arguments:
+        entity -- the entity to plan
+        targets -- the entities that could be attacked by it
+        threat_map -- the targets that could be hit from each tile, if already known
+        """
+        targets_distance = self.board.distances(entity.position, targets)
+        if entity.strategy is EntityStrategy.ACTIVE and not targets_distance:
+            # Nobody to chase
+            return PlannedAction(entity, [entity.position], None, None, targets)
+
+        possible_moves: Optional[PossibleMoves] = None
+        if entity.strategy is EntityStrategy.ACTIVE:
+            # Same target as the one that will be picked by the active strategy of the entity
+            nearest_target = min(targets_distance, key=targets_distance.get)
+            possible_moves = self.board.moves_towards(
+                entity.position, nearest_target, entity.max_moves
+            )
+        follows_path = possible_moves is not None
+        if possible_moves is None:
+            possible_moves = self.board.possible_moves(entity.position, entity.max_moves)
+
+        destination = entity.determine_move(
+            possible_moves, targets_distance, threat_map, follows_path
+        )
+        path = (
+            possible_moves.path_to(destination)
+            if destination in possible_moves
+            else [entity.position]
+        )
+
+        attack_target: Optional[Entity] = None
+        if entity.can_attack():
+            attack_position = entity.determine_attack(
+                targets_distance, path[-1], threat_map
+            )
+            if attack_position is not None:
+                attack_target = next(
+                    target for target in targets if target.position == attack_position
+                )
+
+        self.board.reserve(entity.position, path[-1])
+        return PlannedAction(entity, path, entity.target, attack_target, targets)
+
+
+class TurnPlanning:
+    """
+    A TurnPlanning is the planning of the turn of a side controlled by the AI while it is being computed.
+
+    It works on a snapshot: the board is not used by the level anymore, and the entities and their targets
+    are copied at creation, so the level can go on with its own entities meanwhile.
+    The planning either runs in a worker thread, or a few steps at a time each time it is updated
+    without spending more than the given time budget, give or take one step.
+    Either way, once finished, the plan is given for the real entities.
+
+    Keyword arguments:
+    board -- the board on which the turn is planned
+    entities -- the entities to plan, in the order in which they will act
+    targets -- the entities that could be attacked by them
+    time_budget -- the time in milliseconds that can be spent planning at each update,
+    the planning runs in a worker thread if it is 0
+    evaluation_pool -- the pool in which the candidate actions of the tactical entities are evaluated if any
+
+    Attributes:
+    total -- the number of entities to plan
+    planned -- the number of entities planned so far
+    time_budget -- the time in milliseconds that can be spent planning at each update
+    _originals -- the real entities and targets, by snapshot
+    _opponents -- the real targets
+    _steps -- the planning of the snapshots, step by step
+    _future -- the planning running in a worker thread if any
+    _turn_plan -- the plan of the turn for the real entities once finished
+    """
+
+    def __init__(
+        self,
+        board: PlanningBoard,
+        entities: Sequence[Movable],
+        targets: Sequence[Entity],
+        time_budget: int = 0,
+        evaluation_pool: Optional[Executor] = None,
+    ) -> None:
+        global _planning_executor
+        self.total: int = len(entities)
+        self.planned: int = 0
+        self.time_budget: int = time_budget
+        entity_snapshots = [copy.copy(entity) for entity in entities]
+        target_snapshots = [copy.copy(target) for target in targets]
+        self._originals: dict[Entity, Entity] = dict(zip(entity_snapshots, entities))
+        self._originals.update(zip(target_snapshots, targets))
+        self._opponents: tuple[Entity, ...] = tuple(targets)
+        self._steps: Generator[
+            int, None, dict[Movable, PlannedAction]
+        ] = TurnPlanner(board, evaluation_pool).plan_steps(
+            entity_snapshots, target_snapshots
+        )
+        self._future: Optional[Future] = None
+        self._turn_plan: Optional[dict[Movable, PlannedAction]] = None
+        if time_budget == 0:
+            if _planning_executor is None:
+                _planning_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="turn_planner"
+                )
+            self._future = _planning_executor.submit(self._run_steps)
+
+    @property
+    def progress(self) -> float:
+        """
+        Return the share of the entities already planned, between 0 and 1.
+        """
+        return self.planned / self.total if self.total else 1
+
+    def update(self) -> bool:
+        """
+        Let the planning progress if it is not run in a worker thread.
+
+        Return whether the planning is finished or not.
+        """
+        if self._turn_plan is not None:
+            return True
+        if self._future is not None:
+            if not self._future.done():
+                return False
+            snapshot_plan = self._future.result()
+        else:
+            deadline = time.perf_counter() + self.time_budget / 1000
+            try:
+                while time.perf_counter() < deadline:
+                    self.planned = next(self._steps)
+                return False
+            except StopIteration as stop:
+                snapshot_plan = stop.value
+        self._turn_plan = {
+            self._originals[entity]: PlannedAction(
+                self._originals[entity],
+                planned_action.path,
+                self._originals.get(planned_action.move_target),
+                self._originals.get(planned_action.attack_target),
+                self._opponents,
+            )
+            for entity, planned_action in snapshot_plan.items()
+        }
+        return True
+
+    def result(self) -> dict[Movable, PlannedAction]:
+        """
+        Return the plan of the turn, given for the real entities.
+        Should only be called once the planning is finished.
+        """
+        return self._turn_plan
+
+    def _run_steps(self) -> dict[Movable, PlannedAction]:
+        while True:
+            try:
+                self.planned = next(self._steps)
+            except StopIteration as stop:
+                return stop.value
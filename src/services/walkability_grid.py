@@ -0,0 +1,197 @@
+"""
+Defines WalkabilityGrid class, the compact representation of which tiles of a level can be crossed.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Optional
+
+from src.gui.position import Position
+from src.services.tiles import NEIGHBOUR_OFFSETS, tile_coordinates, tile_position
+
+
+class WalkabilityGrid:
+    """
+    A WalkabilityGrid stores, for each tile of the map, whether it can be crossed by a movable entity.
+    The static part is built once from the obstacles layer of the map, while a dynamic overlay counts
+    the entities (movables, chests, doors, breakables...) currently blocking each tile.
+
+    Tiles are given in screen tile coordinates, the grid knowing where the map starts on screen.
+    Internally, each tile of the map is identified by a single integer, its index in the grid
+    counting row by row, which is the compact key used by the path finding algorithms.
+
+    Keyword arguments:
+    origin -- the coordinates of the top left tile of the map
+    size -- the width and height of the map in tiles
+    walkable_tiles -- for each tile of the map, row by row, 1 if it is not an obstacle and 0 otherwise
+
+    Attributes:
+    origin_x -- the horizontal coordinate of the top left tile of the map
+    origin_y -- the vertical coordinate of the top left tile of the map
+    width -- the width of the map in tiles
+    height -- the height of the map in tiles
+    version -- a counter increased each time the walkability of a tile changes
+    walkable -- for each tile index, 1 if the tile can currently be crossed and 0 otherwise
+    neighbours -- for each tile index, the indexes of the tiles next to it in the map
+    _static_walkable -- for each tile, 1 if it is not an obstacle and 0 otherwise
+    _blockers -- for each tile, the number of entities currently blocking it
+    _changes -- the indexes of the tiles whose walkability changed, one for each version following _changes_start
+    _changes_start -- the oldest version from which the changes are still known
+    """
+
+    def __init__(
+        self, origin: tuple[int, int], size: tuple[int, int], walkable_tiles: bytearray
+    ) -> None:
+        self.origin_x, self.origin_y = origin
+        self.width, self.height = size
+        self.version: int = 0
+        self.walkable: bytearray = bytearray(walkable_tiles)
+        self.neighbours: list[tuple[int, ...]] = [
+            self._compute_neighbours(index) for index in range(len(walkable_tiles))
+        ]
+        self._static_walkable: bytearray = walkable_tiles
+        self._blockers: bytearray = bytearray(len(walkable_tiles))
+        self._changes: list[int] = []
+        self._changes_start: int = 0
+
+    def _compute_neighbours(self, index: int) -> tuple[int, ...]:
+        x_coordinate, y_coordinate = index % self.width, index // self.width
+        return tuple(
+            (y_coordinate + offset_y) * self.width + x_coordinate + offset_x
+            for offset_x, offset_y in NEIGHBOUR_OFFSETS
+            if 0 <= x_coordinate + offset_x < self.width
+            and 0 <= y_coordinate + offset_y < self.height
+        )
+
+    def copy(self) -> WalkabilityGrid:
+        """
+        Return an independent grid in the same state as this one,
+        whose blockers can be changed without affecting this grid.
+        """
+        grid = copy.copy(self)
+        # The static part and the neighbourhoods never change, they can be shared
+        grid.walkable = bytearray(self.walkable)
+        grid._blockers = bytearray(self._blockers)
+        grid._changes = list(self._changes)
+        return grid
+
+    def in_bounds(self, tile: tuple[int, int]) -> bool:
+        """
+        Return whether the given tile is part of the map or not.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile
+        """
+        return (
+            0 <= tile[0] - self.origin_x < self.width
+            and 0 <= tile[1] - self.origin_y < self.height
+        )
+
+    def index(self, tile: tuple[int, int]) -> Optional[int]:
+        """
+        Return the index of the given tile in the grid or None if the tile is out of the map.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile
+        """
+        if not self.in_bounds(tile):
+            return None
+        return (tile[1] - self.origin_y) * self.width + tile[0] - self.origin_x
+
+    def position_index(self, position: Position) -> Optional[int]:
+        """
+        Return the index of the tile containing the given position or None if it is out of the map.
+
+        Keyword arguments:
+        position -- the position on screen
+        """
+        return self.index(tile_coordinates(position))
+
+    def tile(self, index: int) -> tuple[int, int]:
+        """
+        Return the coordinates of the tile with the given index.
+
+        Keyword arguments:
+        index -- the index of the tile in the grid
+        """
+        return self.origin_x + index % self.width, self.origin_y + index // self.width
+
+    def position(self, index: int) -> Position:
+        """
+        Return the position on screen of the top left corner of the tile with the given index.
+
+        Keyword arguments:
+        index -- the index of the tile in the grid
+        """
+        return tile_position(self.tile(index))
+
+    def is_walkable(self, tile: tuple[int, int]) -> bool:
+        """
+        Return whether the given tile can currently be accessed or not.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile
+        """
+        index = self.index(tile)
+        return index is not None and self.walkable[index] == 1
+
+    def add_blocker(self, tile: tuple[int, int]) -> None:
+        """
+        Register one more entity blocking the given tile.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile
+        """
+        index = self.index(tile)
+        if index is not None:
+            self._blockers[index] += 1
+            if self._blockers[index] == 1 and self._static_walkable[index] == 1:
+                self.walkable[index] = 0
+                self._record_change(index)
+
+    def remove_blocker(self, tile: tuple[int, int]) -> None:
+        """
+        Unregister one of the entities blocking the given tile.
+
+        Keyword arguments:
+        tile -- the coordinates of the tile
+        """
+        index = self.index(tile)
+        if index is not None and self._blockers[index] > 0:
+            self._blockers[index] -= 1
+            if self._blockers[index] == 0 and self._static_walkable[index] == 1:
+                self.walkable[index] = 1
+                self._record_change(index)
+
+    def clear_blockers(self) -> None:
+        """
+        Forget all the entities blocking tiles, leaving only the static obstacles.
+        """
+        self._blockers = bytearray(len(self._static_walkable))
+        self.walkable = bytearray(self._static_walkable)
+        self.version += 1
+        # Individual changes are not tracked through a reset
+        self._changes.clear()
+        self._changes_start = self.version
+
+    def changes_since(self, version: int) -> Optional[list[int]]:
+        """
+        Return the indexes of the tiles whose walkability changed since the given version, in order
+        and possibly with repetitions, or None if these changes are no longer known.
+
+        Keyword arguments:
+        version -- the version from which the changes are requested
+        """
+        if version < self._changes_start:
+            return None
+        return self._changes[version - self._changes_start :]
+
+    def _record_change(self, index: int) -> None:
+        self.version += 1
+        self._changes.append(index)
+        if len(self._changes) > len(self._static_walkable):
+            # Past this size, anyone still behind would be better off starting over
+            dropped = len(self._changes) // 2
+            del self._changes[:dropped]
+            self._changes_start += dropped
@@ -16,6 +16,7 @@ from src.game_entities.player import Player
 from src.game_entities.shield import Shield
 from src.game_entities.weapon import Weapon
 from src.gui.position import Position
+from src.services.tiles import tile_position
 
 ALPHABET = "abcdefghijklmnopqrstuvwxyz"
 STATS = ("strength", "defense", "resistance", "speed")
@@ -376,6 +377,35 @@ def random_movable_entity(min_hp=10, max_hp=30, max_defense=10, max_res=10, name
     )
 
 
+def planned_foe(tile, strategy, max_moves=5):
+    """
+
+    :param tile: the coordinates of the tile of the foe
+    :param strategy: the name of the strategy followed by the foe
+    :param max_moves: the maximum number of tiles the foe can travel
+    :return: a foe attacking at reach 1, ready to be planned by the AI
+    """
+    attributes = random_foe_attributes(10, 30, 10, 10, None, [1], [], None)
+    return Foe(
+        attributes["name"],
+        tile_position(tile),
+        attributes["sprite"],
+        attributes["hp"],
+        attributes["defense"],
+        attributes["res"],
+        max_moves,
+        attributes["strength"],
+        attributes["attack_kind"],
+        strategy,
+        attributes["reach"],
+        attributes["xp_gain"],
+        attributes["loot"],
+        attributes["keywords"],
+        attributes["lvl"],
+        attributes["alterations"],
+    )
+
+
 def random_character_attributes(
     min_hp,
     max_hp,
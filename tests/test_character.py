@@ -1,5 +1,7 @@
 import unittest
 
+import pygame
+
 from src.game_entities.character import Character
 from src.game_entities.movable import DamageKind
 from tests.random_data_library import (random_character_entity,
@@ -135,3 +137,32 @@ class TestCharacter(unittest.TestCase):
             character_test.strength + weapon.attack,
             character_test.attack(random_foe_entity()),
         )
+
+    def test_composite_sprite_is_reused(self):
+        equipment = random_equipment()
+        character_test = random_character_entity(equipments=[equipment])
+
+        composite_sprite = character_test.composite_sprite
+
+        self.assertIsNot(character_test.sprite, composite_sprite)
+        self.assertIs(composite_sprite, character_test.composite_sprite)
+        self.assertTrue(character_test.unequip(equipment))
+        self.assertIs(character_test.sprite, character_test.composite_sprite)
+
+    def test_composite_sprite_after_equipment_change(self):
+        first_equipment = random_equipment()
+        second_equipment = random_equipment()
+        character_test = random_character_entity(
+            equipments=[first_equipment, second_equipment]
+        )
+        composite_sprite = character_test.composite_sprite
+
+        character_test.remove_equipment(first_equipment)
+
+        expected_sprite = character_test.sprite.copy()
+        expected_sprite.blit(second_equipment.equipped_sprite, (0, 0))
+        self.assertIsNot(composite_sprite, character_test.composite_sprite)
+        self.assertEqual(
+            pygame.image.tobytes(expected_sprite, "RGBA"),
+            pygame.image.tobytes(character_test.composite_sprite, "RGBA"),
+        )
@@ -1,7 +1,11 @@
 import random as rd
 import unittest
 
-from src.game_entities.destroyable import DamageKind, Destroyable
+import pygame
+
+from src.game_entities.destroyable import (DamageKind, Destroyable,
+                                           damage_bar)
+from src.gui.constant_sprites import constant_sprites
 from tests.random_data_library import (random_destroyable_entity,
                                        random_movable_entity)
 from tests.tools import minimal_setup_for_game
@@ -146,6 +150,45 @@ class TestDestroyable(unittest.TestCase):
         self.assertEqual(destroyable.hit_points_max, destroyable.hit_points)
         self.assertEqual(hp_max_init, destroyable.hit_points_max)
 
+    def test_damage_bars_are_scaled_once(self):
+        bar = damage_bar("heavily_damaged", 10)
+
+        self.assertIs(bar, damage_bar("heavily_damaged", 10))
+        self.assertIsNot(bar, damage_bar("heavily_damaged", 11))
+        self.assertEqual(
+            (10, constant_sprites["heavily_damaged"].get_height()), bar.get_size()
+        )
+
+    def test_display_hit_points(self):
+        destroyable = random_destroyable_entity(min_hp=10)
+        destroyable.position = (0, 0)
+        destroyable.hit_points = destroyable.hit_points_max // 3
+        screen = pygame.Surface((100, 100))
+
+        destroyable.display_hit_points(screen)
+
+        expected_screen = pygame.Surface((100, 100))
+        expected_screen.blit(constant_sprites["hp_bar"], (0, 0))
+        expected_bar = constant_sprites["heavily_damaged"]
+        expected_screen.blit(
+            pygame.transform.scale(
+                expected_bar,
+                (
+                    int(
+                        expected_bar.get_width()
+                        * destroyable.hit_points
+                        / destroyable.hit_points_max
+                    ),
+                    expected_bar.get_height(),
+                ),
+            ),
+            (0, 0),
+        )
+        self.assertEqual(
+            pygame.image.tobytes(expected_screen, "RGB"),
+            pygame.image.tobytes(screen, "RGB"),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import pygame
+
+from src.gui.dirty_areas import DirtyAreas, merge_areas
+
+
+class TestDirtyAreas(unittest.TestCase):
+    def setUp(self):
+        self.dirty_areas = DirtyAreas((100, 100))
+        self.frame = {
+            "unit": (pygame.Rect(0, 0, 10, 10), "standing"),
+            "sidebar": (pygame.Rect(0, 90, 100, 10), 1),
+        }
+
+    def test_first_frame_is_unknown(self):
+        self.assertIsNone(self.dirty_areas.changes(self.frame))
+        self.assertEqual([], self.dirty_areas.changes(self.frame))
+
+    def test_moved_part(self):
+        self.dirty_areas.changes(self.frame)
+
+        areas = self.dirty_areas.changes(
+            {**self.frame, "unit": (pygame.Rect(30, 0, 10, 10), "standing")}
+        )
+
+        self.assertEqual([pygame.Rect(0, 0, 10, 10), pygame.Rect(30, 0, 10, 10)], areas)
+
+    def test_changed_and_removed_parts(self):
+        self.dirty_areas.changes(self.frame)
+
+        areas = self.dirty_areas.changes(
+            {"unit": (pygame.Rect(0, 0, 10, 10), "attacking")}
+        )
+
+        self.assertEqual([pygame.Rect(0, 0, 10, 10), pygame.Rect(0, 90, 100, 10)], areas)
+
+    def test_too_many_changes(self):
+        self.dirty_areas.changes(self.frame)
+
+        self.assertIsNone(
+            self.dirty_areas.changes({"menu": (pygame.Rect(0, 0, 80, 80), None)})
+        )
+
+    def test_forget(self):
+        self.dirty_areas.changes(self.frame)
+        self.dirty_areas.forget()
+
+        self.assertIsNone(self.dirty_areas.changes(self.frame))
+
+    def test_merge_areas(self):
+        areas = merge_areas(
+            [
+                pygame.Rect(0, 0, 10, 10),
+                pygame.Rect(50, 50, 10, 10),
+                pygame.Rect(5, 5, 10, 10),
+                pygame.Rect(0, 0, 0, 10),
+            ]
+        )
+
+        self.assertEqual([pygame.Rect(50, 50, 10, 10), pygame.Rect(0, 0, 15, 15)], areas)
+
+
+if __name__ == "__main__":
+    unittest.main()
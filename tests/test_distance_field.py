@@ -0,0 +1,112 @@
+import unittest
+
+from src.services.distance_field import DistanceField, DistanceFields
+from src.services.occupancy_grid import OccupancyGrid
+from src.services.tiles import tile_position
+from src.services.walkability_grid import WalkabilityGrid
+from tests.random_data_library import random_movable_entity
+from tests.tools import minimal_setup_for_game
+
+# 5x3 map with a wall in the middle column leaving only the bottom tile open
+#   . . # . .
+#   . . # . .
+#   . . . . .
+WALLED_MAP = bytearray(
+    [
+        1, 1, 0, 1, 1,
+        1, 1, 0, 1, 1,
+        1, 1, 1, 1, 1,
+    ]
+)
+
+
+class TestDistanceField(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.walkability = WalkabilityGrid((0, 0), (5, 3), bytearray(WALLED_MAP))
+
+    def test_distance_from(self):
+        field = DistanceField(self.walkability, (4, 0))
+
+        self.assertEqual(0, field.distance_from((3, 0)))
+        self.assertEqual(0, field.distance_from((4, 1)))
+        self.assertEqual(2, field.distance_from((3, 2)))
+        self.assertEqual(7, field.distance_from((0, 0)))
+
+    def test_distance_from_unreachable(self):
+        self.walkability.add_blocker((2, 2))
+        field = DistanceField(self.walkability, (4, 0))
+
+        self.assertIsNone(field.distance_from((0, 0)))
+        self.assertEqual(2, field.distance_from((3, 2)))
+
+    def test_repair_after_blocker_changes(self):
+        field = DistanceField(self.walkability, (4, 0))
+
+        self.walkability.add_blocker((3, 2))
+        field.refresh((4, 0))
+        self.assertEqual(
+            DistanceField(self.walkability, (4, 0)).distances, field.distances
+        )
+        self.assertIsNone(field.distance_from((0, 0)))
+
+        self.walkability.remove_blocker((3, 2))
+        self.walkability.add_blocker((3, 1))
+        field.refresh((4, 0))
+        self.assertEqual(
+            DistanceField(self.walkability, (4, 0)).distances, field.distances
+        )
+        self.assertEqual(7, field.distance_from((0, 0)))
+
+    def test_repair_after_target_move(self):
+        field = DistanceField(self.walkability, (4, 0))
+
+        field.refresh((1, 0))
+
+        self.assertEqual(
+            DistanceField(self.walkability, (1, 0)).distances, field.distances
+        )
+        self.assertEqual(0, field.distance_from((0, 0)))
+
+    def test_field_shared_until_walkability_changes(self):
+        target = random_movable_entity()
+        target.position = tile_position((4, 0))
+        fields = DistanceFields(self.walkability)
+
+        field = fields.field_to(target)
+        self.assertIs(field, fields.field_to(target))
+        self.assertFalse(field.is_outdated())
+
+        self.walkability.add_blocker((2, 2))
+        self.assertTrue(field.is_outdated())
+        self.assertIsNone(fields.field_to(target).distance_from((0, 0)))
+
+    def test_field_follows_target(self):
+        target = random_movable_entity()
+        target.position = tile_position((4, 0))
+        fields = DistanceFields(self.walkability)
+        fields.prepare([target])
+
+        target.position = tile_position((0, 2))
+
+        self.assertEqual(0, fields.field_to(target).distance_from((0, 1)))
+
+    def test_distances_from(self):
+        first_target = random_movable_entity()
+        first_target.position = tile_position((4, 0))
+        second_target = random_movable_entity()
+        second_target.position = tile_position((0, 2))
+        occupancy = OccupancyGrid(self.walkability)
+        occupancy.rebuild([[first_target, second_target]])
+        fields = DistanceFields(self.walkability)
+
+        distances = fields.distances_from((0, 0), [first_target, second_target], 100)
+
+        self.assertEqual({first_target: 7, second_target: 1}, distances)
+
+
+if __name__ == "__main__":
+    unittest.main()
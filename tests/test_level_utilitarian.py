@@ -284,6 +284,50 @@ class TestLevel(unittest.TestCase):
     def test_cancel_movement_after_trade_items_and_gold_sent_and_received(self):
         pass
 
+    def test_background_is_drawn_once(self):
+        self.import_save_file("tests/test_saves/complete_first_level_save.xml")
+
+        self.level.display()
+        background = self.level.background
+        self.level.display()
+
+        self.assertIsNotNone(background)
+        self.assertIs(background, self.level.background)
+
+    def test_background_is_drawn_again_after_opening_a_chest(self):
+        self.import_save_file("tests/test_saves/complete_first_level_save.xml")
+        player = self.level.players[0]
+        chest = self.level.entities.chests[0]
+        self.level.selected_player = player
+        self.level.display()
+        background = self.level.background
+
+        self.level.open_chest(player, chest)
+        self.level.display()
+
+        self.assertIsNotNone(self.level.background)
+        self.assertIsNot(background, self.level.background)
+
+    def test_only_changes_are_displayed(self):
+        self.import_save_file("tests/test_saves/complete_first_level_save.xml")
+        while self.level.menu_manager.active_menu:
+            self.level.menu_manager.close_active_menu()
+        player = self.level.players[0]
+
+        self.assertIsNone(self.level.display_changes([]))
+        self.assertEqual([], self.level.display_changes([]))
+        player.position = player.position + Position(TILE_SIZE, 0)
+        areas = self.level.display_changes([])
+
+        player_area = player.get_rect().move(
+            self.level.active_screen_part.get_abs_offset()
+        )
+        self.assertTrue(any(area.contains(player_area) for area in areas))
+        self.assertLess(
+            sum(area.w * area.h for area in areas),
+            self.level.screen.get_width() * self.level.screen.get_height() // 10,
+        )
+
     def test_throw_selected_item(self):
         self.import_save_file("tests/test_saves/simple_save.xml")
 
@@ -0,0 +1,69 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.occupancy_grid import OccupancyGrid
+from src.services.tiles import tile_coordinates
+from tests.random_data_library import (random_movable_entity, random_objective,
+                                       random_position)
+from tests.tools import minimal_setup_for_game
+
+
+class TestOccupancyGrid(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def test_get_entity_on_tile(self):
+        movable_entity = random_movable_entity()
+        grid = OccupancyGrid()
+        grid.rebuild([[movable_entity]])
+
+        self.assertIs(
+            movable_entity, grid.get(tile_coordinates(movable_entity.position))
+        )
+        self.assertIsNone(
+            grid.get(tile_coordinates(movable_entity.position + Position(TILE_SIZE, 0)))
+        )
+
+    def test_update_after_move(self):
+        movable_entity = random_movable_entity()
+        grid = OccupancyGrid()
+        grid.rebuild([[movable_entity]])
+        old_tile = tile_coordinates(movable_entity.position)
+
+        movable_entity.position = movable_entity.position + Position(0, TILE_SIZE)
+        grid.update(movable_entity)
+
+        self.assertIsNone(grid.get(old_tile))
+        self.assertIs(
+            movable_entity, grid.get(tile_coordinates(movable_entity.position))
+        )
+
+    def test_remove(self):
+        movable_entity = random_movable_entity()
+        grid = OccupancyGrid()
+        grid.rebuild([[movable_entity]])
+
+        grid.remove(movable_entity)
+
+        self.assertIsNone(grid.get(tile_coordinates(movable_entity.position)))
+
+    def test_priority_on_shared_tile(self):
+        position = random_position()
+        objective = random_objective(position=position)
+        movable_entity = random_movable_entity()
+        movable_entity.position = Position(position[0], position[1] + TILE_SIZE)
+        grid = OccupancyGrid()
+        grid.rebuild([[movable_entity], [objective]])
+
+        self.assertIs(objective, grid.get(tile_coordinates(position)))
+
+        movable_entity.position = position
+        grid.update(movable_entity)
+
+        self.assertIs(movable_entity, grid.get(tile_coordinates(position)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.pathfinding import PossibleMoves, find_path, flood_fill
+from src.services.tiles import tile_position
+from src.services.walkability_grid import WalkabilityGrid
+
+# 5x3 map with a wall in the middle column leaving only the bottom tile open
+#   . . # . .
+#   . . # . .
+#   . . . . .
+WALLED_MAP = bytearray(
+    [
+        1, 1, 0, 1, 1,
+        1, 1, 0, 1, 1,
+        1, 1, 1, 1, 1,
+    ]
+)
+
+
+class TestPathfinding(unittest.TestCase):
+    def setUp(self):
+        self.walkability = WalkabilityGrid((0, 0), (5, 3), bytearray(WALLED_MAP))
+
+    def test_flood_fill_distances(self):
+        possible_moves = flood_fill(self.walkability, (0, 0), 20)
+
+        self.assertEqual(0, possible_moves[tile_position((0, 0))])
+        self.assertEqual(2, possible_moves[tile_position((1, 1))])
+        self.assertEqual(8, possible_moves[Position(4 * TILE_SIZE, 0)])
+        self.assertNotIn(tile_position((2, 0)), possible_moves)
+        self.assertEqual(13, len(possible_moves))
+        self.assertEqual(
+            8, possible_moves.distances[self.walkability.index((4, 0))]
+        )
+
+    def test_flood_fill_max_moves(self):
+        possible_moves = flood_fill(self.walkability, (0, 0), 3)
+
+        self.assertEqual(
+            {(0, 0), (1, 0), (0, 1), (1, 1), (0, 2), (1, 2)},
+            set(possible_moves.tiles()),
+        )
+        self.assertEqual(
+            {tile_position(tile) for tile in possible_moves.tiles()},
+            set(possible_moves),
+        )
+
+    def test_flood_fill_blocked_tile(self):
+        self.walkability.add_blocker((2, 2))
+        possible_moves = flood_fill(self.walkability, (0, 0), 20)
+
+        self.assertNotIn(tile_position((3, 0)), possible_moves)
+
+    def test_path_to(self):
+        possible_moves = flood_fill(self.walkability, (0, 0), 20)
+        destination = tile_position((4, 0))
+
+        path = possible_moves.path_to(destination)
+
+        self.assertEqual(8, len(path))
+        self.assertEqual(destination, path[-1])
+        self.assertIn(tile_position((2, 2)), path)
+        previous = tile_position((0, 0))
+        for position in path:
+            self.assertEqual(
+                TILE_SIZE,
+                abs(position[0] - previous[0]) + abs(position[1] - previous[1]),
+            )
+            previous = position
+
+    def test_path_to_start(self):
+        possible_moves = flood_fill(self.walkability, (1, 1), 3)
+
+        self.assertEqual([tile_position((1, 1))], possible_moves.path_to(tile_position((1, 1))))
+
+    def test_along_path(self):
+        possible_moves = PossibleMoves.along_path(
+            self.walkability,
+            self.walkability.index((0, 0)),
+            [self.walkability.index((1, 0)), self.walkability.index((1, 1))],
+        )
+
+        self.assertEqual(
+            {tile_position((0, 0)): 0, tile_position((1, 0)): 1, tile_position((1, 1)): 2},
+            dict(possible_moves),
+        )
+        self.assertEqual(
+            [tile_position((1, 0)), tile_position((1, 1))],
+            possible_moves.path_to(tile_position((1, 1))),
+        )
+
+    def test_find_path(self):
+        path, cost = find_path(self.walkability, (0, 0), (4, 0))
+
+        self.assertEqual(8, cost)
+        self.assertEqual(8, len(path))
+        self.assertEqual(tile_position((4, 0)), path[-1])
+        self.assertIn(tile_position((2, 2)), path)
+        self.assertEqual(path, find_path(self.walkability, (0, 0), (4, 0))[0])
+
+    def test_find_path_same_cost_as_flood_fill(self):
+        possible_moves = flood_fill(self.walkability, (1, 0), 20)
+
+        for tile in possible_moves.tiles():
+            self.assertEqual(
+                possible_moves[tile_position(tile)],
+                find_path(self.walkability, (1, 0), tile)[1],
+            )
+
+    def test_find_path_cost_bound(self):
+        self.assertIsNone(find_path(self.walkability, (0, 0), (4, 0), 7))
+        self.assertEqual(8, find_path(self.walkability, (0, 0), (4, 0), 8)[1])
+
+    def test_find_path_unreachable(self):
+        self.walkability.add_blocker((2, 2))
+
+        self.assertIsNone(find_path(self.walkability, (0, 0), (4, 0)))
+        self.assertIsNone(find_path(self.walkability, (0, 0), (9, 9)))
+
+    def test_find_path_to_occupied_destination(self):
+        self.walkability.add_blocker((3, 2))
+
+        path, cost = find_path(self.walkability, (0, 0), (3, 2))
+
+        self.assertEqual(5, cost)
+        self.assertEqual(tile_position((3, 2)), path[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.occupancy_grid import OccupancyGrid
+from src.services.pathfinding import flood_fill
+from src.services.range_cache import RangeCache
+from src.services.walkability_grid import WalkabilityGrid
+from tests.random_data_library import random_movable_entity
+from tests.tools import minimal_setup_for_game
+
+
+class TestRangeCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.entity = random_movable_entity()
+        self.entity.position = Position(0, 0)
+        self.occupancy = OccupancyGrid()
+        self.occupancy.rebuild([[self.entity]])
+        self.cache = RangeCache(self.occupancy)
+        walkability = WalkabilityGrid((0, 0), (3, 3), bytearray([1] * 9))
+        self.possible_moves = flood_fill(walkability, (0, 0), 2)
+        self.possible_attacks = frozenset([Position(2 * TILE_SIZE, 0)])
+
+    def test_same_board_and_parameters(self):
+        self.cache.store(
+            self.entity, ((0, 0), 2), self.possible_moves, self.possible_attacks
+        )
+
+        self.assertEqual(
+            (self.possible_moves, self.possible_attacks),
+            self.cache.get(self.entity, ((0, 0), 2)),
+        )
+
+    def test_different_parameters(self):
+        self.cache.store(
+            self.entity, ((0, 0), 2), self.possible_moves, self.possible_attacks
+        )
+
+        self.assertIsNone(self.cache.get(self.entity, ((0, 0), 3)))
+
+    def test_invalidated_by_occupancy_change(self):
+        other_entity = random_movable_entity()
+        other_entity.position = Position(2 * TILE_SIZE, 2 * TILE_SIZE)
+        self.occupancy.rebuild([[self.entity, other_entity]])
+        self.cache.store(
+            self.entity, ((0, 0), 2), self.possible_moves, self.possible_attacks
+        )
+
+        other_entity.position = Position(TILE_SIZE, 2 * TILE_SIZE)
+        self.occupancy.update(other_entity)
+
+        self.assertIsNone(self.cache.get(self.entity, ((0, 0), 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
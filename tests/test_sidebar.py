@@ -0,0 +1,49 @@
+import unittest
+
+import pygame
+
+from src.constants import MENU_HEIGHT, MENU_WIDTH
+from src.gui.position import Position
+from src.gui.sidebar import Sidebar
+from tests.random_data_library import random_movable_entity
+from tests.tools import minimal_setup_for_game
+
+
+class TestSidebar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.sidebar = Sidebar((MENU_WIDTH, MENU_HEIGHT), Position(0, 0), [], 0)
+        self.screen = pygame.Surface((MENU_WIDTH, MENU_HEIGHT))
+        self.entity = random_movable_entity()
+
+    def test_rendering_is_reused(self):
+        self.sidebar.display(self.screen, 1, self.entity)
+        rendering = self.sidebar.rendering
+        sections = dict(self.sidebar.sections)
+
+        self.sidebar.display(self.screen, 1, self.entity)
+
+        self.assertIs(rendering, self.sidebar.rendering)
+        self.assertEqual(sections, self.sidebar.sections)
+
+    def test_only_changed_sections_are_rendered_again(self):
+        self.sidebar.display(self.screen, 1, self.entity)
+        turn_section = self.sidebar.sections["turn"]
+        entity_section = self.sidebar.sections["hovered_entity"]
+
+        self.entity.hit_points -= 1
+        self.sidebar.display(self.screen, 1, self.entity)
+
+        self.assertIs(turn_section, self.sidebar.sections["turn"])
+        self.assertIsNot(entity_section, self.sidebar.sections["hovered_entity"])
+
+        self.sidebar.display(self.screen, 2, self.entity, 0.5)
+
+        self.assertIsNot(turn_section, self.sidebar.sections["turn"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from src.services.sound_bank import SOUND_DIRECTORY, SoundBank
+from tests.random_data_library import random_movable_entity
+from tests.tools import minimal_setup_for_game
+
+
+class TestSoundBank(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def test_sound_is_loaded_once(self):
+        sound_bank = SoundBank(SOUND_DIRECTORY)
+        self.assertEqual(0, len(sound_bank))
+
+        sound = sound_bank.get("walk.ogg")
+
+        self.assertIs(sound, sound_bank.get("walk.ogg"))
+        self.assertIsNot(sound, sound_bank.get("attack.ogg"))
+        self.assertEqual(2, len(sound_bank))
+
+    def test_entities_share_their_sounds(self):
+        first_movable = random_movable_entity()
+        second_movable = random_movable_entity()
+
+        self.assertIs(first_movable.walk_sfx, second_movable.walk_sfx)
+        self.assertIs(first_movable.attack_sfx, second_movable.attack_sfx)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import gc
+import unittest
+
+import pygame
+
+from src.constants import TILE_SIZE
+from src.game_entities.entity import Entity
+from src.game_entities.movable import Movable
+from src.gui.sprite_registry import SpriteRegistry, get_sprite
+from tests.tools import minimal_setup_for_game
+
+SKELETON_SPRITE = (
+    "imgs/dungeon_crawl/monster/undead/skeletons/skeleton_humanoid_large_new.png"
+)
+HELMET_SPRITE = "imgs/dungeon_crawl/player/head/art_dragonhelm.png"
+
+
+class TestSpriteRegistry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.sprite_registry = SpriteRegistry()
+
+    def test_sprite_is_loaded_once_by_size(self):
+        sprite = self.sprite_registry.get(SKELETON_SPRITE)
+
+        self.assertEqual((TILE_SIZE, TILE_SIZE), sprite.get_size())
+        self.assertIs(sprite, self.sprite_registry.get(SKELETON_SPRITE))
+        self.assertIsNot(sprite, self.sprite_registry.get(SKELETON_SPRITE, (10, 10)))
+        self.assertEqual(2, len(self.sprite_registry))
+        self.assertEqual(1, self.sprite_registry.hits)
+        self.assertEqual(2, self.sprite_registry.misses)
+        self.assertAlmostEqual(1 / 3, self.sprite_registry.hit_rate)
+
+    def test_surface_is_scaled_once_by_size(self):
+        tile = pygame.Surface((32, 32))
+
+        scaled_tile = self.sprite_registry.scale(tile)
+
+        self.assertEqual((TILE_SIZE, TILE_SIZE), scaled_tile.get_size())
+        self.assertIs(scaled_tile, self.sprite_registry.scale(tile))
+        self.assertIsNot(scaled_tile, self.sprite_registry.scale(tile, (10, 10)))
+        self.assertIsNot(
+            scaled_tile, self.sprite_registry.scale(pygame.Surface((32, 32)))
+        )
+        self.assertEqual(1, self.sprite_registry.hits)
+
+    def test_scaled_surfaces_are_forgotten_with_their_original(self):
+        tile = pygame.Surface((32, 32))
+        self.sprite_registry.scale(tile)
+        self.assertEqual(1, len(self.sprite_registry))
+
+        del tile
+        gc.collect()
+
+        self.assertEqual(0, len(self.sprite_registry))
+
+    def test_clear(self):
+        self.sprite_registry.get(SKELETON_SPRITE)
+
+        self.sprite_registry.clear()
+
+        self.assertEqual(0, len(self.sprite_registry))
+        self.assertEqual(0, self.sprite_registry.hit_rate)
+
+    def test_entities_share_their_sprite(self):
+        first_entity = Entity("Skeleton", (0, 0), SKELETON_SPRITE)
+        second_entity = Entity("Skeleton", (TILE_SIZE, 0), SKELETON_SPRITE)
+
+        self.assertIs(first_entity.sprite, second_entity.sprite)
+
+    def test_drawn_sprite_is_not_shared(self):
+        shared_sprite = get_sprite(SKELETON_SPRITE)
+        shared_pixels = pygame.image.tobytes(shared_sprite, "RGBA")
+
+        movable = Movable(
+            "Skeleton",
+            (0, 0),
+            SKELETON_SPRITE,
+            10,
+            0,
+            0,
+            3,
+            2,
+            "PHYSICAL",
+            "STATIC",
+            complementary_sprite_link=HELMET_SPRITE,
+        )
+
+        self.assertIsNot(shared_sprite, movable.sprite)
+        self.assertEqual(shared_pixels, pygame.image.tobytes(shared_sprite, "RGBA"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import pickle
+import unittest
+
+from src.services.tactical_ai import (BoardState, UnitState, best_candidate,
+                                      discard_evaluation_pool,
+                                      evaluate_candidates, evaluation_pool)
+
+
+def unit(tile, hit_points=10, strength=5, reach=(1,), max_moves=2):
+    return UnitState(tile, hit_points, 1, 1, strength, False, reach, max_moves)
+
+
+class TestTacticalAi(unittest.TestCase):
+    def setUp(self):
+        # 5x5 open map, the tiles of the units being blocked
+        self.walkable = bytearray([1] * 25)
+
+    def state(self, tactical_unit, opponents):
+        for blocked in [tactical_unit] + opponents:
+            self.walkable[blocked.tile] = 0
+        return BoardState(5, 5, self.walkable, tactical_unit, opponents)
+
+    def test_damage_to(self):
+        attacker = unit(0, strength=5)
+
+        self.assertEqual(4, attacker.damage_to(unit(1)))
+        self.assertEqual(2, attacker.damage_to(unit(1, hit_points=2)))
+        self.assertEqual(0, unit(0, strength=1).damage_to(unit(1)))
+
+    def test_candidates(self):
+        state = self.state(unit(0, max_moves=1), [unit(2)])
+
+        candidates = state.candidates()
+
+        self.assertIn((0, None), candidates)
+        self.assertIn((1, None), candidates)
+        self.assertIn((1, 0), candidates)
+        self.assertIn((5, None), candidates)
+        self.assertNotIn((5, 0), candidates)
+        self.assertEqual(4, len(candidates))
+
+    def test_prefers_defeating_an_opponent(self):
+        weak_opponent = unit(4, hit_points=2, strength=0)
+        strong_opponent = unit(20, hit_points=30, strength=0)
+        state = self.state(unit(2), [weak_opponent, strong_opponent])
+        candidates = state.candidates()
+
+        scores = evaluate_candidates(state, candidates)
+
+        self.assertEqual((3, 0), best_candidate(candidates, scores))
+
+    def test_keeps_out_of_reach_of_dangerous_opponents(self):
+        dangerous_opponent = unit(4, hit_points=30, strength=30, max_moves=1)
+        state = self.state(unit(0, max_moves=1), [dangerous_opponent])
+        candidates = state.candidates()
+
+        destination, attacked = best_candidate(
+            candidates, evaluate_candidates(state, candidates)
+        )
+
+        self.assertIsNone(attacked)
+        self.assertGreater(state.distance(destination, 4), 2)
+
+    def test_best_candidate_ties(self):
+        candidates = [(0, None), (1, None), (2, None)]
+
+        self.assertEqual((1, None), best_candidate(candidates, [0.0, 1.0, 1.0]))
+
+    def test_state_can_be_sent_to_other_processes(self):
+        state = self.state(unit(0), [unit(2)])
+        candidates = state.candidates()
+
+        copied_state = pickle.loads(pickle.dumps(state))
+
+        self.assertEqual(
+            evaluate_candidates(state, candidates),
+            evaluate_candidates(copied_state, candidates),
+        )
+
+    def test_discarded_pool_is_replaced(self):
+        pool = evaluation_pool()
+        self.assertIs(pool, evaluation_pool())
+
+        discard_evaluation_pool(pool)
+
+        new_pool = evaluation_pool()
+        self.assertIsNot(pool, new_pool)
+        discard_evaluation_pool(new_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+import pygame
+
+from src.constants import BLACK, WHITE
+from src.gui.fonts import fonts
+from src.gui.text_cache import TextCache
+from tests.tools import minimal_setup_for_game
+
+
+class TestTextCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.text_cache = TextCache(2)
+
+    def test_same_text_is_rendered_once(self):
+        surface = self.text_cache.render("ITEM_FONT", "Potion", True, BLACK)
+
+        self.assertIs(
+            surface, self.text_cache.render("ITEM_FONT", "Potion", True, (0, 0, 0))
+        )
+        self.assertEqual(1, self.text_cache.hits)
+        self.assertEqual(1, self.text_cache.misses)
+        expected_surface = fonts["ITEM_FONT"].render("Potion", True, BLACK)
+        self.assertEqual(
+            pygame.image.tobytes(expected_surface, "RGBA"),
+            pygame.image.tobytes(surface, "RGBA"),
+        )
+
+    def test_every_argument_is_part_of_the_key(self):
+        surface = self.text_cache.render("ITEM_FONT", "Potion", True, BLACK)
+
+        self.assertIsNot(
+            surface, self.text_cache.render("ITEM_FONT", "Potion", True, WHITE)
+        )
+        self.assertIsNot(
+            surface, self.text_cache.render("ITEM_FONT", "Potion", False, BLACK)
+        )
+        self.assertIsNot(
+            surface, self.text_cache.render("ITEM_FONT", "Potion", True, BLACK, WHITE)
+        )
+        self.assertEqual(0, self.text_cache.hits)
+
+    def test_least_recently_used_text_is_forgotten(self):
+        first_surface = self.text_cache.render("ITEM_FONT", "first", True, BLACK)
+        second_surface = self.text_cache.render("ITEM_FONT", "second", True, BLACK)
+        self.text_cache.render("ITEM_FONT", "first", True, BLACK)
+
+        self.text_cache.render("ITEM_FONT", "third", True, BLACK)
+
+        self.assertEqual(2, len(self.text_cache))
+        self.assertIs(
+            first_surface, self.text_cache.render("ITEM_FONT", "first", True, BLACK)
+        )
+        self.assertIsNot(
+            second_surface, self.text_cache.render("ITEM_FONT", "second", True, BLACK)
+        )
+
+    def test_clear(self):
+        self.text_cache.render("ITEM_FONT", "Potion", True, BLACK)
+
+        self.text_cache.clear()
+
+        self.assertEqual(0, len(self.text_cache))
+        self.assertEqual(0, self.text_cache.misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.gui.texture_atlas import build_atlas, load_atlas, pack_sprites
+from tests.tools import minimal_setup_for_game
+
+LANDING_SPRITE = "imgs/dungeon_crawl/misc/move.png"
+CURSOR_SPRITE = "imgs/dungeon_crawl/misc/cursor.png"
+NEW_TURN_SPRITE = "imgs/interface/new_turn.png"
+
+
+class TestTextureAtlas(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def test_pack_sprites(self):
+        placements = pack_sprites([(30, 20), (40, 40), (50, 30), (200, 10)], 100)
+
+        self.assertEqual(
+            [
+                (0, pygame.Rect(0, 40, 30, 20)),
+                (0, pygame.Rect(0, 0, 40, 40)),
+                (0, pygame.Rect(40, 0, 50, 30)),
+                None,
+            ],
+            placements,
+        )
+
+    def test_pack_sprites_in_several_sheets(self):
+        placements = pack_sprites([(60, 60), (60, 60)], 100)
+
+        self.assertEqual(
+            [(0, pygame.Rect(0, 0, 60, 60)), (1, pygame.Rect(0, 0, 60, 60))],
+            placements,
+        )
+
+    def test_sprites_are_handed_out_from_sheets(self):
+        with tempfile.TemporaryDirectory() as directory:
+            build_atlas(
+                [[LANDING_SPRITE, CURSOR_SPRITE], [CURSOR_SPRITE, NEW_TURN_SPRITE]],
+                directory,
+            )
+            atlas = load_atlas(directory)
+
+            self.assertEqual(2, len(atlas.sheet_names))
+            self.assertEqual(0, atlas.regions[os.path.normpath(CURSOR_SPRITE)][0])
+            self.assertIsNone(atlas.get("imgs/dungeon_crawl/misc/attackable.png"))
+            for path in (LANDING_SPRITE, CURSOR_SPRITE, NEW_TURN_SPRITE):
+                sprite = atlas.get(path)
+                self.assertIs(atlas.sheets[atlas.regions[path][0]], sprite.get_parent())
+                self.assertEqual(
+                    pygame.image.tobytes(
+                        pygame.image.load(path).convert_alpha(), "RGBA"
+                    ),
+                    pygame.image.tobytes(sprite, "RGBA"),
+                )
+
+    def test_missing_atlas(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(load_atlas(directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
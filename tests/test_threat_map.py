@@ -0,0 +1,95 @@
+import unittest
+
+from src.services.threat_map import ThreatMap, max_reach
+from src.services.tiles import manhattan_distance, tile_coordinates, tile_position
+from tests.random_data_library import planned_foe, random_movable_entity
+from tests.tools import minimal_setup_for_game
+
+
+class TestThreatMap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.first_target = random_movable_entity()
+        self.first_target.position = tile_position((5, 5))
+        self.second_target = random_movable_entity()
+        self.second_target.position = tile_position((7, 5))
+        self.targets = [self.first_target, self.second_target]
+
+    def test_threats_at(self):
+        threat_map = ThreatMap(self.targets, 3)
+
+        for x_coordinate in range(12):
+            for y_coordinate in range(12):
+                threats = threat_map.threats_at(
+                    tile_position((x_coordinate, y_coordinate))
+                )
+                expected_threats = [
+                    (target, distance)
+                    for target in self.targets
+                    for distance in [
+                        manhattan_distance(
+                            (x_coordinate, y_coordinate),
+                            tile_coordinates(target.position),
+                        )
+                    ]
+                    if 1 <= distance <= 3
+                ]
+                self.assertEqual(expected_threats, threats)
+
+    def test_max_reach(self):
+        foe = planned_foe((0, 0), "STATIC")
+        foe.reach = [1, 3]
+
+        self.assertEqual(3, max_reach([foe, planned_foe((1, 0), "STATIC")]))
+        self.assertEqual(0, max_reach([]))
+
+    def test_danger_zone(self):
+        foe = planned_foe((5, 5), "STATIC")
+        foe.reach = [2]
+
+        danger_zone = ThreatMap([foe], max_reach([foe])).danger_zone()
+
+        self.assertEqual(8, len(danger_zone))
+        self.assertIn(tile_position((5, 7)), danger_zone)
+        self.assertNotIn(tile_position((5, 6)), danger_zone)
+
+    def test_determine_move_matches_distance_checks(self):
+        foe = planned_foe((0, 0), "SEMI_ACTIVE")
+        foe.reach = [2, 1]
+        possible_moves = {
+            tile_position((x_coordinate, y_coordinate)): x_coordinate + y_coordinate
+            for x_coordinate in range(10)
+            for y_coordinate in range(10)
+            if (x_coordinate, y_coordinate) not in ((5, 5), (7, 5))
+        }
+        targets = {self.second_target: 12, self.first_target: 10}
+        threat_map = ThreatMap(self.targets, max_reach([foe]))
+
+        move = foe.determine_move(possible_moves, targets, threat_map)
+        target = foe.target
+
+        self.assertEqual(foe.determine_move(possible_moves, targets), move)
+        self.assertIs(foe.target, target)
+        self.assertIs(self.second_target, target)
+        self.assertEqual((6, 4), tile_coordinates(move))
+
+    def test_determine_attack_matches_distance_checks(self):
+        foe = planned_foe((6, 5), "STATIC")
+        threat_map = ThreatMap(self.targets, max_reach([foe]))
+
+        attack = foe.determine_attack(self.targets, foe.position, threat_map)
+
+        self.assertEqual(foe.determine_attack(self.targets, foe.position), attack)
+        self.assertEqual(self.second_target.position, attack)
+        foe.target = self.first_target
+        self.assertEqual(
+            self.first_target.position,
+            foe.determine_attack(self.targets, foe.position, threat_map),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
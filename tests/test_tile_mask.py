@@ -0,0 +1,54 @@
+import unittest
+
+from src.services.tile_mask import TileMask, manhattan_ring
+
+
+class TestTileMask(unittest.TestCase):
+    def test_manhattan_ring(self):
+        self.assertEqual({(-1, 0), (0, 1), (0, -1), (1, 0)}, set(manhattan_ring(1)))
+        self.assertEqual(8, len(manhattan_ring(2)))
+        for offset_x, offset_y in manhattan_ring(3):
+            self.assertEqual(3, abs(offset_x) + abs(offset_y))
+
+    def test_add_and_contains(self):
+        mask = TileMask((2, 1), (4, 3), 2, [(2, 1), (5, 3)])
+        mask.add((9, 9))
+
+        self.assertIn((2, 1), mask)
+        self.assertIn((5, 3), mask)
+        self.assertNotIn((3, 1), mask)
+        self.assertNotIn((9, 9), mask)
+        self.assertEqual([(2, 1), (5, 3)], list(mask.tiles()))
+
+    def test_dilated_does_not_wrap_around_rows(self):
+        # The tile is on the right border, dilating it should not reach the left border of the next row
+        mask = TileMask((0, 0), (4, 3), 2, [(3, 1)])
+
+        self.assertEqual({(2, 1), (3, 0), (3, 2)}, set(mask.dilated([1]).tiles()))
+        self.assertEqual({(1, 1), (2, 0), (2, 2)}, set(mask.dilated([2]).tiles()))
+
+    def test_dilated_by_several_distances(self):
+        mask = TileMask((0, 0), (5, 5), 2, [(2, 2)])
+
+        dilated = mask.dilated([1, 2])
+
+        self.assertEqual(12, len(list(dilated.tiles())))
+        self.assertNotIn((2, 2), dilated)
+        self.assertIn((4, 2), dilated)
+
+    def test_dilated_beyond_margin(self):
+        mask = TileMask((0, 0), (5, 5), 1, [(2, 2)])
+
+        self.assertRaises(ValueError, mask.dilated, [2])
+
+    def test_intersection(self):
+        moves = TileMask((0, 0), (5, 5), 1, [(0, 0), (1, 0)])
+        targets = TileMask((0, 0), (5, 5), 1, [(2, 0), (4, 4)])
+
+        attackable = moves.dilated([1]).intersection(targets)
+
+        self.assertEqual([(2, 0)], list(attackable.tiles()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import pygame
+
+from src.constants import TILE_SIZE
+from src.gui.constant_sprites import LANDING_OPACITY, constant_sprites
+from src.gui.tile_overlay import TileOverlay
+from tests.tools import minimal_setup_for_game
+
+
+class TestTileOverlay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.overlay = TileOverlay(constant_sprites["landing"], LANDING_OPACITY)
+        self.tiles = [(TILE_SIZE, 0), (3 * TILE_SIZE, 2 * TILE_SIZE)]
+
+    def test_tiles_are_highlighted(self):
+        screen = pygame.Surface((5 * TILE_SIZE, 5 * TILE_SIZE))
+        screen.fill((10, 80, 30))
+        expected_screen = screen.copy()
+        sprite_opacity = constant_sprites["landing"].get_alpha()
+        tile_sprite = constant_sprites["landing"].copy()
+        tile_sprite.set_alpha(LANDING_OPACITY)
+        for tile in self.tiles:
+            expected_screen.blit(tile_sprite, tile)
+
+        self.overlay.display(screen, self.tiles)
+
+        self.assertEqual(
+            pygame.image.tobytes(expected_screen, "RGB"),
+            pygame.image.tobytes(screen, "RGB"),
+        )
+        self.assertEqual(
+            pygame.Rect(TILE_SIZE, 0, 3 * TILE_SIZE, 3 * TILE_SIZE), self.overlay.area
+        )
+        self.assertEqual(sprite_opacity, constant_sprites["landing"].get_alpha())
+
+    def test_surface_is_drawn_only_when_tiles_change(self):
+        self.overlay.update(self.tiles)
+        surface = self.overlay.surface
+
+        self.overlay.update(list(reversed(self.tiles)))
+        self.assertIs(surface, self.overlay.surface)
+
+        self.overlay.update(self.tiles[:1])
+        self.assertIsNot(surface, self.overlay.surface)
+
+        self.overlay.update([])
+        self.assertIsNone(self.overlay.surface)
+
+
+if __name__ == "__main__":
+    unittest.main()
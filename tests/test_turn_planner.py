@@ -0,0 +1,204 @@
+import time
+import unittest
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+from src.services.occupancy_grid import OccupancyGrid
+from src.services.tiles import manhattan_distance, tile_coordinates, tile_position
+from src.services.turn_planner import (PlanningBoard, TurnPlanner,
+                                       TurnPlanning)
+from src.services.walkability_grid import WalkabilityGrid
+from tests.random_data_library import planned_foe, random_movable_entity
+from tests.tools import minimal_setup_for_game
+
+
+class FailingExecutor(Executor):
+    """
+    Executor refusing new tasks if the given failure is an OSError,
+    and otherwise failing all of them with it, as a broken process pool does.
+    """
+
+    def __init__(self, failure):
+        self.failure = failure
+        self.is_shut_down = False
+
+    def submit(self, function, /, *args, **kwargs):
+        if isinstance(self.failure, OSError):
+            raise self.failure
+        future = Future()
+        future.set_exception(self.failure)
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.is_shut_down = True
+
+
+class TestTurnPlanner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.walkability = WalkabilityGrid((0, 0), (5, 3), bytearray([1] * 15))
+        self.target = random_movable_entity()
+        self.target.position = tile_position((4, 1))
+
+    def plan(self, foes):
+        OccupancyGrid(self.walkability).rebuild([foes, [self.target]])
+        planner = TurnPlanner(PlanningBoard(self.walkability, 100))
+        return planner.plan(foes, [self.target])
+
+    def test_reserved_tiles_are_not_shared(self):
+        first_foe = planned_foe((0, 1), "ACTIVE")
+        second_foe = planned_foe((0, 0), "ACTIVE")
+
+        turn_plan = self.plan([first_foe, second_foe])
+
+        destinations = [
+            tile_coordinates(turn_plan[foe].path[-1]) for foe in (first_foe, second_foe)
+        ]
+        self.assertEqual((3, 1), destinations[0])
+        self.assertNotEqual(destinations[0], destinations[1])
+        for destination in destinations:
+            self.assertEqual(1, manhattan_distance(destination, (4, 1)))
+        for foe in (first_foe, second_foe):
+            self.assertIs(self.target, turn_plan[foe].attack_target)
+
+    def test_level_walkability_is_not_changed(self):
+        foe = planned_foe((0, 1), "ACTIVE")
+
+        self.plan([foe])
+
+        self.assertFalse(self.walkability.is_walkable((0, 1)))
+        self.assertTrue(self.walkability.is_walkable((3, 1)))
+
+    def test_active_entity_goes_around_walls(self):
+        walkable = bytearray([1] * 63)
+        for x_coordinate in range(8):
+            walkable[3 * 9 + x_coordinate] = 0
+        self.walkability = WalkabilityGrid((0, 0), (9, 7), walkable)
+        self.target.position = tile_position((1, 6))
+        foe = planned_foe((1, 0), "ACTIVE", max_moves=3)
+
+        for _ in range(8):
+            planned_action = self.plan([foe])[foe]
+            if planned_action.attack_target is not None:
+                break
+            self.assertNotEqual(foe.position, planned_action.path[-1])
+            foe.position = planned_action.path[-1]
+
+        self.assertIs(self.target, planned_action.attack_target)
+        self.assertEqual(
+            1, manhattan_distance(tile_coordinates(planned_action.path[-1]), (1, 6))
+        )
+
+    def test_static_entity_stays_and_attacks(self):
+        foe = planned_foe((3, 1), "STATIC")
+        far_foe = planned_foe((0, 0), "STATIC")
+
+        turn_plan = self.plan([foe, far_foe])
+
+        self.assertEqual([foe.position], turn_plan[foe].path)
+        self.assertIs(self.target, turn_plan[foe].attack_target)
+        self.assertEqual([far_foe.position], turn_plan[far_foe].path)
+        self.assertIsNone(turn_plan[far_foe].attack_target)
+
+    def test_plan_is_invalid_once_an_opponent_is_gone(self):
+        foe = planned_foe((0, 1), "ACTIVE")
+
+        planned_action = self.plan([foe])[foe]
+
+        self.assertTrue(planned_action.is_valid([self.target]))
+        self.assertFalse(planned_action.is_valid([]))
+
+    def test_plan_steps(self):
+        first_foe = planned_foe((0, 1), "ACTIVE")
+        second_foe = planned_foe((0, 0), "ACTIVE")
+        OccupancyGrid(self.walkability).rebuild([[first_foe, second_foe], [self.target]])
+        planner = TurnPlanner(PlanningBoard(self.walkability, 100))
+
+        steps = planner.plan_steps([first_foe, second_foe], [self.target])
+
+        # One step for the distance field to the target, then one for each entity
+        self.assertEqual([0, 1, 2], [next(steps) for _ in range(3)])
+        with self.assertRaises(StopIteration) as stop:
+            next(steps)
+        self.assertEqual([first_foe, second_foe], list(stop.exception.value))
+
+    def test_planning_in_background(self):
+        foe = planned_foe((0, 1), "ACTIVE")
+        OccupancyGrid(self.walkability).rebuild([[foe], [self.target]])
+
+        planning = TurnPlanning(
+            PlanningBoard(self.walkability, 100), [foe], [self.target]
+        )
+        while not planning.update():
+            time.sleep(0.01)
+
+        self.assertEqual(1, planning.progress)
+        turn_plan = planning.result()
+        # The plan is given for the real entities, which have been left untouched
+        self.assertEqual([foe], list(turn_plan))
+        self.assertIs(foe, turn_plan[foe].entity)
+        self.assertIs(self.target, turn_plan[foe].move_target)
+        self.assertIs(self.target, turn_plan[foe].attack_target)
+        self.assertEqual((3, 1), tile_coordinates(turn_plan[foe].path[-1]))
+        self.assertIsNone(foe.target)
+        self.assertEqual(tile_position((0, 1)), foe.position)
+
+    def test_planning_within_time_budget(self):
+        foes = [planned_foe((0, 1), "ACTIVE"), planned_foe((0, 0), "ACTIVE")]
+        OccupancyGrid(self.walkability).rebuild([foes, [self.target]])
+
+        planning = TurnPlanning(
+            PlanningBoard(self.walkability, 100), foes, [self.target], 5
+        )
+        self.assertEqual(0, planning.progress)
+        while not planning.update():
+            pass
+
+        self.assertEqual(1, planning.progress)
+        self.assertEqual(foes, list(planning.result()))
+
+    def test_tactical_entity(self):
+        foe = planned_foe((0, 1), "TACTICAL", max_moves=3)
+        weak_target = planned_foe((3, 1), "STATIC")
+        foe.strength = 10
+        weak_target.hit_points = 1
+        weak_target.defense = weak_target.resistance = 0
+        OccupancyGrid(self.walkability).rebuild([[foe], [weak_target]])
+        planner = TurnPlanner(PlanningBoard(self.walkability, 100))
+
+        planned_action = planner.plan([foe], [weak_target])[foe]
+
+        self.assertIs(weak_target, planned_action.attack_target)
+        self.assertEqual(
+            1, manhattan_distance(tile_coordinates(planned_action.path[-1]), (3, 1))
+        )
+        self.assertLessEqual(len(planned_action.path), 3)
+
+    def test_tactical_entity_without_working_pool(self):
+        foe = planned_foe((0, 1), "TACTICAL", max_moves=3)
+        target = planned_foe((3, 1), "STATIC")
+        OccupancyGrid(self.walkability).rebuild([[foe], [target]])
+        expected_action = TurnPlanner(PlanningBoard(self.walkability, 100)).plan(
+            [foe], [target]
+        )[foe]
+
+        for failure in (OSError(), BrokenProcessPool()):
+            with self.subTest(failure=failure):
+                pool = FailingExecutor(failure)
+                planner = TurnPlanner(PlanningBoard(self.walkability, 100), pool)
+
+                planned_action = planner.plan([foe], [target])[foe]
+
+                self.assertEqual(expected_action.path, planned_action.path)
+                self.assertIs(
+                    expected_action.attack_target, planned_action.attack_target
+                )
+                self.assertIsNone(planner.evaluation_pool)
+                self.assertTrue(pool.is_shut_down)
+
+
+if __name__ == "__main__":
+    unittest.main()
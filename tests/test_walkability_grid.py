@@ -0,0 +1,75 @@
+import unittest
+
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class TestWalkabilityGrid(unittest.TestCase):
+    def setUp(self):
+        # 3x2 map starting at tile (2, 1) with an obstacle in its middle top tile
+        self.grid = WalkabilityGrid((2, 1), (3, 2), bytearray([1, 0, 1, 1, 1, 1]))
+
+    def test_bounds(self):
+        self.assertTrue(self.grid.in_bounds((2, 1)))
+        self.assertTrue(self.grid.in_bounds((4, 2)))
+        self.assertFalse(self.grid.in_bounds((1, 1)))
+        self.assertFalse(self.grid.in_bounds((5, 1)))
+        self.assertFalse(self.grid.in_bounds((2, 3)))
+        self.assertFalse(self.grid.is_walkable((-1, -1)))
+
+    def test_static_obstacle(self):
+        self.assertTrue(self.grid.is_walkable((2, 1)))
+        self.assertFalse(self.grid.is_walkable((3, 1)))
+
+    def test_dynamic_blockers(self):
+        self.grid.add_blocker((2, 2))
+        self.grid.add_blocker((2, 2))
+        self.assertFalse(self.grid.is_walkable((2, 2)))
+
+        self.grid.remove_blocker((2, 2))
+        self.assertFalse(self.grid.is_walkable((2, 2)))
+
+        self.grid.remove_blocker((2, 2))
+        self.assertTrue(self.grid.is_walkable((2, 2)))
+
+        self.grid.add_blocker((4, 2))
+        self.grid.clear_blockers()
+        self.assertTrue(self.grid.is_walkable((4, 2)))
+
+    def test_indexes(self):
+        self.assertEqual(0, self.grid.index((2, 1)))
+        self.assertEqual(4, self.grid.index((3, 2)))
+        self.assertIsNone(self.grid.index((5, 2)))
+        self.assertEqual((3, 2), self.grid.tile(4))
+        self.assertEqual((3, self.grid.index((3, 1))), self.grid.neighbours[0])
+
+    def test_changes_since(self):
+        version = self.grid.version
+        self.grid.add_blocker((2, 2))
+        self.grid.add_blocker((2, 2))
+        self.grid.add_blocker((3, 1))
+        self.grid.remove_blocker((2, 2))
+        self.grid.remove_blocker((2, 2))
+
+        # Only the changes of walkability are recorded
+        self.assertEqual(
+            [self.grid.index((2, 2))] * 2, self.grid.changes_since(version)
+        )
+        self.assertEqual([], self.grid.changes_since(self.grid.version))
+
+        self.grid.clear_blockers()
+        self.assertIsNone(self.grid.changes_since(version))
+
+    def test_copy(self):
+        self.grid.add_blocker((2, 2))
+        copy = self.grid.copy()
+        copy.remove_blocker((2, 2))
+        copy.add_blocker((3, 2))
+
+        self.assertFalse(self.grid.is_walkable((2, 2)))
+        self.assertTrue(self.grid.is_walkable((3, 2)))
+        self.assertTrue(copy.is_walkable((2, 2)))
+        self.assertFalse(copy.is_walkable((3, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()